@@ -0,0 +1,126 @@
+# py3
+#
+# Measure collecting the alarms of a calendar with many alarms.
+#
+
+import datetime
+import gc
+import io
+import sys
+import time
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+EVENTS = 1000
+ALARMS = 20
+MODIFICATIONS = 5
+REPEAT = 20
+ABSOLUTE_ALARMS = 20000
+DAYS = 30
+
+
+def synthetic_calendar(alarms=ALARMS, repeat=0):
+    """Return a calendar of events with many alarms and modifications.
+
+    alarms - the number of alarms of each event
+    repeat - how often each alarm is repeated
+    """
+    file = io.BytesIO()
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    for uid in range(EVENTS):
+        dtstart = start + datetime.timedelta(hours=uid % 24)
+        for modification in range(MODIFICATIONS + 1):
+            event = icalendar.Event()
+            event.add("UID", str(uid))
+            event.add("SUMMARY", f"Meeting {uid}")
+            if modification:
+                recurrence_id = dtstart + datetime.timedelta(weeks=modification)
+                event.add("RECURRENCE-ID", recurrence_id)
+                event.add(
+                    "DTSTART", recurrence_id + datetime.timedelta(minutes=modification)
+                )
+            else:
+                event.add("DTSTART", dtstart)
+                event.add("RRULE", {"FREQ": "WEEKLY"})
+            event.add("DURATION", datetime.timedelta(minutes=30))
+            for minutes in range(alarms):
+                alarm = icalendar.Alarm()
+                alarm.add("ACTION", "DISPLAY")
+                alarm.add("DESCRIPTION", f"{minutes} minutes")
+                alarm.add("TRIGGER", datetime.timedelta(minutes=-minutes))
+                if repeat:
+                    alarm.add("REPEAT", repeat)
+                    alarm.add("DURATION", datetime.timedelta(minutes=1))
+                event.add_component(alarm)
+            file.write(event.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+    return icalendar.Calendar.from_ical(file.getvalue())
+
+
+def absolute_alarms_calendar():
+    """Return a calendar of reminders with absolute alarms every hour."""
+    file = io.BytesIO()
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    for hour in range(ABSOLUTE_ALARMS):
+        dtstart = start + datetime.timedelta(hours=hour)
+        todo = icalendar.Todo()
+        todo.add("UID", f"reminder-{hour}")
+        todo.add("SUMMARY", "Take medication")
+        todo.add("DTSTART", dtstart)
+        alarm = icalendar.Alarm()
+        alarm.add("ACTION", "DISPLAY")
+        alarm.add("DESCRIPTION", "Take medication")
+        alarm.add("TRIGGER", dtstart)
+        todo.add_component(alarm)
+        file.write(todo.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+    return icalendar.Calendar.from_ical(file.getvalue())
+
+
+def measure_days(calendar):
+    """Print the time to query the alarms of each day."""
+    query = recurring_ical_events.of(calendar, components=["VALARM"])
+    gc.collect()
+    start = time.perf_counter()
+    count = 0
+    for day in range(DAYS):
+        date = datetime.date(2020, 6, 1) + datetime.timedelta(days=day)
+        count += len(list(query.occurrences_at(date)))
+    seconds = time.perf_counter() - start
+    print(f"{DAYS:>13} days: {seconds:.2f}s, {count} occurrences")  # noqa: T201
+
+
+def measure(calendar, components):
+    """Print the time to create the query and to query a week."""
+    gc.collect()
+    start = time.perf_counter()
+    query = recurring_ical_events.of(calendar, components=components)
+    collect = time.perf_counter() - start
+    start = time.perf_counter()
+    count = len(list(query.occurrences_between((2020, 1, 6), (2020, 1, 13))))
+    between = time.perf_counter() - start
+    print(  # noqa: T201
+        f"{','.join(components):>13}: of() {collect:.2f}s,"
+        f" a week {between:.2f}s, {count} occurrences"
+    )
+
+
+if __name__ == "__main__":
+    for alarms, repeat in [(ALARMS, 0), (1, REPEAT)]:
+        print(  # noqa: T201
+            f"{EVENTS} events with {alarms} alarms repeated {repeat} times"
+            f" and {MODIFICATIONS} modifications"
+        )
+        calendar = synthetic_calendar(alarms, repeat)
+        for components in (["VEVENT"], ["VALARM"], ["VEVENT", "VALARM"]):
+            measure(calendar, components)
+    print(f"{ABSOLUTE_ALARMS} absolute alarms")  # noqa: T201
+    measure_days(absolute_alarms_calendar())
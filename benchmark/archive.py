@@ -0,0 +1,71 @@
+# py3
+#
+# Compare querying one day of a large calendar
+# parsed completely and indexed as an archive.
+#
+
+import datetime
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+EVENTS = 20000
+YEARS = 20
+DAY = (2015, 6, 1)
+FIRST_START = datetime.datetime(2005, 1, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+def write_calendar(file):
+    """Write a calendar with events spread over the years."""
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    for uid in range(EVENTS):
+        event = icalendar.Event()
+        event.add("UID", str(uid))
+        event.add("SUMMARY", f"Meeting {uid}")
+        event.add("DESCRIPTION", "Agenda " * 50)
+        event.add(
+            "DTSTART",
+            FIRST_START + datetime.timedelta(days=uid * YEARS * 365 // EVENTS),
+        )
+        event.add("DURATION", icalendar.vDuration.from_ical("PT1H"))
+        if uid % 10 == 0:
+            event.add("RRULE", {"FREQ": "WEEKLY", "COUNT": 10})
+        file.write(event.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+
+
+def measure(name, create_query):
+    """Print the time to create a query and to query a day."""
+    start = time.perf_counter()
+    query = create_query()
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    components = query.at(DAY)
+    seconds = time.perf_counter() - start
+    print(  # noqa: T201
+        f"{name:>16}: created in {created:.2f}s, "
+        f"{len(components)} components at {DAY} in {seconds:.2f}s"
+    )
+
+
+with tempfile.TemporaryDirectory() as directory:
+    path = Path(directory) / "archive.ics"
+    with path.open("wb") as file:
+        write_calendar(file)
+    print(f"{path.stat().st_size / 1024 / 1024:.0f} MiB calendar")  # noqa: T201
+    measure(
+        "parsed",
+        lambda: recurring_ical_events.of(
+            icalendar.Calendar.from_ical(path.read_bytes())
+        ),
+    )
+    measure("archive, indexed", lambda: recurring_ical_events.of_archive(path))
+    measure("archive, loaded", lambda: recurring_ical_events.of_archive(path))
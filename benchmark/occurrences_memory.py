@@ -0,0 +1,75 @@
+# py3
+#
+# Compare the memory and time needed for a million occurrences
+# as a list of Occurrence objects and as an OccurrenceBatch.
+#
+
+import sys
+import time
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+OCCURRENCES = 1_000_000
+SERIES = 100
+
+calendar = icalendar.Calendar()
+for uid in range(SERIES):
+    event = icalendar.Event()
+    event.add("UID", str(uid))
+    event.add("DTSTART", icalendar.vDatetime.from_ical(f"20200101T{uid % 24:02}0000Z"))
+    event.add("DURATION", icalendar.vDuration.from_ical("PT30M"))
+    event.add("RRULE", {"FREQ": "HOURLY", "COUNT": OCCURRENCES // SERIES})
+    calendar.add_component(event)
+query = recurring_ical_events.of(calendar)
+
+
+def size_of_list(occurrences):
+    """The bytes used by the list of occurrences and their times."""
+    return sys.getsizeof(occurrences) + sum(
+        sys.getsizeof(occurrence)
+        + sys.getsizeof(occurrence.start)
+        + sys.getsizeof(occurrence.end)
+        for occurrence in occurrences
+    )
+
+
+def size_of_batch(batch):
+    """The bytes used by the arrays of the batch."""
+    return sum(
+        map(
+            sys.getsizeof,
+            (
+                batch.start_epochs,
+                batch.end_epochs,
+                batch.sequences,
+                batch.adapter_indexes,
+                batch.adapters,
+                batch.time_types,
+            ),
+        )
+    )
+
+
+def measure(name, query_method, size_of):
+    """Print the time and memory that the result of the query needs."""
+    start = time.perf_counter()
+    result = query_method((2019, 1, 1), (2030, 1, 1))
+    seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in result:
+        pass
+    iteration = time.perf_counter() - start
+    print(  # noqa: T201
+        f"{name:>6}: {len(result)} occurrences in {seconds:.1f}s, "
+        f"iterated in {iteration:.1f}s, {size_of(result) / 1024 / 1024:.0f} MiB"
+    )
+
+
+measure("list", query.occurrences_between, size_of_list)
+measure("batch", query.batch_between, size_of_batch)
@@ -0,0 +1,58 @@
+# py3
+#
+# Compare parsing calendars with icalendar and in several processes.
+#
+
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+import icalendar
+
+from recurring_ical_events.parallel import parse_calendar
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+EVENTS = 20000
+
+
+def synthetic_calendar():
+    """Return a large calendar."""
+    file = io.BytesIO()
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    for uid in range(EVENTS):
+        event = icalendar.Event()
+        event.add("UID", str(uid))
+        event.add("SUMMARY", f"Meeting {uid}")
+        event.add("DESCRIPTION", "Agenda " * 50)
+        event.add(
+            "DTSTART", icalendar.vDatetime.from_ical(f"20200101T{uid % 24:02}0000Z")
+        )
+        event.add("DURATION", icalendar.vDuration.from_ical("PT30M"))
+        event.add("RRULE", {"FREQ": "WEEKLY"})
+        file.write(event.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+    return file.getvalue()
+
+
+def measure(name, data):
+    """Print the time to parse the data serially and in processes."""
+    print(f"{name}: {len(data) / 1024 / 1024:.1f} MiB")  # noqa: T201
+    start = time.perf_counter()
+    expected = icalendar.Calendar.from_ical(data).to_ical()
+    print(f"{'from_ical':>14}: {time.perf_counter() - start:.2f}s")  # noqa: T201
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        calendar = parse_calendar(data, processes)
+        seconds = time.perf_counter() - start
+        assert calendar.to_ical() == expected
+        print(f"{processes:>4} processes: {seconds:.2f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    print(f"{os.cpu_count()} CPUs")  # noqa: T201
+    measure("issue42.ics", (HERE / "issue42.ics").read_bytes())
+    measure("synthetic", synthetic_calendar())
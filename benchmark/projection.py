@@ -0,0 +1,63 @@
+# py3
+#
+# Compare querying events with large attachments with and without
+# a projection of their properties.
+#
+
+import base64
+import sys
+import time
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+SERIES = 50
+ATTACHMENT_SIZE = 64 * 1024
+ATTENDEES = 50
+PROPERTIES = ["UID", "SUMMARY", "DTSTART", "DTEND"]
+
+calendar = icalendar.Calendar()
+for uid in range(SERIES):
+    event = icalendar.Event()
+    event.add("UID", str(uid))
+    event.add("SUMMARY", f"Meeting {uid}")
+    event.add("DESCRIPTION", "Agenda " * 2000)
+    event.add("DTSTART", icalendar.vDatetime.from_ical(f"20200101T{uid % 24:02}0000Z"))
+    event.add("DURATION", icalendar.vDuration.from_ical("PT30M"))
+    event.add("RRULE", {"FREQ": "DAILY"})
+    event.add(
+        "ATTACH",
+        base64.b64encode(bytes(ATTACHMENT_SIZE)).decode(),
+        parameters={"ENCODING": "BASE64", "VALUE": "BINARY"},
+    )
+    for attendee in range(ATTENDEES):
+        event.add("ATTENDEE", f"mailto:attendee{attendee}@example.com")
+    calendar.add_component(event)
+
+
+def measure(name, query):
+    """Print the time to query and serialize a month of occurrences."""
+    start = time.perf_counter()
+    components = query.between((2020, 1, 1), (2020, 2, 1))
+    seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    size = sum(len(component.to_ical()) for component in components)
+    serialization = time.perf_counter() - start
+    print(  # noqa: T201
+        f"{name:>10}: {len(components)} components in {seconds:.1f}s, "
+        f"serialized in {serialization:.1f}s, {size / 1024 / 1024:.0f} MiB"
+    )
+
+
+measure("all", recurring_ical_events.of(calendar))
+measure(
+    "projected",
+    recurring_ical_events.of(
+        calendar, properties=PROPERTIES, include_subcomponents=False
+    ),
+)
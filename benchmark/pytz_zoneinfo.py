@@ -0,0 +1,39 @@
+# py3
+#
+# Compare the speed of calendars with pytz timezones
+# calculated with pytz (Series) and with zoneinfo (ZoneInfoSeries).
+#
+
+import sys
+import timeit
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+ical_string = (HERE / "issue42.ics").read_bytes()
+
+icalendar.use_pytz()
+calendar = icalendar.Calendar.from_ical(ical_string)
+
+
+def query_november(query):
+    """Query every day in November 2011."""
+    for day in range(1, 29):
+        query.at((2011, 11, day))
+
+
+for name, series in [
+    ("pytz", recurring_ical_events.Series),
+    ("zoneinfo", recurring_ical_events.ZoneInfoSeries),
+]:
+    query = recurring_ical_events.of(
+        calendar,
+        components=[recurring_ical_events.ComponentsWithName("VEVENT", series=series)],
+    )
+    seconds = min(timeit.repeat(lambda: query_november(query), number=1, repeat=3))  # noqa: B023
+    print(f"{name:>10}: {seconds:.3f}s")  # noqa: T201
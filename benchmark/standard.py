@@ -0,0 +1,85 @@
+# py3
+#
+# Compare converting X-WR-TIMEZONE for the whole calendar and per component.
+#
+
+import gc
+import io
+import sys
+import time
+from pathlib import Path
+
+import icalendar
+import x_wr_timezone
+
+import recurring_ical_events
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+EVENTS = 20000
+
+
+def synthetic_calendar(has_x_wr_timezone, tzid):
+    """Return a large calendar.
+
+    has_x_wr_timezone - whether the calendar has an X-WR-TIMEZONE
+    tzid - whether the events use a TZID instead of UTC
+    """
+    file = io.BytesIO()
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    if has_x_wr_timezone:
+        file.write(b"X-WR-TIMEZONE:Europe/Berlin\r\n")
+    for uid in range(EVENTS):
+        event = icalendar.Event()
+        event.add("UID", str(uid))
+        event.add("SUMMARY", f"Meeting {uid}")
+        event.add("DESCRIPTION", "Agenda " * 20)
+        if tzid:
+            start = icalendar.vDatetime.from_ical(
+                f"20200101T{uid % 24:02}0000", "Europe/Berlin"
+            )
+        else:
+            start = icalendar.vDatetime.from_ical(f"20200101T{uid % 24:02}0000Z")
+        event.add("DTSTART", start)
+        event.add("DURATION", icalendar.vDuration.from_ical("PT30M"))
+        event.add("RRULE", {"FREQ": "WEEKLY"})
+        file.write(event.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+    return icalendar.Calendar.from_ical(file.getvalue())
+
+
+def measure(name, calendar, components):
+    """Print the time to query a day of the calendar."""
+    gc.collect()
+    start = time.perf_counter()
+    query = recurring_ical_events.CalendarQuery(
+        x_wr_timezone.to_standard(calendar), components=components
+    )
+    expected = query.at((2020, 1, 1))
+    whole = time.perf_counter() - start
+    del query
+    gc.collect()
+    start = time.perf_counter()
+    query = recurring_ical_events.of(calendar, components=components)
+    result = query.at((2020, 1, 1))
+    lazy = time.perf_counter() - start
+    assert [event.to_ical() for event in result] == [
+        event.to_ical() for event in expected
+    ]
+    print(  # noqa: T201
+        f"{name:>22} {','.join(components):>7}:"
+        f" whole calendar {whole:.2f}s, per component {lazy:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    print(f"{EVENTS} events")  # noqa: T201
+    for name, x_wr, tzid in [
+        ("no X-WR-TIMEZONE", False, False),
+        ("X-WR-TIMEZONE and UTC", True, False),
+        ("X-WR-TIMEZONE and TZID", True, True),
+    ]:
+        calendar = synthetic_calendar(x_wr, tzid)
+        for components in (["VEVENT"], ["VTODO"]):
+            measure(name, calendar, components)
@@ -0,0 +1,71 @@
+# py3
+#
+# Compare the peak memory of parsing a calendar with icalendar
+# and reading it incrementally like of_file().
+#
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import icalendar
+
+import recurring_ical_events
+from recurring_ical_events.stream import calendar_from_stream, read_chunks
+
+HERE = Path(__file__).parent or Path()
+sys.path.append(HERE.parent)
+
+EVENTS = 10000
+DESCRIPTION = "Agenda " * 200
+
+
+def write_calendar(file):
+    """Write a large calendar."""
+    file.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:benchmark\r\n")
+    for uid in range(EVENTS):
+        event = icalendar.Event()
+        event.add("UID", str(uid))
+        event.add("SUMMARY", f"Meeting {uid}")
+        event.add("DESCRIPTION", DESCRIPTION)
+        event.add(
+            "DTSTART", icalendar.vDatetime.from_ical(f"20200101T{uid % 24:02}0000Z")
+        )
+        event.add("DURATION", icalendar.vDuration.from_ical("PT30M"))
+        event.add("RRULE", {"FREQ": "WEEKLY"})
+        file.write(event.to_ical())
+    file.write(b"END:VCALENDAR\r\n")
+
+
+def measure(name, parse):
+    """Print the peak memory to parse the calendar and to create the query."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    calendar = parse()
+    _, parse_peak = tracemalloc.get_traced_memory()
+    query = recurring_ical_events.of(calendar)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(  # noqa: T201
+        f"{name:>10}: {len(query.series)} series in {seconds:.1f}s, "
+        f"peak {parse_peak / 1024 / 1024:.0f} MiB while parsing, "
+        f"{peak / 1024 / 1024:.0f} MiB with the query"
+    )
+
+
+with tempfile.NamedTemporaryFile(suffix=".ics") as file:
+    write_calendar(file)
+    file.flush()
+    path = Path(file.name)
+    print(f"{path.stat().st_size / 1024 / 1024:.0f} MiB calendar")  # noqa: T201
+    measure("from_ical", lambda: icalendar.Calendar.from_ical(path.read_bytes()))
+
+    def stream():
+        """Read the calendar in chunks."""
+        with path.open("rb") as chunks:
+            return calendar_from_stream(read_chunks(chunks))
+
+    measure("stream", stream)
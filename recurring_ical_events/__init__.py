@@ -14,9 +14,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-import x_wr_timezone
+import os
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterable, Optional, Sequence
 
 from recurring_ical_events.adapters import (
     AbsoluteAlarmAdapter,
@@ -25,6 +25,8 @@ from recurring_ical_events.adapters import (
     JournalAdapter,
     TodoAdapter,
 )
+from recurring_ical_events.archive import of_archive
+from recurring_ical_events.cache import QueryCache, cache_info, cached_of
 from recurring_ical_events.constants import DATE_MAX, DATE_MAX_DT, DATE_MIN, DATE_MIN_DT
 from recurring_ical_events.errors import (
     BadRuleStringFormat,
@@ -32,6 +34,7 @@ from recurring_ical_events.errors import (
     PeriodEndBeforeStart,
 )
 from recurring_ical_events.examples import example_calendar
+from recurring_ical_events.parallel import of_parallel
 from recurring_ical_events.query import T_COMPONENTS, CalendarQuery
 from recurring_ical_events.selection import (
     Alarms,
@@ -39,14 +42,17 @@ from recurring_ical_events.selection import (
     ComponentsWithName,
     SelectComponents,
 )
+from recurring_ical_events.standard import to_standard
+from recurring_ical_events.stream import calendar_from_stream, read_chunks
 
-from .occurrence import AlarmOccurrence, Occurrence, OccurrenceID
+from .occurrence import AlarmOccurrence, Occurrence, OccurrenceBatch, OccurrenceID
 from .pages import OccurrencePage, OccurrencePages, Page, Pages
 from .series import (
     AbsoluteAlarmSeries,
     AlarmSeriesRelativeToEnd,
     AlarmSeriesRelativeToStart,
     Series,
+    ZoneInfoSeries,
 )
 
 if TYPE_CHECKING:
@@ -59,6 +65,9 @@ def of(
     components: T_COMPONENTS = ("VEVENT",),
     skip_bad_series: bool = False,  # noqa: FBT001
     calendar_query: type[CalendarQuery] = CalendarQuery,
+    component_views: bool = False,  # noqa: FBT001
+    properties: Optional[Sequence[str]] = None,
+    include_subcomponents: bool = True,  # noqa: FBT001
 ) -> CalendarQuery:
     """Create a query for recurring components in a_calendar.
 
@@ -77,13 +86,62 @@ def of(
             errors. You can use :attr:`CalendarQuery.suppressed_errors` to
             specify which errors to skip.
         calendar_query: The :class:`CalendarQuery` class to use.
+        component_views: Whether to return views of the components instead
+            of copies. Views are copied only when they are modified.
+        properties: The names of the properties of the returned components.
+            If properties is None, the components have all properties.
+        include_subcomponents: Whether the returned components
+            contain subcomponents like alarms.
     """
-    a_calendar = x_wr_timezone.to_standard(a_calendar)
+    a_calendar = to_standard(a_calendar)
+    # Subclasses of CalendarQuery may only accept the first four arguments.
+    kw = {}
+    if component_views:
+        kw["component_views"] = component_views
+    if properties is not None:
+        kw["properties"] = properties
+    if not include_subcomponents:
+        kw["include_subcomponents"] = include_subcomponents
     return calendar_query(
-        a_calendar, keep_recurrence_attributes, components, skip_bad_series
+        a_calendar,
+        keep_recurrence_attributes,
+        components,
+        skip_bad_series,
+        **kw,
     )
 
 
+def of_stream(chunks: Iterable[str | bytes], **kw) -> CalendarQuery:
+    """Create a query for the calendar in chunks of ICS text or bytes.
+
+    The chunks are read one after the other.
+    Each top-level component is parsed on its own
+    so that the text of the whole calendar is not held in memory.
+    See :mod:`recurring_ical_events.stream`.
+
+    Arguments:
+        chunks: An iterable of :class:`str` or :class:`bytes`,
+            e.g. the chunks of an HTTP response.
+        kw: The other arguments of :func:`of`.
+    """
+    return of(calendar_from_stream(chunks), **kw)
+
+
+def of_file(path_or_fp: str | os.PathLike | IO, **kw) -> CalendarQuery:
+    """Create a query for the calendar in a file.
+
+    The file is read in chunks, see :func:`of_stream`.
+
+    Arguments:
+        path_or_fp: The path to an ICS file or a file opened for reading.
+        kw: The other arguments of :func:`of`.
+    """
+    if isinstance(path_or_fp, (str, os.PathLike)):
+        with Path(path_or_fp).open("rb") as file:
+            return of_stream(read_chunks(file), **kw)
+    return of_stream(read_chunks(path_or_fp), **kw)
+
+
 __all__ = [
     "DATE_MAX",
     "DATE_MAX_DT",
@@ -104,15 +162,24 @@ __all__ = [
     "InvalidCalendar",
     "JournalAdapter",
     "Occurrence",
+    "OccurrenceBatch",
     "OccurrenceID",
     "OccurrencePage",
     "OccurrencePages",
     "Page",
     "Pages",
     "PeriodEndBeforeStart",
+    "QueryCache",
     "SelectComponents",
     "Series",
     "TodoAdapter",
+    "ZoneInfoSeries",
+    "cache_info",
+    "cached_of",
     "example_calendar",
     "of",
+    "of_archive",
+    "of_file",
+    "of_parallel",
+    "of_stream",
 ]
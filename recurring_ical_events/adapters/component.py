@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import datetime
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Sequence
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Sequence
 
 from icalendar.prop import vDDDTypes
 
@@ -12,15 +13,31 @@ from recurring_ical_events.util import (
     cached_property,
     make_comparable,
     time_span_contains_event,
+    to_json_value,
+    to_recurrence_epochs,
     to_recurrence_ids,
 )
+from recurring_ical_events.view import create_view
 
 if TYPE_CHECKING:
     from icalendar import Alarm
     from icalendar.cal import Component
 
     from recurring_ical_events.series import Series
-    from recurring_ical_events.types import UID, RecurrenceIDs, Time
+    from recurring_ical_events.types import (
+        UID,
+        RecurrenceEpochs,
+        RecurrenceIDs,
+        Time,
+    )
+
+
+def trigger_key(alarm: Alarm) -> Hashable:
+    """Return the value of the TRIGGER to find equal alarms."""
+    trigger = alarm.get("TRIGGER")
+    if isinstance(trigger, list):
+        return tuple(getattr(value, "dt", value) for value in trigger)
+    return getattr(trigger, "dt", trigger)
 
 
 class ComponentAdapter(ABC):
@@ -37,11 +54,23 @@ class ComponentAdapter(ABC):
         """Create a new adapter."""
         self._component = component
 
-    @property
+    @cached_property
     def alarms(self) -> list[Alarm]:
         """The alarms in this component."""
         return self._component.walk("VALARM")
 
+    @cached_property
+    def _alarms_by_trigger(self) -> dict[Hashable, list[Alarm]]:
+        """The alarms grouped by the value of their TRIGGER."""
+        result = defaultdict(list)
+        for alarm in self.alarms:
+            result[trigger_key(alarm)].append(alarm)
+        return result
+
+    def has_alarm(self, alarm: Alarm) -> bool:
+        """Whether this component has the alarm or an equal alarm."""
+        return alarm in self._alarms_by_trigger.get(trigger_key(alarm), ())
+
     @property
     def end_property(self) -> str | None:
         """The name of the end property."""
@@ -124,6 +153,224 @@ class ComponentAdapter(ABC):
             )
         return copied_component
 
+    def as_component_view(
+        self,
+        start: Optional[Time] = None,
+        stop: Optional[Time] = None,
+        keep_recurrence_attributes: bool = True,  # noqa: FBT001
+        sequence: int = -1,
+    ):
+        """Create a view of the source component with some modified attributes.
+
+        This is equal to as_component() but does not copy the attributes.
+        See :mod:`recurring_ical_events.view`.
+        """
+        overlay = {"DTSTART": vDDDTypes(self.start if start is None else start)}
+        if self.end_property is not None:
+            overlay[self.end_property] = vDDDTypes(self.end if stop is None else stop)
+        if "RECURRENCE-ID" not in self._component:
+            overlay["RECURRENCE-ID"] = vDDDTypes(overlay["DTSTART"].dt)
+        if sequence >= 0:
+            overlay["SEQUENCE"] = sequence
+        hidden = (
+            self._hidden_in_view
+            if keep_recurrence_attributes
+            else self._hidden_in_view_without_recurrence
+        )
+        return create_view(self._component, overlay, hidden)
+
+    def as_projected_component(
+        self,
+        start: Optional[Time] = None,
+        stop: Optional[Time] = None,
+        keep_recurrence_attributes: bool = True,  # noqa: FBT001
+        sequence: int = -1,
+        properties: Sequence[str] = (),
+        include_subcomponents: bool = True,  # noqa: FBT001
+    ):
+        """Create a component like as_component() with only some properties.
+
+        properties are the names of the properties to include.
+        The other properties are not copied.
+        """
+        start = self.start if start is None else start
+        stop = self.end if stop is None else stop
+        hidden = (
+            self._hidden_in_view
+            if keep_recurrence_attributes
+            else self._hidden_in_view_without_recurrence
+        )
+        component = type(self._component)()
+        for name in properties:
+            name = name.upper()  # noqa: PLW2901
+            if name == "DTSTART":
+                component[name] = vDDDTypes(start)
+            elif name == self.end_property:
+                component[name] = vDDDTypes(stop)
+            elif name == "SEQUENCE" and sequence >= 0:
+                component[name] = sequence
+            elif name in self._component and name not in hidden:
+                component[name] = self._component[name]
+            elif name == "RECURRENCE-ID":
+                component[name] = vDDDTypes(start)
+        if include_subcomponents:
+            component.subcomponents = list(self._component.subcomponents)
+        return component
+
+    @cached_property
+    def _hidden_in_view(self) -> frozenset[str]:
+        """The attributes of the component that a view removes."""
+        return frozenset(["DURATION"])
+
+    @cached_property
+    def _hidden_in_view_without_recurrence(self) -> frozenset[str]:
+        """The attributes that a view removes if it has no recurrence attributes."""
+        return self._hidden_in_view | frozenset(self.ATTRIBUTES_TO_DELETE_ON_COPY)
+
+    def as_ical(
+        self,
+        start: Optional[Time] = None,
+        stop: Optional[Time] = None,
+        keep_recurrence_attributes: bool = True,  # noqa: FBT001
+        sequence: int = -1,
+    ) -> bytes:
+        """Return the ICS of as_component() with the sequence.
+
+        The properties that are the same for all occurrences
+        are encoded once. Only the times and the sequence are
+        encoded for each call.
+        """
+        template = self._ical_template(keep_recurrence_attributes, sequence >= 0)
+        values = {"DTSTART": vDDDTypes(self.start if start is None else start)}
+        if self.end_property is not None:
+            values[self.end_property] = vDDDTypes(self.end if stop is None else stop)
+        values["RECURRENCE-ID"] = vDDDTypes(values["DTSTART"].dt)
+        values["SEQUENCE"] = sequence
+        content_line = self._component.content_line
+        return b"".join(
+            chunk
+            if isinstance(chunk, bytes)
+            else content_line(chunk, values[chunk]).to_ical() + b"\r\n"
+            for chunk in template
+        )
+
+    @cached_property
+    def _ical_templates(self) -> dict[tuple[bool, bool], tuple[bytes | str, ...]]:
+        """The templates of as_ical() by their arguments."""
+        return {}
+
+    def _ical_template(
+        self,
+        keep_recurrence_attributes: bool,  # noqa: FBT001
+        has_sequence: bool,  # noqa: FBT001
+    ) -> tuple[bytes | str, ...]:
+        """The ICS of the component in chunks.
+
+        The chunks are the encoded lines of the invariant properties
+        and the names of the properties that change with each occurrence.
+        """
+        key = (keep_recurrence_attributes, has_sequence)
+        template = self._ical_templates.get(key)
+        if template is not None:
+            return template
+        component = self.as_component_view(
+            keep_recurrence_attributes=keep_recurrence_attributes,
+            sequence=0 if has_sequence else -1,
+        )
+        variable = self._variable_properties(has_sequence)
+        chunks = []
+        depth = 0
+        for name, value in component.property_items():
+            if name == "BEGIN":
+                depth += 1
+            elif name == "END":
+                depth -= 1
+            elif depth == 1 and name in variable:
+                chunks.append(name)
+                continue
+            line = component.content_line(name, value).to_ical() + b"\r\n"
+            if chunks and isinstance(chunks[-1], bytes):
+                chunks[-1] += line
+            else:
+                chunks.append(line)
+        template = self._ical_templates[key] = tuple(chunks)
+        return template
+
+    def _variable_properties(self, has_sequence: bool) -> set[str]:  # noqa: FBT001
+        """The names of the properties that change with each occurrence."""
+        variable = {"DTSTART", self.end_property}
+        if "RECURRENCE-ID" not in self._component:
+            variable.add("RECURRENCE-ID")
+        if has_sequence:
+            variable.add("SEQUENCE")
+        return variable
+
+    def as_dict(
+        self,
+        start: Optional[Time] = None,
+        stop: Optional[Time] = None,
+        keep_recurrence_attributes: bool = True,  # noqa: FBT001
+        sequence: int = -1,
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[str, Any]:
+        """Return the properties of as_component() as values that json can encode.
+
+        fields are the names of the properties to return.
+        Absent properties are None.
+        If fields is None, all properties are returned.
+        See :func:`recurring_ical_events.util.to_json_value`.
+
+        The values that are the same for all occurrences are converted once.
+        """
+        template = self._dict_template(
+            keep_recurrence_attributes,
+            sequence >= 0,
+            None if fields is None else tuple(fields),
+        )
+        start = self.start if start is None else start
+        values = {"DTSTART": start, "RECURRENCE-ID": start, "SEQUENCE": sequence}
+        if self.end_property is not None:
+            values[self.end_property] = self.end if stop is None else stop
+        return {
+            field: value if name is None else to_json_value(values[name])
+            for field, name, value in template
+        }
+
+    @cached_property
+    def _dict_templates(self) -> dict[tuple, tuple[tuple[str, str | None, Any], ...]]:
+        """The templates of as_dict() by their arguments."""
+        return {}
+
+    def _dict_template(
+        self,
+        keep_recurrence_attributes: bool,  # noqa: FBT001
+        has_sequence: bool,  # noqa: FBT001
+        fields: Optional[tuple[str]],
+    ) -> tuple[tuple[str, str | None, Any], ...]:
+        """The fields of the dict.
+
+        Each field has the name of the property that changes
+        with each occurrence or the converted value that does not change.
+        """
+        key = (keep_recurrence_attributes, has_sequence, fields)
+        template = self._dict_templates.get(key)
+        if template is not None:
+            return template
+        component = self.as_component_view(
+            keep_recurrence_attributes=keep_recurrence_attributes,
+            sequence=0 if has_sequence else -1,
+        )
+        variable = self._variable_properties(has_sequence)
+        template = []
+        for field in component.keys() if fields is None else fields:
+            name = field.upper()
+            if name in variable and name in component:
+                template.append((field, name, None))
+            else:
+                template.append((field, None, to_json_value(component.get(name))))
+        template = self._dict_templates[key] = tuple(template)
+        return template
+
     @cached_property
     def recurrence_ids(self) -> RecurrenceIDs:
         """The recurrence ids of the component that might be used to identify it."""
@@ -132,6 +379,14 @@ class ComponentAdapter(ABC):
             return ()
         return to_recurrence_ids(recurrence_id.dt)
 
+    @cached_property
+    def recurrence_epochs(self) -> RecurrenceEpochs:
+        """The recurrence ids as integers, see to_recurrence_epochs()."""
+        recurrence_id = self._component.get("RECURRENCE-ID")
+        if recurrence_id is None:
+            return ()
+        return to_recurrence_epochs(recurrence_id.dt)
+
     @cached_property
     def this_and_future(self) -> bool:
         """The recurrence ids has a thisand future range property"""
@@ -0,0 +1,532 @@
+"""Query large ICS files without parsing all of them.
+
+An :class:`Archive` maps the file into memory with :mod:`mmap`.
+It is scanned once to create an :class:`ArchiveIndex` that maps each UID
+to the byte ranges of its components and to the time bounds in which
+they can occur.
+The index is saved next to the file and used again while the file
+does not change.
+
+An :class:`ArchiveQuery` parses the components of a UID
+only when a query hits its time bounds.
+
+Example:
+
+.. code-block:: python
+
+    query = recurring_ical_events.of_archive("archive.ics")
+    query.at(2024)
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import datetime
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator, NamedTuple, Optional, Sequence
+
+import icalendar
+from dateutil.rrule import rrulestr
+from icalendar.prop import vDDDTypes, vDuration
+
+from recurring_ical_events.query import T_COMPONENTS, CalendarQuery
+from recurring_ical_events.standard import to_standard
+from recurring_ical_events.util import cached_property, to_epoch
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+    from typing_extensions import Self
+
+    from recurring_ical_events.series import Series
+    from recurring_ical_events.types import Time
+
+# BEGIN and END of components
+BOUNDARY = re.compile(
+    rb"^(BEGIN|END):([A-Za-z0-9-]+)[ \t]*\r?$", re.MULTILINE | re.IGNORECASE
+)
+# the folding of content lines
+FOLDING = re.compile(rb"\r?\n[ \t]")
+# the subcomponents of a component, like VALARM
+SUBCOMPONENT = re.compile(
+    rb"^BEGIN:([A-Za-z0-9-]+)\r?\n.*?^END:\1[ \t]*\r?$",
+    re.MULTILINE | re.IGNORECASE | re.DOTALL,
+)
+# the properties that the time bounds are computed from
+PROPERTY = re.compile(
+    rb"^(UID|DTSTART|DTEND|DUE|DURATION|RECURRENCE-ID|RRULE|RDATE|EXRULE)"
+    rb'((?:;(?:"[^"]*"|[^:;"\r\n])*)*):([^\r\n]*)',
+    re.MULTILINE | re.IGNORECASE,
+)
+UNTIL = re.compile(r"UNTIL=([0-9TZ]+)", re.IGNORECASE)
+COUNT = re.compile(r"COUNT=", re.IGNORECASE)
+
+UNBOUNDED = (float("-inf"), float("inf"))
+
+
+def top_level_components(
+    data: bytes | mmap.mmap,
+) -> Generator[tuple[bytes, int, int], None, None]:
+    """Yield the name, start and stop of the top-level components in the data.
+
+    The properties of the calendar are yielded first as ``b"VCALENDAR"``.
+    They are expected before the components.
+    The names are upper case.
+    """
+    depth = 0
+    header_start = None
+    component_start = 0
+    for match in BOUNDARY.finditer(data):
+        begin = match.group(1).upper() == b"BEGIN"
+        name = match.group(2).upper()
+        end_of_line = match.end() + (data[match.end() : match.end() + 1] == b"\n")
+        if name == b"VCALENDAR" and depth == 0:
+            if begin:
+                header_start = end_of_line
+            elif header_start is not None:
+                yield name, header_start, match.start()
+                header_start = None
+            continue
+        if begin:
+            if depth == 0:
+                component_start = match.start()
+                if header_start is not None:
+                    yield b"VCALENDAR", header_start, match.start()
+                    header_start = None
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                yield name, component_start, end_of_line
+
+
+class IndexEntry(NamedTuple):
+    """The components of a UID in the archive.
+
+    Attributes:
+        uid: The UID of the components.
+        ranges: The ``(start, stop)`` byte ranges of the components.
+        lower: The earliest time of the components in seconds.
+        upper: The latest time of the components in seconds.
+        has_alarms: Whether the components contain alarms.
+            Alarms can be outside of the bounds.
+    """
+
+    uid: str
+    ranges: list[tuple[int, int]]
+    lower: float
+    upper: float
+    has_alarms: bool
+
+
+def _time_bounds(properties: list[tuple[str, str, str]]) -> tuple[float, float]:
+    """Return the bounds in which a component can have occurrences.
+
+    Times are counted like :func:`recurring_ical_events.util.to_epoch`.
+    Timezones are ignored, so the bounds must be padded.
+    If the bounds cannot be computed cheaply, they are unbounded.
+    """
+    times = {}
+    rules = []
+    duration = 0
+    for name, parameters, value in properties:
+        if name in ("RDATE", "EXRULE") or "RANGE=" in parameters.upper():
+            return UNBOUNDED
+        try:
+            if name == "RRULE":
+                rules.append(value)
+            elif name == "DURATION":
+                duration = vDuration.from_ical(value).total_seconds()
+            elif name != "UID":
+                times[name] = vDDDTypes.from_ical(value)
+        except ValueError:
+            return UNBOUNDED
+    if not times:
+        return UNBOUNDED
+    epochs = [to_epoch(time) for time in times.values()]
+    start = times.get("DTSTART")
+    end = times.get("DTEND", times.get("DUE"))
+    if start is not None and end is not None:
+        duration = to_epoch(end) - to_epoch(start)
+    duration = max(duration, 0)
+    lower = min(epochs)
+    upper = max(epochs)
+    if start is not None:
+        upper = max(upper, to_epoch(start) + duration)
+    for rule in rules:
+        if start is None:
+            return UNBOUNDED
+        upper = max(upper, _last_recurrence(rule, start) + duration)
+    return lower, upper
+
+
+def _last_recurrence(rule: str, start: Time) -> float:
+    """Return the epoch of the last recurrence of a rule."""
+    until = UNTIL.search(rule)
+    try:
+        if until:
+            return to_epoch(vDDDTypes.from_ical(until.group(1)))
+        if not COUNT.search(rule):
+            return UNBOUNDED[1]
+        if not isinstance(start, datetime.datetime):
+            start = datetime.datetime(start.year, start.month, start.day)  # noqa: DTZ001
+        last = start
+        for last in rrulestr(rule, dtstart=start):  # noqa: B007
+            pass
+        return to_epoch(last)
+    except (ValueError, TypeError, OverflowError):
+        return UNBOUNDED[1]
+
+
+def _scan_component(data: bytes) -> tuple[str, list[tuple[str, str, str]], bool]:
+    """Return the UID, the properties for the bounds and if there are alarms."""
+    data = FOLDING.sub(b"", data)
+    body = data[data.find(b"\n") + 1 :]
+    has_alarms = b"BEGIN:VALARM" in body.upper()
+    body = SUBCOMPONENT.sub(b"", body)
+    properties = []
+    uid = ""
+    for match in PROPERTY.finditer(body):
+        name, parameters, value = (
+            group.decode("utf-8", "replace") for group in match.groups()
+        )
+        name = name.upper()
+        if name == "UID":
+            uid = value
+        properties.append((name, parameters, value.strip()))
+    return uid, properties, has_alarms
+
+
+class ArchiveIndex:
+    """The byte ranges and time bounds of the components of an archive.
+
+    Attributes:
+        version: The version of the index format.
+            Indexes with another version are created again.
+    """
+
+    version = 1
+
+    def __init__(
+        self,
+        size: int,
+        mtime_ns: int,
+        header: tuple[int, int],
+        timezones: list[tuple[int, int]],
+        entries: list[IndexEntry],
+    ):
+        """Create an index for a file with that size and modification time."""
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.header = header
+        self.timezones = timezones
+        self.entries = entries
+
+    @classmethod
+    def scan(cls, data: bytes | mmap.mmap, size: int, mtime_ns: int) -> ArchiveIndex:
+        """Scan the data of a file once and create its index.
+
+        The properties of the calendar are expected before its components.
+        """
+        header = (0, 0)
+        timezones = []
+        entries: dict[str, IndexEntry] = {}
+        for name, start, stop in top_level_components(data):
+            ranges = (start, stop)
+            if name == b"VCALENDAR":
+                header = ranges
+                continue
+            if name == b"VTIMEZONE":
+                timezones.append(ranges)
+                continue
+            uid, properties, has_alarms = _scan_component(data[slice(*ranges)])
+            lower, upper = _time_bounds(properties)
+            entry = entries.get(uid)
+            if entry is None:
+                entries[uid] = IndexEntry(uid, [ranges], lower, upper, has_alarms)
+            else:
+                entry.ranges.append(ranges)
+                entries[uid] = entry._replace(
+                    lower=min(lower, entry.lower),
+                    upper=max(upper, entry.upper),
+                    has_alarms=has_alarms or entry.has_alarms,
+                )
+        return cls(size, mtime_ns, header, timezones, list(entries.values()))
+
+    def is_index_of(self, stat: os.stat_result) -> bool:
+        """Whether this is the index of the file with that stat."""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    def to_json(self) -> dict:
+        """Return the index as JSON data."""
+        return {
+            "version": self.version,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "header": self.header,
+            "timezones": self.timezones,
+            "entries": [
+                [
+                    entry.uid,
+                    entry.ranges,
+                    None if entry.lower == UNBOUNDED[0] else entry.lower,
+                    None if entry.upper == UNBOUNDED[1] else entry.upper,
+                    entry.has_alarms,
+                ]
+                for entry in self.entries
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> Optional[ArchiveIndex]:
+        """Return the index of the JSON data or None if it is of another version."""
+        if data.get("version") != cls.version:
+            return None
+        return cls(
+            data["size"],
+            data["mtime_ns"],
+            tuple(data["header"]),
+            [tuple(ranges) for ranges in data["timezones"]],
+            [
+                IndexEntry(
+                    uid,
+                    [tuple(ranges) for ranges in ranges_list],
+                    UNBOUNDED[0] if lower is None else lower,
+                    UNBOUNDED[1] if upper is None else upper,
+                    has_alarms,
+                )
+                for uid, ranges_list, lower, upper, has_alarms in data["entries"]
+            ],
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Optional[ArchiveIndex]:
+        """Load an index from a file or return None if this is not possible."""
+        try:
+            with path.open(encoding="utf-8") as file:
+                return cls.from_json(json.load(file))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path):
+        """Save the index to a file.
+
+        Errors are ignored as archives can be in read-only places.
+        """
+        temporary = path.with_name(path.name + ".tmp")
+        with contextlib.suppress(OSError):
+            with temporary.open("w", encoding="utf-8") as file:
+                json.dump(self.to_json(), file)
+            temporary.replace(path)
+
+    @cached_property
+    def _by_lower(self) -> tuple[list[float], list[int]]:
+        """The lower bounds in order and the index of their entry."""
+        order = sorted(range(len(self.entries)), key=lambda i: self.entries[i].lower)
+        return [self.entries[i].lower for i in order], order
+
+    @cached_property
+    def _by_upper(self) -> tuple[list[float], list[int]]:
+        """The upper bounds in order and the index of their entry."""
+        order = sorted(range(len(self.entries)), key=lambda i: self.entries[i].upper)
+        return [self.entries[i].upper for i in order], order
+
+    @cached_property
+    def _with_alarms(self) -> list[int]:
+        """The indexes of the entries with alarms."""
+        return [i for i, entry in enumerate(self.entries) if entry.has_alarms]
+
+    def entries_between(
+        self,
+        lower: float,
+        upper: float,
+        include_alarms: bool = False,  # noqa: FBT001
+    ) -> list[IndexEntry]:
+        """Return the entries whose bounds intersect ``[lower, upper]``.
+
+        The entries are in the order of the file.
+        If include_alarms is True, entries with alarms are always included.
+        """
+        lowers, lower_order = self._by_lower
+        uppers, upper_order = self._by_upper
+        starting_before_upper = bisect.bisect_right(lowers, upper)
+        ending_after_lower = bisect.bisect_left(uppers, lower)
+        if starting_before_upper <= len(uppers) - ending_after_lower:
+            indexes = {
+                i
+                for i in lower_order[:starting_before_upper]
+                if self.entries[i].upper >= lower
+            }
+        else:
+            indexes = {
+                i
+                for i in upper_order[ending_after_lower:]
+                if self.entries[i].lower <= upper
+            }
+        if include_alarms:
+            indexes.update(self._with_alarms)
+        return [self.entries[i] for i in sorted(indexes)]
+
+
+class Archive:
+    """An ICS file that is mapped into memory.
+
+    Attributes:
+        index_suffix: The suffix of the index file next to the ICS file.
+    """
+
+    index_suffix = ".index.json"
+
+    def __init__(self, path: str | os.PathLike, save_index: bool = True):  # noqa: FBT001
+        """Open the file and load or create its index.
+
+        Arguments:
+            path: The path to the ICS file.
+            save_index: Whether to save a new index next to the file.
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + self.index_suffix)
+        self._file = self.path.open("rb")
+        stat = os.fstat(self._file.fileno())
+        self.data = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if stat.st_size
+            else b""
+        )
+        index = ArchiveIndex.load(self.index_path)
+        if index is None or not index.is_index_of(stat):
+            index = ArchiveIndex.scan(self.data, stat.st_size, stat.st_mtime_ns)
+            if save_index:
+                index.save(self.index_path)
+        self.index = index
+
+    def close(self):
+        """Close the file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        """Use the archive in a with statement."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive."""
+        self.close()
+
+    def _bytes(self, ranges: tuple[int, int]) -> bytes:
+        """The bytes of the file in the range."""
+        return bytes(self.data[slice(*ranges)])
+
+    @cached_property
+    def header(self) -> icalendar.Calendar:
+        """The calendar with its properties and VTIMEZONEs but no other components.
+
+        Parsing the VTIMEZONEs lets icalendar find the timezones
+        of the components.
+        """
+        return icalendar.Calendar.from_ical(
+            b"BEGIN:VCALENDAR\r\n"
+            + self._bytes(self.index.header)
+            + b"".join(self._bytes(ranges) for ranges in self.index.timezones)
+            + b"END:VCALENDAR\r\n"
+        )
+
+    def calendar_of(self, entry: IndexEntry) -> icalendar.Calendar:
+        """Return a calendar with the properties and the components of an entry."""
+        header = self.header
+        calendar = icalendar.Calendar()
+        calendar.update(header)
+        for ranges in entry.ranges:
+            calendar.add_component(icalendar.Component.from_ical(self._bytes(ranges)))
+        return calendar
+
+
+class ArchiveQuery(CalendarQuery):
+    """Query an archive and create the series only when they are needed.
+
+    Attributes:
+        padding: The time added to both sides of a query
+            because the bounds in the index ignore timezones.
+    """
+
+    padding = datetime.timedelta(days=2)
+
+    def __init__(
+        self,
+        archive: Archive,
+        keep_recurrence_attributes: bool = False,  # noqa: FBT001
+        components: T_COMPONENTS = ("VEVENT",),
+        skip_bad_series: bool = False,  # noqa: FBT001
+        **kw,
+    ):
+        """Create a query for an archive.
+
+        The other arguments are the same as for :class:`CalendarQuery`.
+        """
+        super().__init__(
+            archive.header,
+            keep_recurrence_attributes,
+            components,
+            skip_bad_series,
+            **kw,
+        )
+        self.archive = archive
+        self._series_of: dict[str, list[Series]] = {}
+        # alarms can be outside of the bounds of their components
+        self._include_alarms = not all(
+            component in ("VEVENT", "VTODO", "VJOURNAL") for component in components
+        )
+
+    def series_between(self, start: Time, stop: Time) -> Sequence[Series]:
+        """Return the series of the UIDs that can occur between start and stop.
+
+        The components of these UIDs are parsed the first time.
+        """
+        padding = self.padding.total_seconds()
+        series = []
+        for entry in self.archive.index.entries_between(
+            to_epoch(start) - padding, to_epoch(stop) + padding, self._include_alarms
+        ):
+            if entry.uid not in self._series_of:
+                calendar = to_standard(self.archive.calendar_of(entry))
+                self._series_of[entry.uid] = self.collect_series_from(calendar)
+                self.series.extend(self._series_of[entry.uid])
+            series.extend(self._series_of[entry.uid])
+        return series
+
+    def _referenced_timezones(self) -> list[Component]:
+        """The VTIMEZONE components of the archive."""
+        return self.archive.header.walk("VTIMEZONE")
+
+
+def of_archive(
+    path: str | os.PathLike,
+    save_index: bool = True,  # noqa: FBT001
+    **kw,
+) -> ArchiveQuery:
+    """Create a query for a large ICS file.
+
+    Only the components that can occur in the span of a query are parsed.
+    See :mod:`recurring_ical_events.archive`.
+
+    Arguments:
+        path: The path to the ICS file.
+        save_index: Whether to save the index next to the file.
+        kw: The other arguments of :func:`recurring_ical_events.of`.
+    """
+    return ArchiveQuery(Archive(path, save_index), **kw)
+
+
+__all__ = [
+    "Archive",
+    "ArchiveIndex",
+    "ArchiveQuery",
+    "IndexEntry",
+    "of_archive",
+    "top_level_components",
+]
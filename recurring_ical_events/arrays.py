@@ -0,0 +1,101 @@
+"""The times of occurrences as NumPy arrays.
+
+This requires :mod:`numpy` which you can install with
+
+.. code-block:: shell
+
+    pip install 'recurring-ical-events[numpy]'
+
+The times are collected from the series without creating
+:class:`~recurring_ical_events.occurrence.Occurrence` objects.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from array import array
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+from recurring_ical_events.util import to_epoch
+
+if TYPE_CHECKING:
+    import numpy
+
+    from recurring_ical_events.series import Series
+    from recurring_ical_events.types import Time
+
+
+def import_numpy():
+    """Return the numpy module or explain how to install it."""
+    # numpy is optional and only imported when it is used.
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "The arrays of occurrences require numpy. "
+            "Install it with: pip install 'recurring-ical-events[numpy]'"
+        ) from error
+    return numpy
+
+
+class OccurrenceArrays(NamedTuple):
+    """The times of occurrences in arrays.
+
+    The occurrences of a series are next to each other.
+
+    Times with a timezone are in UTC.
+    Dates and floating times are in their local time.
+
+    Attributes:
+        starts: The start of each occurrence as ``datetime64[s]``.
+        ends: The end of each occurrence as ``datetime64[s]``.
+        series_indexes: The index of the series of each occurrence.
+        series: The series, e.g. ``series[series_indexes[0]].uid``.
+    """
+
+    starts: numpy.ndarray
+    ends: numpy.ndarray
+    series_indexes: numpy.ndarray
+    series: Sequence[Series]
+
+    def of_series(self, index: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Return the starts and ends of the series at the index."""
+        numpy = import_numpy()
+        first, stop = numpy.searchsorted(self.series_indexes, [index, index + 1])
+        return self.starts[first:stop], self.ends[first:stop]
+
+    def __len__(self) -> int:
+        """The number of occurrences."""
+        return len(self.starts)
+
+
+def occurrence_arrays(
+    series: Sequence[Series],
+    span_start: Time,
+    span_stop: Time,
+    suppress_errors: tuple[type[Exception], ...] = (),
+) -> OccurrenceArrays:
+    """Collect the times of the occurrences of the series in the span.
+
+    Errors of the series in suppress_errors are skipped.
+    """
+    numpy = import_numpy()
+    starts = array("q")
+    ends = array("q")
+    series_indexes = array("q")
+    for index, a_series in enumerate(series):
+        count = len(starts)
+        with contextlib.suppress(suppress_errors):
+            for start, end in a_series.times_between(span_start, span_stop):
+                starts.append(to_epoch(start))
+                ends.append(to_epoch(end))
+        series_indexes.extend(array("q", [index]) * (len(starts) - count))
+    return OccurrenceArrays(
+        numpy.array(starts, dtype=numpy.int64).view("datetime64[s]"),
+        numpy.array(ends, dtype=numpy.int64).view("datetime64[s]"),
+        numpy.array(series_indexes, dtype=numpy.int64),
+        list(series),
+    )
+
+
+__all__ = ["OccurrenceArrays", "import_numpy", "occurrence_arrays"]
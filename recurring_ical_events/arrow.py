@@ -0,0 +1,182 @@
+"""Export occurrences to Apache Arrow tables.
+
+This requires :mod:`pyarrow` which you can install with
+
+.. code-block:: shell
+
+    pip install 'recurring-ical-events[arrow]'
+
+The occurrences are read one after the other.
+Their times are written to integer arrays that become a record batch
+every few thousand rows, so that only the table is held in memory.
+The UIDs and the properties are the same for all occurrences of a component.
+They are computed once per component and dictionary-encoded.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+from recurring_ical_events.util import to_epoch
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from recurring_ical_events.occurrence import Occurrence, OccurrenceBatch
+
+# The number of rows in each record batch of the table
+ROWS_PER_BATCH = 65536
+
+
+def import_pyarrow():
+    """Return the pyarrow module or explain how to install it."""
+    # pyarrow is optional and only imported when it is used.
+    try:
+        import pyarrow  # noqa: PLC0415
+        import pyarrow.compute  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "Exporting to Arrow requires pyarrow. "
+            "Install it with: pip install 'recurring-ical-events[arrow]'"
+        ) from error
+    return pyarrow
+
+
+def _same_type(values: list[Any]) -> list[Any]:
+    """Put single values into tuples if other values are tuples.
+
+    Properties like ATTENDEE can occur once or more often.
+    """
+    if any(isinstance(value, tuple) for value in values):
+        return [
+            value if value is None or isinstance(value, tuple) else (value,)
+            for value in values
+        ]
+    return values
+
+
+class _Rows:
+    """The rows of the next record batch."""
+
+    def __init__(self):
+        """Start with no rows."""
+        self.starts = array("q")
+        self.ends = array("q")
+        self.recurrence_ids = array("q")
+        self.sequences = array("q")
+        self.indexes = array("l")
+
+    def to_arrow(self, pa) -> tuple[pyarrow.Array, dict[str, pyarrow.Array]]:
+        """Return the indexes of the occurrences' components and the time columns."""
+        sequences = pa.array(self.sequences, pa.int64())
+        return pa.array(self.indexes, pa.int32()), {
+            "start": pa.array(self.starts, pa.timestamp("s")),
+            "end": pa.array(self.ends, pa.timestamp("s")),
+            "recurrence_id": pa.array(self.recurrence_ids, pa.timestamp("s")),
+            # -1 is a missing SEQUENCE
+            "sequence": pa.compute.if_else(
+                pa.compute.less(sequences, 0), None, sequences
+            ),
+        }
+
+
+def occurrences_to_arrow(
+    occurrences: Iterable[Occurrence],
+    columns: Sequence[str] = (),
+    keep_recurrence_attributes: bool = False,  # noqa: FBT001
+    rows_per_batch: int = ROWS_PER_BATCH,
+) -> pyarrow.Table:
+    """Return a table with one row for each occurrence.
+
+    The table has these columns:
+
+    - ``uid``: the UID of the component
+    - ``start``, ``end``: the time of the occurrence
+    - ``recurrence_id``: the RECURRENCE-ID or the start if the component has none
+    - ``sequence``: the SEQUENCE or null
+    - one column for each property in columns, see :meth:`Occurrence.to_dict`
+
+    Times with a timezone are in UTC.
+    Dates and floating times are in their local time.
+
+    The table consists of record batches with rows_per_batch rows.
+    """
+    pa = import_pyarrow()
+    adapter_index: dict[tuple, int] = {}
+    # The first occurrence of each key keeps the objects of the key alive.
+    adapters = []
+    recurrence_ids = []
+    sequences = []
+    properties = []
+    batches = []
+    rows = _Rows()
+    for occurrence in occurrences:
+        key = occurrence._batch_key()  # noqa: SLF001
+        index = adapter_index.get(key)
+        if index is None:
+            index = adapter_index[key] = len(adapters)
+            adapters.append(occurrence)
+            recurrence_id = occurrence.id.recurrence_id
+            recurrence_ids.append(
+                None if recurrence_id is None else to_epoch(recurrence_id)
+            )
+            sequence = occurrence.to_dict(["SEQUENCE"])["SEQUENCE"]
+            sequences.append(-1 if sequence is None else sequence)
+            data = occurrence.to_dict(columns, keep_recurrence_attributes)
+            properties.append([data[column] for column in columns])
+        start = to_epoch(occurrence.start)
+        rows.starts.append(start)
+        rows.ends.append(to_epoch(occurrence.end))
+        recurrence_id = recurrence_ids[index]
+        rows.recurrence_ids.append(start if recurrence_id is None else recurrence_id)
+        rows.sequences.append(
+            sequences[index] if occurrence.sequence < 0 else occurrence.sequence
+        )
+        rows.indexes.append(index)
+        if len(rows.indexes) >= rows_per_batch:
+            batches.append(rows.to_arrow(pa))
+            rows = _Rows()
+    if rows.indexes or not batches:
+        batches.append(rows.to_arrow(pa))
+    # The dictionaries are shared by all record batches.
+    dictionaries = {
+        "uid": pa.array(
+            [occurrence.id.uid for occurrence in adapters], pa.string()
+        ).dictionary_encode()
+    }
+    for column_index, column in enumerate(columns):
+        values = _same_type([values[column_index] for values in properties])
+        dictionaries[column] = pa.array(values).dictionary_encode()
+    record_batches = []
+    for indexes, times in batches:
+        encoded = {
+            column: pa.DictionaryArray.from_arrays(
+                dictionary.indices.take(indexes), dictionary.dictionary
+            )
+            for column, dictionary in dictionaries.items()
+        }
+        record_batches.append(
+            pa.RecordBatch.from_pydict({"uid": encoded.pop("uid"), **times, **encoded})
+        )
+    return pa.Table.from_batches(record_batches)
+
+
+def batch_to_arrow(
+    batch: OccurrenceBatch,
+    columns: Sequence[str] = (),
+    keep_recurrence_attributes: bool = False,  # noqa: FBT001
+) -> pyarrow.Table:
+    """Return a table with one row for each occurrence of the batch.
+
+    See :func:`occurrences_to_arrow` for the columns.
+    """
+    return occurrences_to_arrow(batch, columns, keep_recurrence_attributes)
+
+
+__all__ = [
+    "ROWS_PER_BATCH",
+    "batch_to_arrow",
+    "import_pyarrow",
+    "occurrences_to_arrow",
+]
@@ -0,0 +1,214 @@
+"""Share the queries of calendars that are used again and again.
+
+:func:`recurring_ical_events.cached_of` parses a calendar and creates
+its query once.
+The next call with the same calendar and arguments returns the same query.
+Bytes are recognized by a hash of their content.
+Files are recognized by their path, modification time and size.
+
+The queries are shared: do not modify them or their calendars.
+A query keeps caches and counters of its series that are not locked.
+Do not use a shared query from several threads at the same time.
+Use a lock or a :class:`QueryCache` for each thread.
+
+Example:
+
+.. code-block:: python
+
+    query = recurring_ical_events.cached_of(response.content)
+    print(recurring_ical_events.cache_info())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Hashable, NamedTuple, Union
+
+import icalendar
+
+if TYPE_CHECKING:
+    from recurring_ical_events.query import CalendarQuery
+
+Source = Union[bytes, str, os.PathLike]
+
+# the default size of the cached sources in bytes
+MAX_SIZE = 64 * 1024 * 1024
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a :class:`QueryCache`."""
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the calls that used a cached query."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def _hashable(value: Any) -> Hashable:
+    """Return a value for the key of the arguments."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+class QueryCache:
+    """A least recently used cache of queries.
+
+    The size of an entry is the size of the ICS source.
+    The least recently used queries are removed when the sources
+    are larger than max_size.
+    The last query is always kept.
+    If several threads ask for the same query, it is created once.
+    The cache is thread-safe but the queries are not.
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        """Create an empty cache.
+
+        Arguments:
+            max_size: The size of the sources in bytes to keep.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: OrderedDict[Hashable, tuple[CalendarQuery, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    @staticmethod
+    def key_of(source: Source, kw: dict[str, Any]) -> tuple[Hashable, int]:
+        """Return the key and the size of the source.
+
+        Raises:
+            TypeError: if the arguments cannot be hashed.
+        """
+        arguments = tuple(
+            sorted((name, _hashable(value)) for name, value in kw.items())
+        )
+        if isinstance(source, bytes):
+            digest = hashlib.blake2b(source, digest_size=32).digest()
+            return ("bytes", digest, arguments), len(source)
+        path = Path(source).resolve()
+        stat = path.stat()
+        key = ("path", str(path), stat.st_mtime_ns, stat.st_size, arguments)
+        return key, stat.st_size
+
+    def of(self, source: Source, **kw) -> CalendarQuery:
+        """Return the query of the calendar in source.
+
+        Arguments:
+            source: The bytes of an ICS file or its path.
+            kw: The arguments of :func:`recurring_ical_events.of`.
+        """
+        # recurring_ical_events imports this module.
+        from recurring_ical_events import of  # noqa: PLC0415
+
+        key, size = self.key_of(source, kw)
+
+        def create_query() -> CalendarQuery:
+            data = source if isinstance(source, bytes) else Path(source).read_bytes()
+            return of(icalendar.Calendar.from_ical(data), **kw)
+
+        return self.get(key, size, create_query)
+
+    def get(
+        self, key: Hashable, size: int, create: Callable[[], CalendarQuery]
+    ) -> CalendarQuery:
+        """Return the cached query or create it."""
+        with self._lock:
+            query = self._lookup(key)
+            if query is not None:
+                return query
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                query = self._lookup(key)
+                if query is not None:
+                    return query
+                self.misses += 1
+            try:
+                query = create()
+            except BaseException:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+                raise
+            # Other threads find the query or the key lock, never neither.
+            with self._lock:
+                self._key_locks.pop(key, None)
+                self._add(key, query, size)
+            return query
+
+    def _lookup(self, key: Hashable) -> CalendarQuery | None:
+        """Return the query and count the hit. Call with the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _add(self, key: Hashable, query: CalendarQuery, size: int):
+        """Add the query and remove old ones. Call with the lock."""
+        self._entries[key] = (query, size)
+        self._size += size
+        while self._size > self.max_size and len(self._entries) > 1:
+            _, (_, removed_size) = self._entries.popitem(last=False)
+            self._size -= removed_size
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, len(self._entries), self._size, self.max_size
+            )
+
+    def clear(self):
+        """Remove all queries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = self.hits = self.misses = 0
+
+
+# the cache of cached_of()
+CACHE = QueryCache()
+
+
+def cached_of(source: Source, **kw) -> CalendarQuery:
+    """Return a shared query for the calendar in source.
+
+    See :mod:`recurring_ical_events.cache`.
+
+    Arguments:
+        source: The bytes of an ICS file or its path.
+        kw: The arguments of :func:`recurring_ical_events.of`.
+    """
+    return CACHE.of(source, **kw)
+
+
+def cache_info() -> CacheInfo:
+    """Return the statistics of the cache of :func:`cached_of`."""
+    return CACHE.info()
+
+
+__all__ = [
+    "CACHE",
+    "MAX_SIZE",
+    "CacheInfo",
+    "QueryCache",
+    "cache_info",
+    "cached_of",
+]
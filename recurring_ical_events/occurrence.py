@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, NamedTuple, Optional
-
-from icalendar import Alarm
+from array import array
+from datetime import date, datetime, timedelta, tzinfo
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
-from recurring_ical_events.adapters.component import ComponentAdapter
+from recurring_ical_events.timezones import TIMEZONE_REGISTRY
 from recurring_ical_events.util import (
-    cached_property,
+    EPOCH,
+    EPOCH_ORDINAL,
+    EPOCH_UTC,
+    SECONDS_PER_DAY,
     make_comparable,
     time_span_contains_event,
+    to_epoch,
+    to_json_value,
 )
 
 if TYPE_CHECKING:
@@ -19,7 +32,11 @@ if TYPE_CHECKING:
     from icalendar.cal import Component
 
     from recurring_ical_events.adapters.component import ComponentAdapter
-    from recurring_ical_events.types import UID, RecurrenceIDs, Time
+    from recurring_ical_events.timezones import TransitionTable
+    from recurring_ical_events.types import UID, Epoch, RecurrenceIDs, Time
+
+# date, None for floating times or the tzinfo, see time_type()
+TimeType = Union[type, None, tzinfo]
 
 
 class OccurrenceID(NamedTuple):
@@ -86,6 +103,9 @@ class OccurrenceID(NamedTuple):
 class Occurrence:
     """A repetition of an event."""
 
+    # Millions of occurrences can be created by a query.
+    __slots__ = ("_adapter", "_id", "end", "sequence", "start")
+
     def __init__(
         self,
         adapter: ComponentAdapter,
@@ -104,6 +124,7 @@ class Occurrence:
         self.start = adapter.start if start is None else start
         self.end = adapter.end if end is None else end
         self.sequence = sequence
+        self._id: OccurrenceID | None = None
 
     def __repr__(self) -> str:
         """The string representation."""
@@ -126,6 +147,81 @@ class Occurrence:
             component["SEQUENCE"] = self.sequence
         return component
 
+    def as_component_view(self, keep_recurrence_attributes: bool) -> Component:  # noqa: FBT001
+        """Create a view of the source component with some modified attributes.
+
+        The view is equal to as_component() but shares the attributes
+        with the source component until it is modified.
+        """
+        return self._adapter.as_component_view(
+            self.start, self.end, keep_recurrence_attributes, self.sequence
+        )
+
+    def as_projected_component(
+        self,
+        keep_recurrence_attributes: bool,  # noqa: FBT001
+        properties: Optional[Sequence[str]] = None,
+        include_subcomponents: bool = True,  # noqa: FBT001
+    ) -> Component:
+        """Create a component like as_component() with only some properties.
+
+        Arguments:
+            keep_recurrence_attributes: Whether to keep attributes that are
+                only used to calculate the recurrence.
+            properties: The names of the properties to include,
+                e.g. ``["UID", "SUMMARY", "DTSTART", "DTEND"]``.
+                If properties is None, all properties are included.
+            include_subcomponents: Whether to include the subcomponents
+                like alarms.
+        """
+        if properties is None:
+            component = self.as_component(keep_recurrence_attributes)
+            if not include_subcomponents:
+                component.subcomponents = []
+            return component
+        return self._adapter.as_projected_component(
+            self.start,
+            self.end,
+            keep_recurrence_attributes,
+            self.sequence,
+            properties,
+            include_subcomponents,
+        )
+
+    def to_ical(self, keep_recurrence_attributes: bool) -> bytes:  # noqa: FBT001
+        """Return the ICS of as_component().
+
+        This encodes only the properties that differ between occurrences.
+        """
+        return self._adapter.as_ical(
+            self.start, self.end, keep_recurrence_attributes, self.sequence
+        )
+
+    def to_dict(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        keep_recurrence_attributes: bool = False,  # noqa: FBT001
+    ) -> dict[str, Any]:
+        """Return the properties of as_component() as values that json can encode.
+
+        Arguments:
+            fields: The names of the properties to return, e.g. ``["SUMMARY"]``.
+                The keys of the result are spelled like the fields.
+                Absent properties are None.
+                If fields is None, all properties are returned.
+            keep_recurrence_attributes: Whether to keep attributes that are
+                only used to calculate the recurrence.
+
+        See :func:`recurring_ical_events.util.to_json_value` for the values.
+        """
+        return self._adapter.as_dict(
+            self.start,
+            self.end,
+            keep_recurrence_attributes,
+            self.sequence,
+            fields,
+        )
+
     def is_in_span(self, span_start: Time, span_stop: Time) -> bool:
         """Return whether the component is in the span."""
         return time_span_contains_event(span_start, span_stop, self.start, self.end)
@@ -138,9 +234,15 @@ class Occurrence:
         self_start, other_start = make_comparable((self.start, other.start))
         return self_start < other_start
 
-    @cached_property
+    @property
     def id(self) -> OccurrenceID:
         """The id of the component."""
+        if self._id is None:
+            self._id = self._create_id()
+        return self._id
+
+    def _create_id(self) -> OccurrenceID:
+        """Create the id of the component, see id."""
         return OccurrenceID.from_occurrence(
             self._adapter.component_name(),
             self._adapter.uid,
@@ -148,6 +250,14 @@ class Occurrence:
             self.start,
         )
 
+    def _batch_key(self) -> tuple:
+        """Occurrences with the same key only differ in their times."""
+        return (type(self), id(self._adapter))
+
+    def _with_times(self, start: Time, end: Time, sequence: int) -> Occurrence:
+        """Create an occurrence like this one at a different time."""
+        return type(self)(self._adapter, start, end, sequence)
+
     def __hash__(self) -> int:
         """Hash this for an occurrence."""
         return hash(self.id)
@@ -167,7 +277,7 @@ class Occurrence:
 
     def has_alarm(self, alarm: Alarm) -> bool:
         """Wether this alarm is in this occurrence."""
-        return alarm in self._adapter.alarms
+        return self._adapter.has_alarm(alarm)
 
     @property
     def recurrence_ids(self) -> RecurrenceIDs:
@@ -178,6 +288,8 @@ class Occurrence:
 class AlarmOccurrence(Occurrence):
     """Adapter for absolute alarms."""
 
+    __slots__ = ("alarm", "parent")
+
     def __init__(
         self,
         trigger: datetime,
@@ -199,9 +311,75 @@ class AlarmOccurrence(Occurrence):
         parent.subcomponents = [alarm_once]
         return parent
 
-    @cached_property
-    def id(self) -> OccurrenceID:
-        """The id of the component."""
+    def as_component_view(self, keep_recurrence_attributes):
+        """Return a view of the alarm's parent as a modified component."""
+        parent = self.parent.as_component_view(
+            keep_recurrence_attributes=keep_recurrence_attributes
+        )
+        alarm_once = self.alarm.copy()
+        alarm_once.TRIGGER = self.start
+        alarm_once.REPEAT = 0
+        parent.subcomponents = [alarm_once]
+        return parent
+
+    def as_projected_component(
+        self,
+        keep_recurrence_attributes: bool,  # noqa: FBT001
+        properties: Optional[Sequence[str]] = None,
+        include_subcomponents: bool = True,  # noqa: FBT001
+    ) -> Component:
+        """Return the alarm's parent with only some properties.
+
+        If the subcomponents are included, the parent contains only this alarm.
+        """
+        if isinstance(self.parent, Occurrence):
+            parent = self.parent.as_projected_component(
+                keep_recurrence_attributes, properties
+            )
+        elif properties is None:
+            parent = self.parent.as_component(
+                keep_recurrence_attributes=keep_recurrence_attributes
+            )
+        else:
+            parent = self.parent.as_projected_component(
+                keep_recurrence_attributes=keep_recurrence_attributes,
+                properties=properties,
+            )
+        if include_subcomponents:
+            alarm_once = self.alarm.copy()
+            alarm_once.TRIGGER = self.start
+            alarm_once.REPEAT = 0
+            parent.subcomponents = [alarm_once]
+        else:
+            parent.subcomponents = []
+        return parent
+
+    def to_ical(self, keep_recurrence_attributes: bool) -> bytes:  # noqa: FBT001
+        """Return the ICS of as_component()."""
+        return self.as_component(keep_recurrence_attributes).to_ical()
+
+    def to_dict(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        keep_recurrence_attributes: bool = False,  # noqa: FBT001
+    ) -> dict[str, Any]:
+        """Return the properties of the alarm's parent and the TRIGGER.
+
+        TRIGGER is the time of the alarm.
+        """
+        if isinstance(self.parent, Occurrence):
+            result = self.parent.to_dict(fields, keep_recurrence_attributes)
+        else:
+            result = self.parent.as_dict(
+                keep_recurrence_attributes=keep_recurrence_attributes, fields=fields
+            )
+        for field in ("TRIGGER",) if fields is None else fields:
+            if field.upper() == "TRIGGER":
+                result[field] = to_json_value(self.start)
+        return result
+
+    def _create_id(self) -> OccurrenceID:
+        """Create the id of the component, see id."""
         return OccurrenceID.from_occurrence(
             self.parent.component_name(),
             self.parent.uid,
@@ -209,6 +387,19 @@ class AlarmOccurrence(Occurrence):
             self.start,
         )
 
+    def _batch_key(self) -> tuple:
+        """Alarm occurrences of the same alarm and parent only differ in time."""
+        return (type(self), id(self.alarm), id(self.parent))
+
+    def _with_times(
+        self,
+        start: Time,
+        end: Time,  # noqa: ARG002
+        sequence: int,  # noqa: ARG002
+    ) -> AlarmOccurrence:
+        """Create an occurrence of the alarm at a different time."""
+        return type(self)(start, self.alarm, self.parent)
+
     def __repr__(self) -> str:
         """repr(self)"""
         return (
@@ -217,8 +408,195 @@ class AlarmOccurrence(Occurrence):
         )
 
 
+def time_type(time: Time) -> TimeType:
+    """The type of a time that OccurrenceBatch stores with the adapter.
+
+    This is date for dates, None for floating times or the tzinfo.
+    """
+    if isinstance(time, datetime):
+        return time.tzinfo
+    return date
+
+
+def from_epoch(epoch: Epoch, time_type: TimeType) -> Time:
+    """Create the time with the epoch, see to_epoch() and time_type()."""
+    if time_type is date:
+        return date.fromordinal(EPOCH_ORDINAL + epoch // SECONDS_PER_DAY)
+    if time_type is None:
+        return EPOCH + timedelta(seconds=epoch)
+    try:
+        return datetime.fromtimestamp(epoch, time_type)
+    except (OSError, OverflowError, ValueError):
+        # Some platforms do not support negative timestamps.
+        return (EPOCH_UTC + timedelta(seconds=epoch)).astimezone(time_type)
+
+
+class BatchTimes(Sequence):
+    """The starts or ends of an OccurrenceBatch.
+
+    The times are created from their epochs when they are accessed.
+    """
+
+    def __init__(self, batch: OccurrenceBatch, *, ends: bool):
+        """The starts or ends of the batch."""
+        self._batch = batch
+        self._ends = ends
+
+    def __len__(self) -> int:
+        """The number of occurrences."""
+        return len(self._batch)
+
+    def __getitem__(self, index: int) -> Time:
+        """Create the time at the index."""
+        return self._batch.time_at(index, ends=self._ends)
+
+
+class OccurrenceBatch:
+    """Many occurrences stored in parallel arrays.
+
+    Storing the start, end and sequence of each occurrence as integers
+    in arrays takes less memory than an object for each occurrence.
+    The times are stored as epochs, see
+    :func:`recurring_ical_events.util.to_epoch`.
+    Whether they are dates, floating times or times in a timezone
+    is stored once with each adapter.
+    The times and occurrences are created when they are accessed.
+
+    Attributes:
+        start_epochs: The start of each occurrence as an epoch.
+        end_epochs: The end of each occurrence as an epoch.
+        sequences: The sequence of each occurrence.
+        adapter_indexes: The index of the adapter of each occurrence.
+        adapters: The occurrences that the others are created from.
+        time_types: The types of the start and end of each adapter,
+            see :func:`time_type`.
+
+    Example:
+
+        .. code-block:: python
+
+            batch = recurring_ical_events.of(calendar).batch_between(2025, 2026)
+            print(len(batch), "occurrences")
+            print(batch.starts[0], batch.ends[0])
+            occurrence = batch[0]  # an Occurrence
+    """
+
+    def __init__(self, occurrences: Iterable[Occurrence] = ()):
+        """Store the occurrences."""
+        self.start_epochs = array("q")
+        self.end_epochs = array("q")
+        self.sequences = array("q")
+        self.adapter_indexes = array("L")
+        self.adapters: list[Occurrence] = []
+        self.time_types: list[tuple[TimeType, TimeType]] = []
+        self._adapter_index: dict[tuple, int] = {}
+        self._tables: list[tuple[TransitionTable | None, TransitionTable | None]] = []
+        # The times that cannot be created from their epoch,
+        # e.g. times with microseconds or that the clock skips.
+        self._other_times: dict[tuple[int, bool], Time] = {}
+        self.extend(occurrences)
+
+    @staticmethod
+    def _table(time_type: TimeType) -> TransitionTable | None:
+        """The compiled timezone to check the times of this type."""
+        if time_type is date or time_type is None:
+            return None
+        return TIMEZONE_REGISTRY.get(time_type)
+
+    def _append_time(
+        self,
+        epochs: array,
+        time: Time,
+        table: TransitionTable | None,
+        *,
+        ends: bool,
+    ) -> None:
+        """Add the epoch of a time and remember the time if it differs."""
+        if not isinstance(time, date):
+            # This is no time we can store as an epoch.
+            self._other_times[len(epochs), ends] = time
+            epochs.append(0)
+            return
+        epoch = to_epoch(time)
+        if isinstance(time, datetime):
+            exact = not time.microsecond
+            if exact and table is not None and table.transitions:
+                # The time is created again with the UTC offset at the epoch.
+                offset = time.utcoffset()
+                exact = (
+                    table.utc_offset(epoch)
+                    == offset.days * SECONDS_PER_DAY + offset.seconds
+                )
+            if not exact:
+                self._other_times[len(epochs), ends] = time
+        epochs.append(epoch)
+
+    def append(self, occurrence: Occurrence) -> None:
+        """Add an occurrence."""
+        start, end = occurrence.start, occurrence.end
+        types = time_type(start), time_type(end)
+        key = (occurrence._batch_key(), *types)  # noqa: SLF001
+        index = self._adapter_index.get(key)
+        if index is None:
+            index = self._adapter_index[key] = len(self.adapters)
+            self.adapters.append(occurrence)
+            self.time_types.append(types)
+            self._tables.append((self._table(types[0]), self._table(types[1])))
+        start_table, end_table = self._tables[index]
+        self._append_time(self.start_epochs, start, start_table, ends=False)
+        self._append_time(self.end_epochs, end, end_table, ends=True)
+        self.adapter_indexes.append(index)
+        self.sequences.append(occurrence.sequence)
+
+    def extend(self, occurrences: Iterable[Occurrence]) -> None:
+        """Add many occurrences."""
+        for occurrence in occurrences:
+            self.append(occurrence)
+
+    def time_at(self, index: int, *, ends: bool = False) -> Time:
+        """Create the start or, if ends is True, the end of an occurrence."""
+        epochs = self.end_epochs if ends else self.start_epochs
+        epoch = epochs[index]
+        if index < 0:
+            index += len(epochs)
+        time = self._other_times.get((index, ends))
+        if time is not None:
+            return time
+        return from_epoch(epoch, self.time_types[self.adapter_indexes[index]][ends])
+
+    @property
+    def starts(self) -> BatchTimes:
+        """The start of each occurrence."""
+        return BatchTimes(self, ends=False)
+
+    @property
+    def ends(self) -> BatchTimes:
+        """The end of each occurrence."""
+        return BatchTimes(self, ends=True)
+
+    def __len__(self) -> int:
+        """The number of occurrences."""
+        return len(self.sequences)
+
+    def __getitem__(self, index: int) -> Occurrence:
+        """Create the occurrence at the index."""
+        return self.adapters[self.adapter_indexes[index]]._with_times(  # noqa: SLF001
+            self.time_at(index), self.time_at(index, ends=True), self.sequences[index]
+        )
+
+    def __iter__(self) -> Iterator[Occurrence]:
+        """Create the occurrences one after the other."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        return f"<{self.__class__.__name__} of {len(self)} occurrences>"
+
+
 __all__ = [
     "AlarmOccurrence",
     "Occurrence",
+    "OccurrenceBatch",
     "OccurrenceID",
 ]
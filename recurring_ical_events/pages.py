@@ -8,7 +8,7 @@ See
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Iterator, Optional, TypeVar
+from typing import TYPE_CHECKING, Callable, Generic, Iterator, Optional, TypeVar
 
 from recurring_ical_events.util import compare_greater
 
@@ -189,10 +189,21 @@ class Pages(_PagesBase["Page"]):
         size: int,
         stop: Optional[Time] = None,
         keep_recurrence_attributes: bool = False,  # noqa: FBT001
+        as_component: Optional[Callable[[Occurrence], Component]] = None,
     ):
-        """Create a new paginated iterator over components."""
+        """Create a new paginated iterator over components.
+
+        as_component converts an occurrence to a component.
+        By default, this is :meth:`Occurrence.as_component`.
+        """
         super().__init__(occurrence_iterator, size, stop)
         self._keep_recurrence_attributes = keep_recurrence_attributes
+        if as_component is not None:
+            self._as_component = as_component
+
+    def _as_component(self, occurrence: Occurrence) -> Component:
+        """Return the component of the occurrence."""
+        return occurrence.as_component(self._keep_recurrence_attributes)
 
     def _empty_page(self) -> Page:
         return Page([])
@@ -201,10 +212,7 @@ class Pages(_PagesBase["Page"]):
         """Return the next page."""
         occurrences = self._collect_next_page()
         return Page(
-            [
-                occurrence.as_component(self._keep_recurrence_attributes)
-                for occurrence in occurrences
-            ],
+            [self._as_component(occurrence) for occurrence in occurrences],
             next_page_id=self._next_page_id_string(),
         )
 
@@ -0,0 +1,144 @@
+"""Parse large calendars in several processes.
+
+The calendar is split into batches of top-level components.
+Each batch is parsed by a process of a
+:class:`concurrent.futures.ProcessPoolExecutor`.
+All VTIMEZONE components are parsed when a process starts
+so that the components can use them wherever they are in the file.
+The components are put together in the order of the file.
+The result is the same as that of :meth:`icalendar.cal.Calendar.from_ical`.
+
+Example:
+
+.. code-block:: python
+
+    query = recurring_ical_events.of_parallel("large.ics", processes=4)
+
+.. note::
+
+    On platforms that spawn processes, like Windows and macOS,
+    this must be called inside ``if __name__ == "__main__":``.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import icalendar
+
+from recurring_ical_events.archive import top_level_components
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+
+    from recurring_ical_events.query import CalendarQuery
+
+# the number of batches per process to balance the work
+BATCHES_PER_PROCESS = 4
+
+
+def _parse_timezones(timezones: bytes) -> Optional[icalendar.Calendar]:
+    """Parse the VTIMEZONEs so that icalendar can find them."""
+    if not timezones:
+        return None
+    return icalendar.Calendar.from_ical(
+        b"BEGIN:VCALENDAR\r\n" + timezones + b"END:VCALENDAR\r\n"
+    )
+
+
+def _parse_components(data: bytes) -> list[Component]:
+    """Parse a batch of top-level components."""
+    return icalendar.Component.from_ical(data, multiple=True)
+
+
+def split_calendar(
+    data: bytes, batches: int
+) -> tuple[bytes, bytes, list[tuple[int, int]]]:
+    """Split the calendar for parsing.
+
+    Returns:
+        The properties of the calendar, the VTIMEZONE components
+        and the byte ranges of about the same size of the batches
+        of top-level components.
+    """
+    header = b""
+    timezones = []
+    batch_size = max(len(data) // max(batches, 1), 1)
+    ranges: list[tuple[int, int]] = []
+    batch_start = None
+    for name, start, stop in top_level_components(data):
+        if name == b"VCALENDAR":
+            header = data[start:stop]
+            continue
+        if name == b"VTIMEZONE":
+            timezones.append(data[start:stop])
+        if batch_start is None:
+            batch_start = start
+        if stop - batch_start >= batch_size:
+            ranges.append((batch_start, stop))
+            batch_start = None
+    if batch_start is not None:
+        ranges.append((batch_start, stop))
+    return header, b"".join(timezones), ranges
+
+
+def parse_calendar(data: bytes, processes: Optional[int] = None) -> icalendar.Calendar:
+    """Parse a calendar in several processes.
+
+    Arguments:
+        data: The ICS bytes of a calendar.
+        processes: The number of processes to use.
+            If processes is None, this is the number of CPUs.
+            If processes is 1, the calendar is parsed in this process.
+
+    The properties of the calendar are expected before its components.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    header, timezones, ranges = split_calendar(data, processes * BATCHES_PER_PROCESS)
+    _parse_timezones(timezones)
+    calendar = icalendar.Calendar.from_ical(
+        b"BEGIN:VCALENDAR\r\n" + header + b"END:VCALENDAR\r\n"
+    )
+    batches = (data[start:stop] for start, stop in ranges)
+    if processes == 1 or len(ranges) <= 1:
+        for batch in batches:
+            calendar.subcomponents.extend(_parse_components(batch))
+        return calendar
+    with ProcessPoolExecutor(
+        processes, initializer=_parse_timezones, initargs=(timezones,)
+    ) as pool:
+        for components in pool.map(_parse_components, batches):
+            calendar.subcomponents.extend(components)
+    return calendar
+
+
+def of_parallel(
+    path_or_data: str | os.PathLike | bytes,
+    processes: Optional[int] = None,
+    **kw,
+) -> CalendarQuery:
+    """Create a query for a calendar that is parsed in several processes.
+
+    See :mod:`recurring_ical_events.parallel`.
+
+    Arguments:
+        path_or_data: The path to an ICS file or its bytes.
+        processes: The number of processes, see :func:`parse_calendar`.
+        kw: The other arguments of :func:`recurring_ical_events.of`.
+    """
+    # recurring_ical_events imports this module.
+    from recurring_ical_events import of  # noqa: PLC0415
+
+    data = (
+        path_or_data
+        if isinstance(path_or_data, bytes)
+        else Path(path_or_data).read_bytes()
+    )
+    return of(parse_calendar(data, processes), **kw)
+
+
+__all__ = ["of_parallel", "parse_calendar", "split_calendar"]
@@ -5,8 +5,18 @@ from __future__ import annotations
 import contextlib
 import datetime
 import itertools
+import json
 import sys
-from typing import TYPE_CHECKING, ClassVar, Generator, Iterator, Optional, Sequence
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generator,
+    Iterator,
+    Optional,
+    Sequence,
+)
 
 try:
     from typing import TypeAlias
@@ -22,14 +32,17 @@ from recurring_ical_events.errors import (
     InvalidCalendar,
     PeriodEndBeforeStart,
 )
-from recurring_ical_events.occurrence import OccurrenceID
+from recurring_ical_events.occurrence import OccurrenceBatch, OccurrenceID
 from recurring_ical_events.pages import OccurrencePages, Pages
 from recurring_ical_events.selection.base import SelectComponents
+from recurring_ical_events.selection.walk import ComponentWalk
 from recurring_ical_events.util import compare_greater
 
 if TYPE_CHECKING:
+    import pyarrow
     from icalendar import Component
 
+    from recurring_ical_events.arrays import OccurrenceArrays
     from recurring_ical_events.occurrence import Occurrence
     from recurring_ical_events.series import Series
     from recurring_ical_events.types import (
@@ -56,6 +69,8 @@ class CalendarQuery:
     Attributes:
         suppressed_errors: a list of errors to suppress when
             skip_bad_series is True
+        expanded_calendar_defaults: the properties of the calendar
+            written by :meth:`write_expanded_ics` if the calendar has none
     """
 
     suppressed_errors: ClassVar[type[Exception]] = [
@@ -63,6 +78,10 @@ class CalendarQuery:
         PeriodEndBeforeStart,
         icalendar.InvalidCalendar,
     ]
+    expanded_calendar_defaults: ClassVar[dict[str, str]] = {
+        "VERSION": "2.0",
+        "PRODID": "-//niccokunzmann//recurring-ical-events//EN",
+    }
     from recurring_ical_events.selection.name import ComponentsWithName
 
     def __init__(
@@ -71,6 +90,9 @@ class CalendarQuery:
         keep_recurrence_attributes: bool = False,  # noqa: FBT001
         components: T_COMPONENTS = ("VEVENT",),
         skip_bad_series: bool = False,  # noqa: FBT001
+        component_views: bool = False,  # noqa: FBT001
+        properties: Optional[Sequence[str]] = None,
+        include_subcomponents: bool = True,  # noqa: FBT001
     ):
         """Create an unfoldable calendar from a given calendar.
 
@@ -86,22 +108,59 @@ class CalendarQuery:
             skip_bad_series: Whether to skip series of components that contain
                 errors. You can use :attr:`CalendarQuery.suppressed_errors` to
                 specify which errors to skip.
+            component_views: Whether to return views of the components instead
+                of copies. Views share the properties with the components
+                in the calendar and are only copied when they are modified.
+                See :mod:`recurring_ical_events.view`.
+            properties: The names of the properties of the returned components,
+                e.g. ``["UID", "SUMMARY", "DTSTART", "DTEND"]``.
+                Other properties are not copied.
+                If properties is None, the components have all properties.
+            include_subcomponents: Whether the returned components
+                contain subcomponents like alarms.
         """
+        self.calendar = calendar
         self.keep_recurrence_attributes = keep_recurrence_attributes
+        self.component_views = component_views
+        self.properties = None if properties is None else tuple(properties)
+        self.include_subcomponents = include_subcomponents
         if calendar.get("CALSCALE", "GREGORIAN") != "GREGORIAN":
             # https://www.kanzaki.com/docs/ical/calscale.html
             raise InvalidCalendar("Only Gregorian calendars are supported.")
 
-        self.series: list[Series] = []  # component
         self._skip_errors = tuple(self.suppressed_errors) if skip_bad_series else ()
-        for component_adapter_id in components:
-            if isinstance(component_adapter_id, str):
-                component_adapter = self.ComponentsWithName(component_adapter_id)
-            else:
-                component_adapter = component_adapter_id
-            self.series.extend(
-                component_adapter.collect_series_from(calendar, self._skip_errors)
+        self._component_adapters = [
+            self.ComponentsWithName(component_adapter_id)
+            if isinstance(component_adapter_id, str)
+            else component_adapter_id
+            for component_adapter_id in components
+        ]
+        self.series: list[Series] = self.collect_series_from(calendar)
+
+    def collect_series_from(self, source: Component) -> list[Series]:
+        """Collect the series of the selected components in the source.
+
+        The source is walked once for all selections.
+        """
+        source = ComponentWalk.of(source)
+        series = []
+        for component_adapter in self._component_adapters:
+            series.extend(
+                component_adapter.collect_series_from(source, self._skip_errors)
             )
+        return series
+
+    def series_between(
+        self,
+        start: Time,  # noqa: ARG002
+        stop: Time,  # noqa: ARG002
+    ) -> Sequence[Series]:
+        """Return the series that can have occurrences between start and stop.
+
+        These are all the series.
+        Subclasses can override this to create series only when they are needed.
+        """
+        return self.series
 
     @staticmethod
     def to_datetime(date: DateArgument):
@@ -272,6 +331,205 @@ class CalendarQuery:
         start, stop = self._between_span(start, stop)
         return self._occurrences_between(start, stop)
 
+    def batch_between(
+        self, start: DateArgument, stop: DateArgument | datetime.timedelta
+    ) -> OccurrenceBatch:
+        """Return the occurrences in ``[start, stop]`` as an :class:`OccurrenceBatch`.
+
+        This is like :meth:`occurrences_between` but keeps the times of the
+        occurrences in arrays instead of creating an object for each of them.
+        Use this for large results.
+
+        Arguments:
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+        """
+        start, stop = self._between_span(start, stop)
+        batch = OccurrenceBatch()
+        for series in self.series_between(start, stop):
+            with contextlib.suppress(self._skip_errors):
+                batch.extend(series.between(start, stop))
+        return batch
+
+    def iter_dicts(
+        self,
+        start: DateArgument,
+        stop: DateArgument | datetime.timedelta,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Generator[dict[str, Any]]:
+        """Yield the occurrences in ``[start, stop]`` as dicts.
+
+        This does not create components.
+        The dicts are created one by one, ordered by series.
+        See :meth:`Occurrence.to_dict`.
+
+        Arguments:
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+            fields: The names of the properties to return, e.g. ``["SUMMARY"]``.
+                If fields is None, all properties are returned.
+        """
+        start, stop = self._between_span(start, stop)
+        for occurrence in self._iter_occurrences_between(start, stop):
+            yield occurrence.to_dict(fields, self.keep_recurrence_attributes)
+
+    def to_jsonl(
+        self,
+        fp: IO[str],
+        start: DateArgument,
+        stop: DateArgument | datetime.timedelta,
+        fields: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Write the occurrences in ``[start, stop]`` to fp as JSON Lines.
+
+        Each line is a dict of :meth:`iter_dicts`.
+        The lines are written as they are created.
+
+        Arguments:
+            fp: A file opened for writing text.
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+            fields: The names of the properties to write, e.g. ``["SUMMARY"]``.
+
+        Returns:
+            The number of lines written.
+        """
+        count = 0
+        for data in self.iter_dicts(start, stop, fields):
+            fp.write(json.dumps(data))
+            fp.write("\n")
+            count += 1
+        return count
+
+    def write_expanded_ics(
+        self,
+        fp: IO[bytes],
+        start: DateArgument,
+        stop: DateArgument | datetime.timedelta,
+    ) -> int:
+        """Write a calendar with the occurrences in ``[start, stop]`` to fp.
+
+        Each occurrence is written as a component of its own.
+        Unless you keep the recurrence attributes, the calendar has no
+        ``RRULE``, ``RDATE`` or ``EXDATE``.
+        The header of the calendar and the ``VTIMEZONE`` components
+        that are referred to are written first.
+        Then, the occurrences are written as they are created
+        so that they are not held in memory.
+
+        Arguments:
+            fp: A file opened for writing bytes.
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+
+        Returns:
+            The number of occurrences written.
+        """
+        start, stop = self._between_span(start, stop)
+        header = self._expanded_calendar_header()
+        fp.write(header)
+        for timezone in self._referenced_timezones():
+            fp.write(timezone.to_ical())
+        count = 0
+        for series in self.series_between(start, stop):
+            with contextlib.suppress(self._skip_errors):
+                for occurrence in series.between(start, stop):
+                    fp.write(self._to_ical(occurrence))
+                    count += 1
+        fp.write(b"END:VCALENDAR\r\n")
+        return count
+
+    def _expanded_calendar_header(self) -> bytes:
+        """The ICS of the calendar's properties without the END line."""
+        header = icalendar.Calendar()
+        if self.calendar.name == "VCALENDAR":
+            header.update(self.calendar)
+        for name, value in self.expanded_calendar_defaults.items():
+            if name not in header:
+                header.add(name, value)
+        ics = header.to_ical()
+        return ics[: -len(b"END:VCALENDAR\r\n")]
+
+    def _referenced_timezones(self) -> list[Component]:
+        """The VTIMEZONE components with a TZID that the calendar refers to."""
+        timezones = [
+            component
+            for component in self.calendar.subcomponents
+            if component.name == "VTIMEZONE"
+        ]
+        if not timezones:
+            return []
+        tzids = set()
+        for component in self.calendar.walk():
+            if component.name in ("VTIMEZONE", "STANDARD", "DAYLIGHT"):
+                continue
+            for values in component.values():
+                for value in values if isinstance(values, list) else [values]:
+                    params = getattr(value, "params", {})
+                    if "TZID" in params:
+                        tzids.add(params["TZID"])
+        return [timezone for timezone in timezones if timezone.get("TZID") in tzids]
+
+    def _to_ical(self, occurrence: Occurrence) -> bytes:
+        """Return the ICS of the component of an occurrence."""
+        if self.properties is None and self.include_subcomponents:
+            return occurrence.to_ical(self.keep_recurrence_attributes)
+        return self._as_component(occurrence).to_ical()
+
+    def to_arrow(
+        self,
+        start: DateArgument,
+        stop: DateArgument | datetime.timedelta,
+        columns: Sequence[str] = (),
+    ) -> pyarrow.Table:
+        """Return the occurrences in ``[start, stop]`` as an Apache Arrow table.
+
+        This requires :mod:`pyarrow`.
+        See :func:`recurring_ical_events.arrow.occurrences_to_arrow` for the columns.
+        The occurrences are written to the table one after the other.
+
+        Arguments:
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+            columns: The names of the properties to add as columns,
+                e.g. ``["SUMMARY", "LOCATION"]``.
+        """
+        # pyarrow is optional and only imported when it is used.
+        from recurring_ical_events.arrow import occurrences_to_arrow  # noqa: PLC0415
+
+        start, stop = self._between_span(start, stop)
+        return occurrences_to_arrow(
+            self._iter_occurrences_between(start, stop),
+            columns,
+            self.keep_recurrence_attributes,
+        )
+
+    def occurrence_arrays(
+        self, start: DateArgument, stop: DateArgument | datetime.timedelta
+    ) -> OccurrenceArrays:
+        """Return the times of the occurrences in ``[start, stop]`` as NumPy arrays.
+
+        This requires :mod:`numpy`. No :class:`Occurrence` objects are created.
+        See :class:`recurring_ical_events.arrays.OccurrenceArrays`.
+
+        Arguments:
+            start: A date specification. See :meth:`to_datetime`.
+            stop: A date specification or a :class:`datetime.timedelta`
+                relative to start.
+        """
+        # numpy is optional and only imported when it is used.
+        from recurring_ical_events.arrays import occurrence_arrays  # noqa: PLC0415
+
+        start, stop = self._between_span(start, stop)
+        return occurrence_arrays(
+            self.series_between(start, stop), start, stop, self._skip_errors
+        )
+
     def _between_span(
         self, start: DateArgument, stop: DateArgument | datetime.timedelta
     ) -> tuple[Time, Time]:
@@ -288,10 +546,19 @@ class CalendarQuery:
         self, occurrences: list[Occurrence]
     ) -> list[Component]:
         """Map occurrences to components."""
-        return [
-            occurrence.as_component(self.keep_recurrence_attributes)
-            for occurrence in occurrences
-        ]
+        return [self._as_component(occurrence) for occurrence in occurrences]
+
+    def _as_component(self, occurrence: Occurrence) -> Component:
+        """Return the component of the occurrence."""
+        if self.properties is not None or not self.include_subcomponents:
+            return occurrence.as_projected_component(
+                self.keep_recurrence_attributes,
+                self.properties,
+                self.include_subcomponents,
+            )
+        if self.component_views:
+            return occurrence.as_component_view(self.keep_recurrence_attributes)
+        return occurrence.as_component(self.keep_recurrence_attributes)
 
     def _between(self, start: Time, end: Time) -> list[Component]:
         """Return the occurrences between the start and the end."""
@@ -300,11 +567,19 @@ class CalendarQuery:
     def _occurrences_between(self, start: Time, end: Time) -> list[Occurrence]:
         """Return the components between the start and the end."""
         occurrences: list[Occurrence] = []
-        for series in self.series:
+        for series in self.series_between(start, end):
             with contextlib.suppress(self._skip_errors):
                 occurrences.extend(series.between(start, end))
         return occurrences
 
+    def _iter_occurrences_between(
+        self, start: Time, end: Time
+    ) -> Generator[Occurrence]:
+        """Yield the occurrences between the start and the end, ordered by series."""
+        for series in self.series_between(start, end):
+            with contextlib.suppress(self._skip_errors):
+                yield from series.between(start, end)
+
     def after(self, earliest_end: DateArgument) -> Generator[Component]:
         """Iterate over components happening during or after earliest_end.
 
@@ -315,7 +590,7 @@ class CalendarQuery:
         """
         earliest_end = self.to_datetime(earliest_end)
         for occurrence in self._after(earliest_end):
-            yield occurrence.as_component(self.keep_recurrence_attributes)
+            yield self._as_component(occurrence)
 
     def occurrences_after(self, earliest_end: DateArgument) -> Generator[Occurrence]:
         """Iterate over :class:`Occurrence` objects happening during or after ``earliest_end``.
@@ -434,6 +709,7 @@ class CalendarQuery:
             size=page_size,
             stop=latest_start,
             keep_recurrence_attributes=self.keep_recurrence_attributes,
+            as_component=self._as_component,
         )
 
     def occurrences_paginate(
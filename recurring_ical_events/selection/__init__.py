@@ -4,10 +4,12 @@ from .alarm import Alarms
 from .all import AllKnownComponents
 from .base import SelectComponents
 from .name import ComponentsWithName
+from .walk import ComponentWalk
 
 __all__ = [
     "Alarms",
     "AllKnownComponents",
+    "ComponentWalk",
     "ComponentsWithName",
     "SelectComponents",
 ]
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+from collections import defaultdict
 from typing import TYPE_CHECKING, Sequence
 
 from recurring_ical_events.adapters.event import EventAdapter
 from recurring_ical_events.adapters.todo import TodoAdapter
 from recurring_ical_events.selection.base import SelectComponents
+from recurring_ical_events.selection.walk import ComponentWalk
 
 if TYPE_CHECKING:
+    from icalendar import Alarm
     from icalendar.cal import Component
 
     from recurring_ical_events.adapters.component import ComponentAdapter
@@ -44,7 +47,12 @@ class Alarms(SelectComponents):
     def collect_parent_series_from(
         self, source: Component, suppress_errors: tuple[Exception]
     ) -> Sequence[Series]:
-        """Collect the parent components of alarms."""
+        """Collect the parent components of alarms.
+
+        If the source is a :class:`ComponentWalk`, the series of the
+        parents are shared with the other selections of the query.
+        """
+        source = ComponentWalk.of(source)
         return [
             s
             for parent in self.parents
@@ -59,8 +67,20 @@ class Alarms(SelectComponents):
         suppress_errors - a list of errors that should be suppressed.
             A Series of events with such an error is removed from all results.
         """
+        return self.alarm_series_of(
+            self.collect_parent_series_from(source, suppress_errors), suppress_errors
+        )
+
+    def alarm_series_of(
+        self, parent_series: Sequence[Series], suppress_errors: tuple[Exception]
+    ) -> Sequence[Series]:
+        """Return the series of the alarms of already collected parent series.
+
+        suppress_errors - a list of errors that should be suppressed.
+        """
         from recurring_ical_events.series.alarm import (
             AbsoluteAlarmSeries,
+            AlarmParents,
             AlarmSeriesRelativeToEnd,
             AlarmSeriesRelativeToStart,
         )
@@ -68,26 +88,60 @@ class Alarms(SelectComponents):
         absolute_alarms = AbsoluteAlarmSeries()
         result = []
         # alarms might be copied several times. We only compute them once.
-        for series in self.collect_parent_series_from(source, suppress_errors):
-            used_alarms = []
+        for series in parent_series:
+            used_alarms = UsedAlarms()
+            parents = AlarmParents(series)
             for component in series.components:
                 for alarm in component.alarms:
                     with contextlib.suppress(suppress_errors):
                         trigger = alarm.TRIGGER
-                        if trigger is None or alarm in used_alarms:
+                        if trigger is None or used_alarms.contains(alarm, trigger):
                             continue
                         if isinstance(trigger, datetime.datetime):
                             absolute_alarms.add(alarm, component)
-                            used_alarms.append(alarm)
+                            used_alarms.add(alarm, trigger)
                         elif alarm.TRIGGER_RELATED == "START":
-                            result.append(AlarmSeriesRelativeToStart(alarm, series))
-                            used_alarms.append(alarm)
+                            result.append(
+                                AlarmSeriesRelativeToStart(alarm, series, parents)
+                            )
+                            used_alarms.add(alarm, trigger)
                         elif alarm.TRIGGER_RELATED == "END":
-                            result.append(AlarmSeriesRelativeToEnd(alarm, series))
-                            used_alarms.append(alarm)
+                            result.append(
+                                AlarmSeriesRelativeToEnd(alarm, series, parents)
+                            )
+                            used_alarms.add(alarm, trigger)
         if not absolute_alarms.is_empty():
             result.append(absolute_alarms)
         return result
 
 
-__all__ = ["Alarms"]
+class UsedAlarms:
+    """The alarms of a series that are already computed.
+
+    Alarms are equal if their content is equal but they cannot be hashed.
+    Equal alarms have the same trigger so only alarms
+    with the same trigger are compared.
+    """
+
+    def __init__(self):
+        """Create an empty collection."""
+        self._ids: set[int] = set()
+        self._by_trigger: dict[datetime.datetime | datetime.timedelta, list[Alarm]] = (
+            defaultdict(list)
+        )
+
+    def contains(
+        self, alarm: Alarm, trigger: datetime.datetime | datetime.timedelta
+    ) -> bool:
+        """Whether the alarm or an equal alarm was added."""
+        if id(alarm) in self._ids:
+            return True
+        return trigger in self._by_trigger and alarm in self._by_trigger[trigger]
+
+    def add(self, alarm: Alarm, trigger: datetime.datetime | datetime.timedelta):
+        """Add an alarm with its trigger."""
+        self._ids.add(id(alarm))
+        self._by_trigger[trigger].append(alarm)
+
+
+__all__ = ["Alarms", "UsedAlarms"]
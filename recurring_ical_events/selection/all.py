@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Sequence
 from recurring_ical_events.occurrence import Occurrence
 from recurring_ical_events.selection.base import SelectComponents
 from recurring_ical_events.selection.name import ComponentsWithName
+from recurring_ical_events.selection.walk import ComponentWalk
 from recurring_ical_events.series import Series
 
 if TYPE_CHECKING:
@@ -50,6 +51,7 @@ class AllKnownComponents(SelectComponents):
         self, source: Component, suppress_errors: tuple[Exception]
     ) -> Sequence[Series]:
         """Collect the components from the source groups into a series."""
+        source = ComponentWalk.of(source)
         result = []
         for name in self.names:
             collector = self._collector(
@@ -12,6 +12,7 @@ from recurring_ical_events.adapters.todo import TodoAdapter
 from recurring_ical_events.occurrence import Occurrence
 from recurring_ical_events.selection.alarm import Alarms
 from recurring_ical_events.selection.base import SelectComponents
+from recurring_ical_events.selection.walk import ComponentWalk
 from recurring_ical_events.series import Series
 from recurring_ical_events.util import cached_property
 
@@ -86,6 +87,23 @@ class ComponentsWithName(SelectComponents):
         """
         if isinstance(self._adapter, SelectComponents):
             return self._adapter.collect_series_from(source, suppress_errors)
+        if isinstance(source, ComponentWalk):
+            key = (
+                type(self),
+                self._name,
+                self._adapter,
+                self._series,
+                tuple(suppress_errors),
+            )
+            return source.series(
+                key, lambda: self._collect_series_from(source, suppress_errors)
+            )
+        return self._collect_series_from(source, suppress_errors)
+
+    def _collect_series_from(
+        self, source: Component, suppress_errors: tuple[Exception]
+    ) -> Sequence[Series]:
+        """Walk the source and group the components into series."""
         components: dict[str, list[Component]] = defaultdict(list)  # UID -> components
         for component in source.walk(self._name):
             adapter = self._adapter(component)
@@ -0,0 +1,86 @@
+"""Walk a calendar once for all selections of a query."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Sequence
+
+from recurring_ical_events.standard import StandardCalendar
+from recurring_ical_events.util import cached_property
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+
+    from recurring_ical_events.series import Series
+
+
+class ComponentWalk:
+    """The components of a calendar grouped by name.
+
+    Each selection walks the calendar for the components it needs.
+    A query with several selections, like
+    ``("VEVENT", "VTODO", "VJOURNAL", "VALARM")``,
+    would walk the calendar several times.
+    This walks the calendar once and can be used like the calendar.
+
+    The series that the selections collect are kept so that
+    other selections, like :class:`Alarms`, use them
+    instead of creating them again.
+    """
+
+    def __init__(self, source: Component):
+        """Walk the source when components are needed."""
+        self.source = source
+        self._series: dict[Hashable, Sequence[Series]] = {}
+
+    @classmethod
+    def of(cls, source: Component | ComponentWalk) -> ComponentWalk:
+        """Return a walk of the source."""
+        return source if isinstance(source, cls) else cls(source)
+
+    @cached_property
+    def _components(self) -> dict[str, list[Component]]:
+        """The components by name in the order of walk()."""
+        if isinstance(self.source, StandardCalendar):
+            components = self.source.walk_unconverted()
+        else:
+            components = self.source.walk()
+        result = defaultdict(list)
+        for component in components:
+            result[component.name].append(component)
+        return result
+
+    def walk(
+        self,
+        name: Optional[str] = None,
+        select: Callable[[Component], bool] = lambda _: True,
+    ) -> list[Component]:
+        """Return the components like :meth:`icalendar.cal.Component.walk`."""
+        if name is None:
+            return self.source.walk(name, select)
+        components = self._components.get(name.upper(), [])
+        if isinstance(self.source, StandardCalendar):
+            components = [
+                self.source.to_standard(component) for component in components
+            ]
+        return [component for component in components if select(component)]
+
+    def series(
+        self, key: Hashable, collect: Callable[[], Sequence[Series]]
+    ) -> list[Series]:
+        """Return the series collected for the key.
+
+        collect is called only for the first selection with this key.
+        """
+        if key not in self._series:
+            self._series[key] = collect()
+        return list(self._series[key])
+
+    def __getattr__(self, name: str) -> Any:
+        """Use the source for everything else."""
+        if name == "source":
+            raise AttributeError(name)
+        return getattr(self.source, name)
+
+
+__all__ = ["ComponentWalk"]
@@ -5,11 +5,12 @@ from .alarm import (
     AlarmSeriesRelativeToEnd,
     AlarmSeriesRelativeToStart,
 )
-from .rrule import Series
+from .rrule import Series, ZoneInfoSeries
 
 __all__ = [
     "AbsoluteAlarmSeries",
     "AlarmSeriesRelativeToEnd",
     "AlarmSeriesRelativeToStart",
     "Series",
+    "ZoneInfoSeries",
 ]
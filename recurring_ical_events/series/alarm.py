@@ -1,30 +1,40 @@
 """Series calculation for alarms."""
 
+from __future__ import annotations
+
 import datetime
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from typing import Generator
-
-from dateutil.rrule import rruleset
-from icalendar import Alarm
+from typing import TYPE_CHECKING, Generator
 
-from recurring_ical_events.adapters.component import ComponentAdapter
 from recurring_ical_events.occurrence import AlarmOccurrence, Occurrence
-from recurring_ical_events.series.rrule import Series
-from recurring_ical_events.types import Time
-from recurring_ical_events.util import convert_to_datetime
+from recurring_ical_events.util import convert_to_datetime, to_epoch
+
+if TYPE_CHECKING:
+    from icalendar import Alarm
+
+    from recurring_ical_events.adapters.component import ComponentAdapter
+    from recurring_ical_events.series.rrule import Series
+    from recurring_ical_events.types import Epoch, Time
 
 
 class AbsoluteAlarmSeries:
-    """A series of absolute alarms."""
+    """A series of absolute alarms.
+
+    The triggers are kept in a sorted array of epochs, see :func:`to_epoch`,
+    with a list of occurrences for each trigger.
+    A span is found by bisection.
+    """
 
     tzinfo = datetime.timezone.utc
 
     def __init__(self):
         """Create a new series of absolute alarms."""
-        self.times = rruleset(cache=True)
         self.times2occurence: dict[datetime.datetime, list[Occurrence]] = defaultdict(
             list
         )
+        self._index: tuple[array[Epoch], list[list[Occurrence]]] | None = None
 
     def add(self, alarm: Alarm, parent: ComponentAdapter):
         """Add an absolute alarm with a parent component."""
@@ -36,8 +46,22 @@ class AbsoluteAlarmSeries:
 
     def _add(self, dt: datetime.datetime, alarm: Alarm, parent: ComponentAdapter):
         """Add an alarm at a specific time."""
-        self.times.rdate(dt)
         self.times2occurence[dt].append(self.occurrence(dt, alarm, parent))
+        self._index = None
+
+    @property
+    def index(self) -> tuple[array[Epoch], list[list[Occurrence]]]:
+        """The sorted epochs of the triggers and the occurrences at each."""
+        if self._index is None:
+            occurrences: dict[Epoch, list[Occurrence]] = defaultdict(list)
+            for dt, occurrences_at_dt in self.times2occurence.items():
+                occurrences[to_epoch(dt)].extend(occurrences_at_dt)
+            epochs = sorted(occurrences)
+            self._index = (
+                array("q", epochs),
+                [occurrences[epoch] for epoch in epochs],
+            )
+        return self._index
 
     def between(
         self, span_start: Time, span_stop: Time
@@ -48,11 +72,21 @@ class AbsoluteAlarmSeries:
         """
         span_start_dt = convert_to_datetime(span_start, self.tzinfo)
         span_stop_dt = convert_to_datetime(span_stop, self.tzinfo)
-        for dt in self.times.between(span_start_dt, span_stop_dt, inc=True):
-            for occurrence in self.times2occurence[dt]:
+        epochs, occurrences = self.index
+        first = bisect_left(epochs, to_epoch(span_start_dt))
+        last = bisect_right(epochs, to_epoch(span_stop_dt))
+        for index in range(first, last):
+            for occurrence in occurrences[index]:
                 if occurrence.is_in_span(span_start_dt, span_stop_dt):
                     yield occurrence
 
+    def times_between(
+        self, span_start: Time, span_stop: Time
+    ) -> Generator[tuple[Time, Time], None, None]:
+        """The start and end of the occurrences of :meth:`between`."""
+        for occurrence in self.between(span_start, span_stop):
+            yield occurrence.start, occurrence.end
+
     def occurrence(
         self, dt: datetime.datetime, alarm: Alarm, parent: ComponentAdapter
     ) -> Occurrence:
@@ -64,16 +98,68 @@ class AbsoluteAlarmSeries:
         return not self.times2occurence
 
 
+class AlarmParents:
+    """The occurrences of a series for all of its relative alarms.
+
+    The alarms of a series have different offsets to their parent.
+    The series is expanded once for a span so that its occurrences
+    cover the offsets of all the alarms.
+    """
+
+    def __init__(self, series: Series) -> None:
+        """Create the parents of the alarms of a series."""
+        self.series = series
+        self.min_offset = datetime.timedelta(0)
+        self.max_offset = datetime.timedelta(0)
+        # The last span and its occurrences are replaced together
+        # so that other threads see either the old or the new ones.
+        self._last: tuple[tuple[Time, Time] | None, list[Occurrence]] = (None, [])
+
+    def add_offsets(self, offsets: list[datetime.timedelta]):
+        """Cover the offsets of an alarm."""
+        self.min_offset = min(self.min_offset, *offsets)
+        self.max_offset = max(self.max_offset, *offsets)
+        self._last = (None, [])
+
+    def between(self, span_start: Time, span_stop: Time) -> list[Occurrence]:
+        """The occurrences of the series for the alarms in the span.
+
+        The last result is kept so that all alarms use it.
+        """
+        span = (span_start, span_stop)
+        last_span, occurrences = self._last
+        if span != last_span:
+            # The alarms relative to the end need one second more.
+            occurrences = list(
+                self.series.between(
+                    span_start - self.max_offset - datetime.timedelta(seconds=1),
+                    span_stop - self.min_offset,
+                )
+            )
+            self._last = (span, occurrences)
+        return occurrences
+
+
 class AlarmSeriesRelativeToStart:
     """A series of alarms relative to the start of a component."""
 
-    def __init__(self, alarm: Alarm, series: Series) -> None:
-        """Create a series of alarms that are relative to the start of a series."""
+    # The span is moved this much earlier to find the alarms.
+    span_start_adjustment = datetime.timedelta(0)
+
+    def __init__(
+        self, alarm: Alarm, series: Series, parents: AlarmParents | None = None
+    ) -> None:
+        """Create a series of alarms that are relative to the start of a series.
+
+        parents - the occurrences of the series shared by its alarms
+        """
         self._alarm = alarm
         self._series = series
         self._offsets: list[datetime.timedelta] = [alarm.TRIGGER]
         for _ in range(alarm.REPEAT):
             self._offsets.append(self._offsets[-1] + alarm.DURATION)
+        self._parents = AlarmParents(series) if parents is None else parents
+        self._parents.add_offsets(self._offsets)
 
     def between(
         self, span_start: Time, span_stop: Time
@@ -82,15 +168,27 @@ class AlarmSeriesRelativeToStart:
 
         The result does not need to be ordered.
         """
-        # TODO: Reduce time span to reduce occurrences
-        for offset in self._offsets:
-            # If we are before the event start (negative offset),
-            # we have to add the time span to request the event later.
-            for parent in self._series.between(span_start - offset, span_stop - offset):
-                if parent.has_alarm(self._alarm):
-                    occurrence = self.occurrence(offset, self._alarm, parent)
-                    if occurrence.is_in_span(span_start, span_stop):
-                        yield occurrence
+        alarm = self._alarm
+        parents = self._parents.between(span_start, span_stop)
+        span_start -= self.span_start_adjustment
+        for parent in parents:
+            if not parent.has_alarm(alarm):
+                continue
+            for offset in self._offsets:
+                # If we are before the event start (negative offset),
+                # the event is later.
+                if not parent.is_in_span(span_start - offset, span_stop - offset):
+                    continue
+                occurrence = self.occurrence(offset, alarm, parent)
+                if occurrence.is_in_span(span_start, span_stop):
+                    yield occurrence
+
+    def times_between(
+        self, span_start: Time, span_stop: Time
+    ) -> Generator[tuple[Time, Time], None, None]:
+        """The start and end of the occurrences of :meth:`between`."""
+        for occurrence in self.between(span_start, span_stop):
+            yield occurrence.start, occurrence.end
 
     def occurrence(
         self, offset: datetime.timedelta, alarm: Alarm, parent: Occurrence
@@ -110,13 +208,8 @@ class AlarmSeriesRelativeToStart:
 class AlarmSeriesRelativeToEnd(AlarmSeriesRelativeToStart):
     """A series of alarms relative to the start of a component."""
 
-    def between(self, span_start, span_stop):
-        """Components between the start (inclusive) and end (exclusive).
-
-        The result does not need to be ordered.
-        """
-        # The end is exclusive. We must adjust the timespan to include it.
-        return super().between(span_start - datetime.timedelta(seconds=1), span_stop)
+    # The end is exclusive. We must adjust the timespan to include it.
+    span_start_adjustment = datetime.timedelta(seconds=1)
 
     def occurrence(
         self, offset: datetime.timedelta, alarm: Alarm, parent: Occurrence
@@ -127,6 +220,7 @@ class AlarmSeriesRelativeToEnd(AlarmSeriesRelativeToStart):
 
 __all__ = [
     "AbsoluteAlarmSeries",
+    "AlarmParents",
     "AlarmSeriesRelativeToEnd",
     "AlarmSeriesRelativeToStart",
 ]
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Generator, Sequence
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Generator, Iterable, Sequence
 
 from dateutil.rrule import rrule, rruleset, rrulestr
 from icalendar.prop import vDDDTypes
@@ -11,23 +12,153 @@ from icalendar.prop import vDDDTypes
 from recurring_ical_events.constants import NEGATIVE_RRULE_COUNT_REGEX
 from recurring_ical_events.errors import BadRuleStringFormat
 from recurring_ical_events.occurrence import Occurrence
+from recurring_ical_events.timezones import TIMEZONE_REGISTRY
 from recurring_ical_events.util import (
+    EPOCH,
+    EPOCH_ORDINAL,
+    EPOCH_UTC,
+    SECONDS_PER_DAY,
+    cached_property,
     compare_greater,
     convert_to_date,
     convert_to_date_range,
     convert_to_datetime,
     get_any,
+    has_timezone,
     is_date,
+    is_datetime,
     is_pytz,
     is_pytz_dt,
+    is_utc,
     normalize_pytz,
-    to_recurrence_ids,
+    pytz_to_zoneinfo,
+    time_span_contains_event,
+    to_epoch,
+    to_recurrence_epochs,
     with_highest_sequence,
 )
 
 if TYPE_CHECKING:
     from recurring_ical_events.adapters.component import ComponentAdapter
-    from recurring_ical_events.types import RecurrenceID, Time
+    from recurring_ical_events.timezones import TransitionTable
+    from recurring_ical_events.types import Epoch, RecurrenceEpochs, Time
+
+
+class ModificationIndex:
+    """Modifications sorted by their start to find those within a time span.
+
+    Floating times and dates are compared in the timezone of the query span.
+    Their epoch can thus be off by the largest UTC offset which is why
+    we look a bit further than the span.
+    """
+
+    PADDING: Epoch = SECONDS_PER_DAY
+
+    def __init__(self, modifications: Iterable[ComponentAdapter]):
+        """Index the modifications."""
+        entries = sorted(
+            (
+                (to_epoch(modification.start), to_epoch(modification.end), modification)
+                for modification in modifications
+            ),
+            key=lambda entry: entry[0],
+        )
+        self.starts: list[Epoch] = [entry[0] for entry in entries]
+        self.modifications: list[ComponentAdapter] = [entry[2] for entry in entries]
+        self.longest: Epoch = max((end - start for start, end, _ in entries), default=0)
+
+    def between(self, span_start: Time, span_stop: Time) -> list[ComponentAdapter]:
+        """Return the modifications that might be in the span.
+
+        The result includes all modifications in the span
+        and a few more that need to be checked.
+        """
+        first = to_epoch(span_start) - self.PADDING - self.longest
+        last = to_epoch(span_stop) + self.PADDING
+        return self.modifications[
+            bisect_left(self.starts, first) : bisect_right(self.starts, last)
+        ]
+
+    def __len__(self) -> int:
+        """The number of modifications in the index."""
+        return len(self.starts)
+
+
+def to_seconds(delta: datetime.timedelta) -> Epoch:
+    """Return the timedelta in whole seconds."""
+    return delta.days * SECONDS_PER_DAY + delta.seconds
+
+
+class Segment:
+    """A part of a series that is calculated from the same component.
+
+    The core starts the first segment.
+    Each modification with RANGE=THISANDFUTURE starts a new segment.
+    A recurrence belongs to a segment if its recurrence id is
+    after the start and not after the stop of the segment.
+    """
+
+    def __init__(
+        self,
+        component: ComponentAdapter,
+        start: Epoch | None = None,
+        stop: Epoch | None = None,
+        periods: Sequence[tuple[Time, datetime.timedelta]] = (),
+    ):
+        """Create a segment from start (exclusive) to stop (inclusive).
+
+        None means that the segment is not bounded.
+        periods are the RDATEs with a PERIOD as (start, duration).
+        """
+        self.component = component
+        self.start = start
+        self.stop = stop
+        self.move_recurrences_by = component.move_recurrences_by
+        self.duration = component.duration
+        self.extend_query_span_by = component.extend_query_span_by
+        subtract_from_start, add_to_stop = self.extend_query_span_by
+        self._subtract_from_start = to_seconds(subtract_from_start)
+        self._add_to_stop = to_seconds(add_to_stop)
+        # RDATEs with a PERIOD can last longer than the component.
+        # We do not extend the span for every query to find them.
+        # Instead, we check them on their own.
+        move_recurrences_by = to_seconds(self.move_recurrences_by)
+        self.long_periods: list[tuple[Time, Epoch, Epoch]] = [
+            (
+                period_start,
+                to_epoch(period_start) + move_recurrences_by,
+                to_epoch(period_start) + move_recurrences_by + to_seconds(duration),
+            )
+            for period_start, duration in periods
+            if duration > self.duration and self.contains(to_epoch(period_start))
+        ]
+
+    def long_periods_between(
+        self, span_start: Epoch, span_stop: Epoch
+    ) -> Generator[Time]:
+        """Yield the recurrences of long periods that can be in the span."""
+        for recurrence, occurrence_start, occurrence_end in self.long_periods:
+            if occurrence_start <= span_stop and span_start <= occurrence_end:
+                yield recurrence
+
+    def contains(self, recurrence_id: Epoch) -> bool:
+        """Whether the recurrence belongs to this segment."""
+        return (self.start is None or self.start < recurrence_id) and (
+            self.stop is None or recurrence_id <= self.stop
+        )
+
+    def intersects(self, span_start: Epoch, span_stop: Epoch) -> bool:
+        """Whether occurrences of this segment can be in the span."""
+        return (
+            self.stop is None or span_start - self._subtract_from_start <= self.stop
+        ) and (self.start is None or self.start < span_stop + self._add_to_stop)
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        return (
+            f"<{self.__class__.__name__} from {self.start} to {self.stop} "
+            f"of {self.component}>"
+        )
 
 
 class Series:
@@ -37,7 +168,7 @@ class Series:
         self,
         adapter: ComponentAdapter,
         start: Time | None = None,
-        end: Time | None | datetime.timedelta = None,
+        end: Time | datetime.timedelta | None = None,
     ) -> Occurrence:
         """A way to override the occurrence class."""
         return Occurrence(adapter, start, end, sequence=self.sequence)
@@ -45,10 +176,11 @@ class Series:
     class NoRecurrence:
         """A strategy to deal with not having a core with rrules."""
 
-        check_exdates_datetime: set[RecurrenceID] = set()
-        check_exdates_date: set[datetime.date] = set()
-        replace_ends: dict[RecurrenceID, Time] = {}
+        check_exdates: set[Epoch] = set()
+        check_exdates_date: set[int] = set()
+        replace_ends: dict[Epoch, datetime.timedelta] = {}
         sequence = -1
+        tzinfo = None
 
         def as_occurrence(
             self,
@@ -79,6 +211,8 @@ class Series:
         """A strategy if we have an actual core with recurrences."""
 
         has_core = True
+        # Whether the occurrences are in the span if their epochs are.
+        exact_span_check = False
 
         @property
         def sequence(self) -> int:
@@ -91,28 +225,31 @@ class Series:
             self.start = self.original_start = self.core.start
             self.end = self.original_end = self.core.end
             self.exdates: set[Time] = set()
-            self.check_exdates_datetime: set[RecurrenceID] = set()  # should be in UTC
-            self.check_exdates_date: set[datetime.date] = set()  # should be in UTC
+            self.check_exdates: set[Epoch] = set()  # see to_recurrence_epochs()
+            self.check_exdates_date: set[int] = set()  # proleptic ordinals
             self.rdates: set[Time] = set()
             self.replace_ends: dict[
-                RecurrenceID, datetime.timedelta
-            ] = {}  # for periods, in UTC
+                Epoch, datetime.timedelta
+            ] = {}  # for periods, see to_recurrence_epochs()
+            self.periods: list[tuple[Time, datetime.timedelta]] = []
             # fill the attributes
             for exdate in self.core.exdates:
                 self.exdates.add(exdate)
-                self.check_exdates_datetime.update(to_recurrence_ids(exdate))
+                self.check_exdates.update(to_recurrence_epochs(exdate))
                 if is_date(exdate):
-                    self.check_exdates_date.add(exdate)
+                    self.check_exdates_date.add(exdate.toordinal())
             for rdate in self.core.rdates:
                 if isinstance(rdate, tuple):
                     # we have a period as rdate
                     self.rdates.add(rdate[0])
-                    for recurrence_id in to_recurrence_ids(rdate[0]):
-                        self.replace_ends[recurrence_id] = (
-                            rdate[1]
-                            if isinstance(rdate[1], datetime.timedelta)
-                            else rdate[1] - rdate[0]
-                        )
+                    duration = (
+                        rdate[1]
+                        if isinstance(rdate[1], datetime.timedelta)
+                        else rdate[1] - rdate[0]
+                    )
+                    self.periods.append((rdate[0], duration))
+                    for recurrence_id in to_recurrence_epochs(rdate[0]):
+                        self.replace_ends[recurrence_id] = duration
                 else:
                     # we have a date/datetime
                     self.rdates.add(rdate)
@@ -137,9 +274,13 @@ class Series:
                     last_until = rule.until
 
             for exdate in self.exdates:
-                self.check_exdates_datetime.add(exdate)
+                self.check_exdates.update(to_recurrence_epochs(exdate))
             for rdate in self.rdates:
                 rule_set.rdate(rdate)
+            self.periods = [
+                (convert_to_datetime(start, self.tzinfo), duration)
+                for start, duration in self.periods
+            ]
 
             if not last_until or not compare_greater(self.start, last_until):
                 rule_set.rdate(self.start)
@@ -209,7 +350,7 @@ class Series:
                 rule.until = until
             return rule
 
-        def _get_rrule_until(self, rrule) -> None | Time:
+        def _get_rrule_until(self, rrule) -> Time | None:
             """Return the UNTIL datetime of the rrule or None if absent."""
             rule_list = rrule.string.split(";UNTIL=")
             if len(rule_list) == 1:
@@ -277,6 +418,40 @@ class Series:
                     if rule.until is None or not compare_greater(start, rule.until):
                         yield start
 
+        def epoch_span(self, span_start: Time, span_stop: Time) -> tuple[Epoch, Epoch]:
+            """Convert the query span to epochs comparable to the occurrences.
+
+            The span is interpreted in the timezone of this series
+            just like make_comparable() would do.
+            """
+            return self.span_epoch(span_start), self.span_epoch(span_stop)
+
+        @cached_property
+        def transitions(self) -> TransitionTable | None:
+            """The compiled timezone of this series, shared with other series."""
+            return None if self.tzinfo is None else TIMEZONE_REGISTRY.get(self.tzinfo)
+
+        def span_epoch(self, time: Time) -> Epoch:
+            """Convert a time of the query span to an epoch in our timezone."""
+            if self.tzinfo is not None and not has_timezone(time):
+                # The wall clock time is converted without the tzinfo.
+                utc = self.transitions.to_utc(to_epoch(time))
+                if utc is not None:
+                    return utc
+            return to_epoch(convert_to_datetime(time, self.tzinfo))
+
+        def recurrence_epochs(self, time: Time) -> RecurrenceEpochs:
+            """The recurrence ids of a recurrence, see to_recurrence_epochs()."""
+            return to_recurrence_epochs(time)
+
+        def from_epoch(self, epoch: Epoch) -> datetime.datetime:
+            """Return a time that has the epoch, see to_epoch()."""
+            start = EPOCH if self.tzinfo is None else EPOCH_UTC
+            return start + datetime.timedelta(seconds=epoch)
+
+        to_epoch = staticmethod(to_epoch)
+        normalize = staticmethod(normalize_pytz)
+
         def convert_to_original_type(self, date):
             """Convert a date back if this is possible.
 
@@ -294,6 +469,13 @@ class Series:
                 return convert_to_date(date)
             return date
 
+        def as_times(self, start: Time, stop: Time) -> tuple[Time, Time]:
+            """Return the start and stop of an occurrence."""
+            return (
+                self.convert_to_original_type(start),
+                self.convert_to_original_type(stop),
+            )
+
         def as_occurrence(
             self,
             start: Time,
@@ -302,33 +484,80 @@ class Series:
             core: ComponentAdapter,
         ) -> Occurrence:
             """Return this as an occurrence at a specific time."""
-            return occurrence(
-                core,
-                self.convert_to_original_type(start),
-                self.convert_to_original_type(stop),
-            )
+            return occurrence(core, *self.as_times(start, stop))
 
         @property
         def components(self) -> list[ComponentAdapter]:
             """The components in this recurrence calculation."""
             return [self.core]
 
+    class UTCRecurrenceRules(RecurrenceRules):
+        """The recurrence rules of a series in UTC or floating time.
+
+        The wall clock time is the same as UTC.
+        The times need no localization or normalization
+        and a recurrence is identified by one epoch.
+        The occurrences have the type of the core's start,
+        so comparing their epochs with the span is enough.
+        """
+
+        exact_span_check = True
+
+        @staticmethod
+        def normalize(time: Time) -> Time:
+            """There is nothing to normalize."""
+            return time
+
+        def recurrence_epochs(self, time: Time) -> RecurrenceEpochs:
+            """The wall clock time is the same as the time in UTC."""
+            return (self.to_epoch(time),)
+
+        def rrule_between(self, span_start: Time, span_stop: Time) -> Generator[Time]:
+            """Calculate the rrules without a timezone to correct."""
+            span_start_dt = convert_to_datetime(span_start, self.tzinfo)
+            span_stop_dt = convert_to_datetime(span_stop, self.tzinfo)
+            for rule in self.rrules:
+                until = (
+                    None
+                    if rule.until is None
+                    else convert_to_datetime(rule.until, self.tzinfo)
+                )
+                for start in rule.between(span_start_dt, span_stop_dt, inc=True):
+                    if until is None or start <= until:
+                        yield start
+
+    class AllDayRecurrenceRules(UTCRecurrenceRules):
+        """The recurrence rules of a series that only has dates.
+
+        The recurrences are counted in days with their proleptic ordinal.
+        The occurrences are dates.
+        """
+
+        @staticmethod
+        def to_epoch(time: Time) -> Epoch:
+            """The epoch of the day, see to_epoch()."""
+            return (time.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+        def as_times(self, start: Time, stop: Time) -> tuple[Time, Time]:
+            """Return the days of an occurrence."""
+            return start.date(), stop.date()
+
     def __init__(self, components: Sequence[ComponentAdapter]):
         """Create an component which may have repetitions in it."""
         if len(components) == 0:
             raise ValueError("No components given to calculate a series.")
-        # We identify recurrences with a timestamp as all recurrence values
+        # We identify recurrences with an integer epoch as all recurrence values
         # should be the same in UTC either way and we want to omit
         # inequality because of timezone implementation mismatches.
         self.recurrence_id_to_modification: dict[
-            RecurrenceID, ComponentAdapter
-        ] = {}  # RECURRENCE-ID -> adapter
-        self.this_and_future = []
+            Epoch, ComponentAdapter
+        ] = {}  # RECURRENCE-ID -> adapter, see to_recurrence_epochs()
+        self.this_and_future: list[Epoch] = []
         self._uid = components[0].uid
         core: ComponentAdapter | None = None
         for component in components:
             if component.is_modification():
-                recurrence_ids = component.recurrence_ids
+                recurrence_ids = component.recurrence_epochs
                 for recurrence_id in recurrence_ids:
                     self.recurrence_id_to_modification[recurrence_id] = (
                         with_highest_sequence(
@@ -344,24 +573,88 @@ class Series:
             self.recurrence_id_to_modification.values()
         )
         del component
-        self.recurrence = (
-            self.NoRecurrence() if core is None else self.RecurrenceRules(core)
-        )
+        self.recurrence = self.create_recurrence(core, components)
         self.this_and_future.sort()
         self.sequence = max(component.sequence for component in self.components)
-        self.compute_span_extension()
+        self.compute_segments()
+        # Measure how many recurrences we calculate to find the occurrences.
+        # This includes the recurrences that other segments are responsible for.
+        self.generated_candidates = 0
+        # The modifications that the index returns for the query spans
+        self.checked_modifications = 0
+        self.yielded_occurrences = 0
+
+    def create_recurrence(
+        self, core: ComponentAdapter | None, components: Sequence[ComponentAdapter]
+    ) -> RecurrenceRules | NoRecurrence:
+        """Choose the strategy to calculate the recurrences of the core.
+
+        Series with only dates and series in UTC or floating time
+        do not need any timezone calculation.
+        """
+        if core is None:
+            return self.NoRecurrence()
+        times = [core.start, core.end, *core.exdates]
+        for rdate in core.rdates:
+            times.extend(rdate if isinstance(rdate, tuple) else (rdate,))
+        for component in components:
+            times.extend((component.start, component.end))
+        times = [time for time in times if not isinstance(time, datetime.timedelta)]
+        if not any(is_datetime(time) for time in times):
+            return self.AllDayRecurrenceRules(core)
+        if (
+            is_datetime(core.start)
+            and is_datetime(core.end)
+            and all(
+                is_date(time) or time.tzinfo is None or is_utc(time.tzinfo)
+                for time in times
+            )
+        ):
+            return self.UTCRecurrenceRules(core)
+        return self.RecurrenceRules(core)
+
+    @cached_property
+    def modification_occurrences(self) -> dict[ComponentAdapter, Occurrence]:
+        """The occurrences of the modifications.
+
+        These do not change and are only created once.
+        """
+        return {
+            modification: self.occurrence(modification)
+            for modification in self.modifications
+        }
+
+    @cached_property
+    def modification_index(self) -> ModificationIndex:
+        """The modifications that are not excluded, sorted by their start.
 
-    def compute_span_extension(self):
-        """Compute how much to extend the span for the rrule to cover all events."""
-        self._subtract_from_start, self._add_to_stop = (
-            self.recurrence.extend_query_span_by
+        Whether a modification is excluded does not depend on the query.
+        This is computed once for the whole series.
+        """
+        check_exdates = self.recurrence.check_exdates
+        return ModificationIndex(
+            modification
+            for modification in self.modifications
+            if check_exdates.isdisjoint(modification.recurrence_epochs)
+            and not self.skip_core_modification(modification)
         )
-        for adapter in self.this_and_future_components:
-            subtract_from_start, add_to_stop = adapter.extend_query_span_by
-            self._subtract_from_start = max(
-                subtract_from_start, self._subtract_from_start
+
+    def compute_segments(self):
+        """Split the series into segments, one for each RANGE=THISANDFUTURE.
+
+        Each segment knows how much to extend the span for the rrule
+        to cover its events.
+        """
+        self.segments: list[Segment] = []
+        if not self.recurrence.has_core:
+            return
+        boundaries = [None, *self.this_and_future, None]
+        for component, start, stop in zip(
+            self.this_and_future_components, boundaries, boundaries[1:]
+        ):
+            self.segments.append(
+                Segment(component, start, stop, self.recurrence.periods)
             )
-            self._add_to_stop = max(add_to_stop, self._add_to_stop)
 
     @property
     def components(self) -> list[ComponentAdapter]:
@@ -381,90 +674,200 @@ class Series:
             yield self.recurrence_id_to_modification[recurrence_id]
 
     def get_component_for_recurrence_id(
-        self, recurrence_id: RecurrenceID
+        self, recurrence_id: Epoch | datetime.datetime
     ) -> ComponentAdapter:
         """Get the component which contains all information for the recurrence id.
 
         This concerns this modifications that have RANGE=THISANDFUTURE set.
+        The recurrence id is an epoch, see to_recurrence_epochs().
+        A datetime in UTC without tzinfo is accepted, too.
         """
+        if isinstance(recurrence_id, datetime.datetime):
+            recurrence_id = to_epoch(recurrence_id)
+        return self.get_segment_for_recurrence_id(recurrence_id).component
+
+    def get_segment_for_recurrence_id(self, recurrence_id: Epoch) -> Segment:
+        """Get the segment that the recurrence id belongs to."""
         # We assume the the recurrence_id is of the correct timezone.
-        component = self.recurrence.core
-        for modification_id in self.this_and_future:
-            if modification_id < recurrence_id:
-                component = self.recurrence_id_to_modification[modification_id]
-            else:
-                break
-        return component
+        return self.segments[bisect_left(self.this_and_future, recurrence_id)]
+
+    def segments_between(
+        self, span_start: Time, span_stop: Time
+    ) -> Generator[tuple[Segment, Time]]:
+        """Yield the recurrences with the segment they belong to.
+
+        Only the segments that can have occurrences in the span are calculated.
+        Each segment extends the span by its own amount.
+        """
+        if not self.segments:
+            return
+        # With only one segment, we do not need to check the boundaries.
+        check_bounds = len(self.segments) > 1
+        # The span is converted to epochs only if we compare it.
+        if check_bounds or any(segment.long_periods for segment in self.segments):
+            span_start_epoch, span_stop_epoch = self.recurrence.epoch_span(
+                span_start, span_stop
+            )
+        for segment in self.segments:
+            if segment.long_periods:
+                for start in segment.long_periods_between(
+                    span_start_epoch, span_stop_epoch
+                ):
+                    self.generated_candidates += 1
+                    yield segment, start
+            if check_bounds and not segment.intersects(
+                span_start_epoch, span_stop_epoch
+            ):
+                continue
+            for start in self._rrule_between(segment, span_start, span_stop):
+                if not check_bounds or segment.contains(
+                    self.recurrence.to_epoch(start)
+                ):
+                    yield segment, start
+
+    def _rrule_between(
+        self, segment: Segment, span_start: Time, span_stop: Time
+    ) -> Generator[Time]:
+        """Modify the rrule generation span for the segment and yield recurrences.
+
+        The span is clipped to the bounds of the segment so that
+        each segment only calculates its own recurrences.
+        """
+        recurrence = self.recurrence
+        subtract_from_start, add_to_stop = segment.extend_query_span_by
+        expanded_start = normalize_pytz(span_start - subtract_from_start)
+        expanded_stop = normalize_pytz(span_stop + add_to_stop)
+        if (
+            segment.start is not None
+            and recurrence.span_epoch(expanded_start) < segment.start
+        ):
+            expanded_start = recurrence.from_epoch(segment.start)
+        if segment.stop is not None and segment.stop < recurrence.span_epoch(
+            expanded_stop
+        ):
+            expanded_stop = recurrence.from_epoch(segment.stop)
+        for start in recurrence.rrule_between(expanded_start, expanded_stop):
+            self.generated_candidates += 1
+            yield start
 
     def rrule_between(self, span_start: Time, span_stop: Time) -> Generator[Time]:
         """Modify the rrule generation span and yield recurrences."""
-        expanded_start = normalize_pytz(span_start - self._subtract_from_start)
-        expanded_stop = normalize_pytz(span_stop + self._add_to_stop)
-        yield from self.recurrence.rrule_between(
-            expanded_start,
-            expanded_stop,
-        )
+        for _, start in self.segments_between(span_start, span_stop):
+            yield start
 
     def between(self, span_start: Time, span_stop: Time) -> Generator[Occurrence]:
         """Components between the start (inclusive) and end (exclusive).
 
         The result does not need to be ordered.
         """
-        returned_starts: set[Time] = set()
+        modification_occurrences = self.modification_occurrences
+        for component, start, end in self._between(span_start, span_stop):
+            if start is None:
+                yield modification_occurrences[component]
+            else:
+                yield self.occurrence(component, start, end)
+
+    def times_between(
+        self, span_start: Time, span_stop: Time
+    ) -> Generator[tuple[Time, Time]]:
+        """The start and end of the occurrences of :meth:`between`.
+
+        This does not create occurrences.
+        """
+        modification_occurrences = self.modification_occurrences
+        for component, start, end in self._between(span_start, span_stop):
+            if start is None:
+                occurrence = modification_occurrences[component]
+                yield occurrence.start, occurrence.end
+            else:
+                yield start, end
+
+    def _between(
+        self, span_start: Time, span_stop: Time
+    ) -> Generator[tuple[ComponentAdapter, Time | None, Time | None]]:
+        """Yield the component, start and end of each occurrence in the span.
+
+        The start and end of modifications are None.
+        Their occurrences are in :attr:`modification_occurrences`.
+        """
+        returned_starts: set[Epoch] = set()
         returned_modifications: set[ComponentAdapter] = set()
+        recurrence = self.recurrence
+        check_exdates = recurrence.check_exdates
+        check_exdates_date = recurrence.check_exdates_date
+        epoch_span = None
         # NOTE: If in the following line, we get an error, datetime and date
         # may still be mixed because RDATE, EXDATE, start and rule.
-        for start in self.rrule_between(span_start, span_stop):
-            recurrence_ids = to_recurrence_ids(start)
+        for segment, start in self.segments_between(span_start, span_stop):
+            recurrence_ids = recurrence.recurrence_epochs(start)
             if (
-                start in returned_starts
-                or convert_to_date(start) in self.recurrence.check_exdates_date
-                or self.recurrence.check_exdates_datetime & set(recurrence_ids)
+                recurrence_ids[0] in returned_starts
+                or start.toordinal() in check_exdates_date
+                or not check_exdates.isdisjoint(recurrence_ids)
             ):
                 continue
             adapter: ComponentAdapter = get_any(
-                self.recurrence_id_to_modification, recurrence_ids, self.recurrence.core
+                self.recurrence_id_to_modification, recurrence_ids, recurrence.core
             )
-            if adapter is self.recurrence.core:
+            if adapter is recurrence.core:
                 # We have no modification for this recurrence, so we record the date
-                returned_starts.add(start)
+                returned_starts.add(recurrence_ids[0])
                 # This component is the base for this occurrence.
                 # It usually is the core. However, we may also find a modification
                 # with RANGE=THISANDFUTURE.
-                component = self.get_component_for_recurrence_id(recurrence_ids[0])
-                occurrence_start = normalize_pytz(start + component.move_recurrences_by)
+                component = segment.component
+                occurrence_start = recurrence.normalize(
+                    start + segment.move_recurrences_by
+                )
                 # Consider the RDATE with a PERIOD value
-                occurrence_end = normalize_pytz(
+                occurrence_end = recurrence.normalize(
                     occurrence_start
                     + get_any(
-                        self.recurrence.replace_ends,
+                        recurrence.replace_ends,
                         recurrence_ids,
-                        component.duration,
+                        segment.duration,
                     )
                 )
-                occurrence = self.recurrence.as_occurrence(
-                    occurrence_start, occurrence_end, self.occurrence, component
+                # The start and end are in the timezone of the series.
+                # We can compare them as integers.
+                if epoch_span is None:
+                    epoch_span = recurrence.epoch_span(span_start, span_stop)
+                start_epoch = recurrence.to_epoch(occurrence_start)
+                end_epoch = recurrence.to_epoch(occurrence_end)
+                checked = start_epoch <= end_epoch and epoch_span[0] <= epoch_span[1]
+                if checked and not time_span_contains_event(
+                    *epoch_span, start_epoch, end_epoch, comparable=True
+                ):
+                    continue
+                occurrence_start, occurrence_end = recurrence.as_times(
+                    occurrence_start, occurrence_end
                 )
+                if (
+                    checked and recurrence.exact_span_check
+                ) or time_span_contains_event(
+                    span_start, span_stop, occurrence_start, occurrence_end
+                ):
+                    self.yielded_occurrences += 1
+                    yield component, occurrence_start, occurrence_end
             else:
                 # We found a modification, so we record the modification
                 if adapter in returned_modifications:
                     continue
                 returned_modifications.add(adapter)
-                occurrence = self.occurrence(adapter)
-            if occurrence.is_in_span(span_start, span_stop):
-                yield occurrence
-        for modification in self.modifications:
+                if self.modification_occurrences[adapter].is_in_span(
+                    span_start, span_stop
+                ):
+                    self.yielded_occurrences += 1
+                    yield adapter, None, None
+        for modification in self.modification_index.between(span_start, span_stop):
             # we assume that the modifications are actually included
-            if (
-                modification in returned_modifications
-                or self.recurrence.check_exdates_datetime
-                & set(modification.recurrence_ids)
-                or self.skip_core_modification(modification)
-            ):
+            self.checked_modifications += 1
+            if modification in returned_modifications:
                 continue
             if modification.is_in_span(span_start, span_stop):
                 returned_modifications.add(modification)
-                yield self.occurrence(modification)
+                self.yielded_occurrences += 1
+                yield modification, None, None
 
     def skip_core_modification(self, modification: ComponentAdapter) -> bool:
         """Wether to skip this occurrence.
@@ -482,18 +885,17 @@ class Series:
 
     def has_recurrence_id_in_rrule(self, modification: ComponentAdapter) -> bool:
         """Wether this occurrence ID is part of the RRULE."""
-        modification_recurrence_ids = modification.recurrence_ids
+        modification_recurrence_ids = modification.recurrence_epochs
         if not modification_recurrence_ids:
             return False
-        span_start, span_stop = convert_to_date_range(modification_recurrence_ids[0])
+        span_start, span_stop = convert_to_date_range(modification.recurrence_ids[0])
         for start in self.rrule_between(span_start, span_stop):
-            start_recurrence_ids = to_recurrence_ids(start)
-            if (
-                convert_to_date(start) in self.recurrence.check_exdates_date
-                or self.recurrence.check_exdates_datetime & set(start_recurrence_ids)
+            start_recurrence_ids = to_recurrence_epochs(start)
+            if start.toordinal() in self.recurrence.check_exdates_date or not (
+                self.recurrence.check_exdates.isdisjoint(start_recurrence_ids)
             ):
                 continue
-            if set(start_recurrence_ids) & set(modification_recurrence_ids):
+            if not set(start_recurrence_ids).isdisjoint(modification_recurrence_ids):
                 return False
         return True
 
@@ -510,4 +912,51 @@ class Series:
         )
 
 
-___all__ = ["Series"]
+class ZoneInfoSeries(Series):
+    """A series that calculates times with pytz timezones in zoneinfo.
+
+    pytz requires the query span to be padded and every occurrence to be
+    localized and normalized. This series converts the times of the
+    components to the same timezones in zoneinfo once, when it is created.
+    Occurrences then have zoneinfo timezones.
+    Custom timezones that zoneinfo does not know stay as they are.
+
+    Example:
+
+        .. code-block:: python
+
+            from recurring_ical_events import ComponentsWithName, ZoneInfoSeries, of
+
+            events = ComponentsWithName("VEVENT", series=ZoneInfoSeries)
+            query = of(calendar, components=[events])
+    """
+
+    class RecurrenceRules(Series.RecurrenceRules):
+        """Recurrence rules calculated with zoneinfo instead of pytz."""
+
+        def make_all_dates_comparable(self):
+            """Convert pytz timezones to zoneinfo before making them comparable."""
+            self.start = pytz_to_zoneinfo(self.start)
+            self.end = pytz_to_zoneinfo(self.end)
+            self.rdates = {pytz_to_zoneinfo(rdate) for rdate in self.rdates}
+            self.exdates = {pytz_to_zoneinfo(exdate) for exdate in self.exdates}
+            self.periods = [
+                (pytz_to_zoneinfo(start), duration) for start, duration in self.periods
+            ]
+            super().make_all_dates_comparable()
+
+    def occurrence(
+        self,
+        adapter: ComponentAdapter,
+        start: Time | None = None,
+        end: Time | datetime.timedelta | None = None,
+    ) -> Occurrence:
+        """Create occurrences with zoneinfo timezones."""
+        return super().occurrence(
+            adapter,
+            pytz_to_zoneinfo(adapter.start if start is None else start),
+            pytz_to_zoneinfo(adapter.end if end is None else end),
+        )
+
+
+___all__ = ["Series", "ZoneInfoSeries"]
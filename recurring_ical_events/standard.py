@@ -0,0 +1,116 @@
+"""Apply X-WR-TIMEZONE to the components of a calendar when they are used.
+
+:func:`x_wr_timezone.to_standard` walks all the events of a calendar
+and copies the calendar if one of them changes.
+Here, the calendar is not copied.
+An event is converted the first time it is walked,
+so only the components that a query selects are converted.
+The result is the same as that of :func:`x_wr_timezone.to_standard`.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+import icalendar
+import x_wr_timezone
+
+from recurring_ical_events.util import cached_property
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+
+
+class StandardCalendar(icalendar.Calendar):
+    """A calendar that converts its events according to X-WR-TIMEZONE.
+
+    The calendar shares its components with the original calendar.
+    Each event is converted once, when it is walked.
+    Events are only copied if their times change.
+    """
+
+    @classmethod
+    def from_calendar(
+        cls, calendar: Component, timezone: datetime.tzinfo
+    ) -> StandardCalendar:
+        """Create a calendar that uses the components of calendar."""
+        result = cls()
+        result.name = calendar.name
+        result.update(calendar)
+        result.subcomponents = calendar.subcomponents
+        result.walker = x_wr_timezone.UTCChangingWalker(timezone)
+        result.standard_components: dict[int, Component] = {}
+        return result
+
+    @cached_property
+    def top_level_ids(self) -> set[int]:
+        """The ids of the components that x_wr_timezone would convert."""
+        return {id(component) for component in self.subcomponents}
+
+    def to_standard(self, component: Component) -> Component:
+        """Return the converted component."""
+        if not isinstance(component, icalendar.cal.Event):
+            return component
+        key = id(component)
+        if key not in self.standard_components:
+            if key not in self.top_level_ids:
+                return component
+            self.standard_components[key] = self.walker.walk_event(component)
+        return self.standard_components[key]
+
+    def walk(
+        self,
+        name: Optional[str] = None,
+        select: Callable[[Component], bool] = lambda _: True,
+    ) -> list[Component]:
+        """Return the components like icalendar, with converted events."""
+        return [self.to_standard(component) for component in super().walk(name, select)]
+
+    def walk_unconverted(self) -> list[Component]:
+        """Return all the components without converting the events."""
+        return super().walk()
+
+    def to_calendar(self) -> icalendar.Calendar:
+        """Return a calendar with all the events converted."""
+        calendar = icalendar.Calendar()
+        calendar.name = self.name
+        calendar.update(self)
+        calendar.subcomponents = [
+            self.to_standard(component) for component in self.subcomponents
+        ]
+        return calendar
+
+    def property_items(
+        self,
+        recursive: bool = True,  # noqa: FBT001
+        sorted: bool = True,  # noqa: A002, FBT001
+    ) -> list[tuple[str, object]]:
+        """Return the properties like icalendar, with converted events.
+
+        This is used to create the ICS of the calendar.
+        """
+        if recursive:
+            return self.to_calendar().property_items(recursive, sorted)
+        return super().property_items(recursive, sorted)
+
+
+def to_standard(calendar: Component) -> Component:
+    """Return a calendar that applies X-WR-TIMEZONE.
+
+    If the calendar has no X-WR-TIMEZONE, it is returned as it is.
+    """
+    timezone = calendar.get("X-WR-TIMEZONE")
+    if timezone is None:
+        return calendar
+    if not isinstance(timezone, datetime.tzinfo):
+        timezone = zoneinfo.ZoneInfo(str(timezone))
+    return StandardCalendar.from_calendar(calendar, timezone)
+
+
+__all__ = ["StandardCalendar", "to_standard"]
@@ -0,0 +1,206 @@
+"""Read calendars incrementally.
+
+:func:`icalendar.cal.Calendar.from_ical` needs the whole file in memory
+and creates all its content lines before the first component exists.
+Here, the lines are unfolded as the chunks are read.
+Each top-level component is parsed on its own and its text is dropped.
+
+See :func:`recurring_ical_events.of_file` and
+:func:`recurring_ical_events.of_stream`.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from typing import IO, TYPE_CHECKING, AnyStr, Generator, Iterable
+
+import icalendar
+from icalendar.timezone import tzp
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+
+# the number of characters or bytes read at once from a file
+CHUNK_SIZE = 64 * 1024
+
+# the TZID parameter of a content line
+TZID_PARAMETER = re.compile(r';TZID=(?:"([^"]*)"|([^;:,]*))', re.IGNORECASE)
+
+
+def read_chunks(
+    fp: IO[AnyStr], chunk_size: int = CHUNK_SIZE
+) -> Generator[AnyStr, None, None]:
+    """Yield the content of a file in chunks."""
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def unfold_lines(chunks: Iterable[str | bytes]) -> Generator[str, None, None]:
+    """Yield the unfolded content lines of the chunks.
+
+    Bytes are decoded as UTF-8 like :func:`icalendar.parser.to_unicode`.
+    Lines may end with CRLF or LF.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")("replace")
+    rest = ""
+    parts: list[str] = []
+    first = True
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)  # noqa: PLW2901
+        if first and chunk:
+            chunk = chunk.lstrip("\ufeff")  # noqa: PLW2901
+            first = False
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
+        for line in lines:
+            if line.endswith("\r"):
+                line = line[:-1]  # noqa: PLW2901
+            if line[:1] in (" ", "\t") and parts:
+                parts.append(line[1:])
+            else:
+                if parts:
+                    yield "".join(parts)
+                parts = [line]
+    rest += decoder.decode(b"", final=True)
+    if rest.endswith("\r"):
+        rest = rest[:-1]
+    if rest[:1] in (" ", "\t") and parts:
+        parts.append(rest[1:])
+        rest = ""
+    if parts:
+        yield "".join(parts)
+    if rest:
+        yield rest
+
+
+class CalendarBuilder:
+    """Build a calendar one top-level component at a time.
+
+    VTIMEZONE components are cached by icalendar when they are parsed.
+    If a component refers to a VTIMEZONE that comes later, its text
+    is kept until that VTIMEZONE is parsed and it is parsed again.
+    """
+
+    def __init__(self):
+        """Create an empty calendar."""
+        self.header: list[str] = []
+        self.components: list[Component] = []
+        self._defined_tzids: set[str] = set()
+        self._known_tzids: dict[str, bool] = {}
+        self._forward_references: list[tuple[int, str, set[str]]] = []
+
+    def add_header_line(self, line: str):
+        """Add a property of the calendar."""
+        self.header.append(line)
+
+    def add_component_lines(self, lines: list[str]):
+        """Parse the lines of a top-level component and add it."""
+        text = "\r\n".join(lines)
+        component = icalendar.Component.from_ical(text)
+        if component.name == "VTIMEZONE" and "TZID" in component:
+            tzid = str(component["TZID"])
+            self._defined_tzids.add(tzid)
+            self._parse_references_to(tzid)
+        else:
+            missing = {
+                tzid for tzid in self._tzids_in(text) if not self._is_known(tzid)
+            }
+            if missing:
+                self._forward_references.append((len(self.components), text, missing))
+        self.components.append(component)
+
+    @staticmethod
+    def _tzids_in(text: str) -> set[str]:
+        """The TZID parameters in the text."""
+        return {
+            quoted or plain
+            for quoted, plain in TZID_PARAMETER.findall(text)
+            if quoted or plain
+        }
+
+    def _is_known(self, tzid: str) -> bool:
+        """Whether icalendar can find the timezone now."""
+        if tzid in self._defined_tzids:
+            return True
+        if tzid not in self._known_tzids:
+            self._known_tzids[tzid] = tzp.timezone(tzid) is not None
+        return self._known_tzids[tzid]
+
+    def _parse_references_to(self, tzid: str):
+        """Parse the components that refer to the timezone again."""
+        references = []
+        for index, text, missing in self._forward_references:
+            if tzid in missing:
+                self.components[index] = icalendar.Component.from_ical(text)
+                missing.discard(tzid)
+            if missing:
+                references.append((index, text, missing))
+        self._forward_references = references
+
+    def to_calendar(self) -> icalendar.Calendar:
+        """Return the calendar with all the components."""
+        calendar = icalendar.Calendar.from_ical(
+            "\r\n".join(["BEGIN:VCALENDAR", *self.header, "END:VCALENDAR", ""])
+        )
+        calendar.subcomponents.extend(self.components)
+        return calendar
+
+
+def calendar_from_lines(lines: Iterable[str]) -> icalendar.Calendar:
+    """Create a calendar from unfolded content lines.
+
+    Components outside of a VCALENDAR are added to the calendar.
+    """
+    builder = CalendarBuilder()
+    component_lines: list[str] = []
+    depth = 0
+    calendars = 0
+    for line in lines:
+        if line[:6].upper() == "BEGIN:":
+            name = line[6:].strip().upper()
+            if depth == 0 and name == "VCALENDAR":
+                calendars += 1
+                if calendars > 1:
+                    raise ValueError(
+                        "Found multiple calendars where only one is allowed."
+                    )
+                continue
+            depth += 1
+        elif line[:4].upper() == "END:":
+            if depth == 0:
+                if line[4:].strip().upper() == "VCALENDAR":
+                    continue
+                raise ValueError("END encountered without an accompanying BEGIN!")
+            depth -= 1
+            if depth == 0:
+                component_lines.append(line)
+                builder.add_component_lines(component_lines)
+                component_lines = []
+                continue
+        if depth:
+            component_lines.append(line)
+        elif line.strip():
+            builder.add_header_line(line)
+    if depth:
+        raise ValueError("The last component has no END.")
+    return builder.to_calendar()
+
+
+def calendar_from_stream(chunks: Iterable[str | bytes]) -> icalendar.Calendar:
+    """Create a calendar from chunks of ICS text or bytes."""
+    return calendar_from_lines(unfold_lines(chunks))
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "CalendarBuilder",
+    "calendar_from_lines",
+    "calendar_from_stream",
+    "read_chunks",
+    "unfold_lines",
+]
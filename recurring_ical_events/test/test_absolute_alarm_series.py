@@ -0,0 +1,116 @@
+"""Absolute alarms are found in a sorted index.
+
+See recurring_ical_events.series.alarm.AbsoluteAlarmSeries.
+"""
+
+import datetime
+
+import pytest
+from icalendar import Alarm, Event
+
+from recurring_ical_events.adapters.event import EventAdapter
+from recurring_ical_events.series.alarm import AbsoluteAlarmSeries
+
+UTC = datetime.timezone.utc
+START = datetime.datetime(2024, 1, 1, 10, tzinfo=UTC)
+
+
+def alarm(trigger, repeat=0):
+    """An absolute alarm."""
+    result = Alarm()
+    result.add("ACTION", "DISPLAY")
+    result.add("TRIGGER", trigger)
+    if repeat:
+        result.add("REPEAT", repeat)
+        result.add("DURATION", datetime.timedelta(minutes=5))
+    return result
+
+
+@pytest.fixture
+def parent():
+    """The component of the alarms."""
+    event = Event()
+    event.add("UID", "parent")
+    event.add("DTSTART", START)
+    return EventAdapter(event)
+
+
+def hours(*hours):
+    """The times after the start."""
+    return [START + datetime.timedelta(hours=hour) for hour in hours]
+
+
+def triggers(series, start, stop):
+    """The sorted triggers in the span."""
+    return sorted(occurrence.start for occurrence in series.between(start, stop))
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        (START, START + datetime.timedelta(days=1), hours(0, 1, 2, 5)),
+        # the start is inclusive and the stop exclusive
+        (
+            START + datetime.timedelta(hours=1),
+            START + datetime.timedelta(hours=5),
+            hours(1, 2),
+        ),
+        (START + datetime.timedelta(hours=3), START + datetime.timedelta(hours=4), []),
+        (START - datetime.timedelta(days=1), START, []),
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), hours(0, 1, 2, 5)),
+    ],
+)
+def test_triggers_in_the_span(parent, start, stop, expected):
+    """The triggers are found with the same span rules as other components."""
+    series = AbsoluteAlarmSeries()
+    for trigger in reversed(hours(0, 1, 2, 5)):
+        series.add(alarm(trigger), parent)
+    assert triggers(series, start, stop) == expected
+
+
+def test_index_is_sorted(parent):
+    """The epochs are in order."""
+    series = AbsoluteAlarmSeries()
+    for trigger in hours(5, 0, 3):
+        series.add(alarm(trigger), parent)
+    epochs, occurrences = series.index
+    assert list(epochs) == sorted(epochs)
+    assert [at_epoch[0].start for at_epoch in occurrences] == hours(0, 3, 5)
+
+
+def test_alarms_at_the_same_time(parent):
+    """Several alarms can trigger at the same time."""
+    series = AbsoluteAlarmSeries()
+    series.add(alarm(START), parent)
+    series.add(
+        alarm(START.astimezone(datetime.timezone(datetime.timedelta(hours=2)))), parent
+    )
+    assert len(series.index[0]) == 1
+    assert len(list(series.between(START, START + datetime.timedelta(hours=1)))) == 2
+
+
+def test_repeated_alarms(parent):
+    """Each repetition is in the index."""
+    series = AbsoluteAlarmSeries()
+    series.add(alarm(START, repeat=2), parent)
+    assert triggers(series, START, START + datetime.timedelta(hours=1)) == [
+        START,
+        START + datetime.timedelta(minutes=5),
+        START + datetime.timedelta(minutes=10),
+    ]
+
+
+def test_alarms_added_after_a_query_are_found(parent):
+    """The index is created again."""
+    series = AbsoluteAlarmSeries()
+    series.add(alarm(START), parent)
+    assert triggers(series, START, START + datetime.timedelta(days=1)) == hours(0)
+    series.add(alarm(hours(3)[0]), parent)
+    assert triggers(series, START, START + datetime.timedelta(days=1)) == hours(0, 3)
+
+
+def test_empty_series():
+    """An empty series has no alarms."""
+    series = AbsoluteAlarmSeries()
+    assert series.is_empty()
+    assert list(series.between(START, START + datetime.timedelta(days=1))) == []
@@ -0,0 +1,132 @@
+"""The parent series is expanded once for all relative alarms.
+
+See recurring_ical_events.series.alarm.AlarmParents.
+"""
+
+import datetime
+
+import pytest
+from icalendar import Alarm, Calendar, Event
+
+import recurring_ical_events
+from recurring_ical_events.series.alarm import AlarmSeriesRelativeToStart
+
+START = datetime.datetime(2024, 1, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+def alarm(minutes, related="START", repeat=0):
+    """Return an alarm relative to the event."""
+    result = Alarm()
+    result.add("ACTION", "DISPLAY")
+    result.add("TRIGGER", datetime.timedelta(minutes=minutes))
+    result["TRIGGER"].params["RELATED"] = related
+    if repeat:
+        result.add("REPEAT", repeat)
+        result.add("DURATION", datetime.timedelta(minutes=2))
+    return result
+
+
+def calendar(*alarms):
+    """A daily event of an hour with alarms."""
+    event = Event()
+    event.add("UID", "daily")
+    event.add("DTSTART", START)
+    event.add("DTEND", START + datetime.timedelta(hours=1))
+    event.add("RRULE", {"FREQ": "DAILY", "COUNT": 10})
+    for an_alarm in alarms:
+        event.add_component(an_alarm)
+    result = Calendar()
+    result.add_component(event)
+    return result
+
+
+def triggers(query, start, stop):
+    """The sorted times of the alarms."""
+    return sorted(
+        occurrence.start for occurrence in query.occurrences_between(start, stop)
+    )
+
+
+def minutes(*offsets, day=0):
+    """The times relative to the start on a day."""
+    return [START + datetime.timedelta(days=day, minutes=offset) for offset in offsets]
+
+
+def test_all_alarms_of_a_series_expand_it_once():
+    """The series is expanded once for each span."""
+    query = recurring_ical_events.of(
+        calendar(alarm(-10), alarm(-30, repeat=5), alarm(5, "END")),
+        components=["VALARM"],
+    )
+    assert len(query.series) == 3
+    parent_series = query.series[0]._series  # noqa: SLF001
+    calls = []
+    between = parent_series.between
+
+    def count_between(*args):
+        calls.append(args)
+        return between(*args)
+
+    parent_series.between = count_between
+    assert len(triggers(query, (2024, 1, 2), (2024, 1, 3))) == 1 + 6 + 1
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        # all repetitions
+        (START - datetime.timedelta(hours=1), START, minutes(-10, -8, -6, -4)),
+        # the span cuts the repetitions
+        (
+            START - datetime.timedelta(minutes=8),
+            START - datetime.timedelta(minutes=5),
+            minutes(-8, -6),
+        ),
+        # the alarm of the next day
+        (
+            START + datetime.timedelta(hours=23, minutes=51),
+            START + datetime.timedelta(hours=23, minutes=53),
+            minutes(-8, day=1),
+        ),
+        # no alarms during the event
+        (START, START + datetime.timedelta(hours=1), []),
+    ],
+)
+def test_repeated_alarm_relative_to_start(start, stop, expected):
+    """Each repetition is an occurrence."""
+    query = recurring_ical_events.of(
+        calendar(alarm(-10, repeat=3)), components=["VALARM"]
+    )
+    assert triggers(query, start, stop) == expected
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        (START, START + datetime.timedelta(hours=2), minutes(60, 62, 64)),
+        (
+            START + datetime.timedelta(hours=1),
+            START + datetime.timedelta(hours=1, minutes=1),
+            minutes(60),
+        ),
+        (START, START + datetime.timedelta(hours=1), []),
+    ],
+)
+def test_repeated_alarm_relative_to_end(start, stop, expected):
+    """Alarms relative to the end share the expansion."""
+    query = recurring_ical_events.of(
+        calendar(alarm(0, "END", repeat=2), alarm(-20)), components=["VALARM"]
+    )
+    assert triggers(query, start, stop) == expected
+
+
+def test_alarm_series_without_shared_parents():
+    """Alarm series can be created with their own parents."""
+    an_alarm = alarm(-10, repeat=1)
+    query = recurring_ical_events.of(calendar(an_alarm), components=["VEVENT"])
+    series = AlarmSeriesRelativeToStart(an_alarm, query.series[0])
+    assert [
+        occurrence.start
+        for occurrence in series.between(START - datetime.timedelta(hours=1), START)
+    ] == minutes(-10, -8)
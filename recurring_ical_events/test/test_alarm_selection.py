@@ -0,0 +1,72 @@
+"""Collect the alarms of the series that are already there.
+
+See recurring_ical_events.selection.alarm.
+"""
+
+import datetime
+
+import pytest
+from icalendar import Alarm
+
+import recurring_ical_events
+from recurring_ical_events.adapters.event import EventAdapter
+from recurring_ical_events.selection.alarm import Alarms, UsedAlarms
+
+
+def alarm(minutes, description="alarm"):
+    """Return an alarm relative to the start."""
+    result = Alarm()
+    result.add("ACTION", "DISPLAY")
+    result.add("DESCRIPTION", description)
+    result.add("TRIGGER", datetime.timedelta(minutes=-minutes))
+    return result
+
+
+def test_used_alarms_contain_equal_copies():
+    """Copies of alarms in modifications are computed once."""
+    used = UsedAlarms()
+    first = alarm(5)
+    used.add(first, first.TRIGGER)
+    assert used.contains(first, first.TRIGGER)
+    copy = alarm(5)
+    assert copy is not first
+    assert used.contains(copy, copy.TRIGGER)
+
+
+@pytest.mark.parametrize(
+    "other", [alarm(10), alarm(5, "other description"), alarm(10, "other")]
+)
+def test_used_alarms_do_not_contain_other_alarms(other):
+    """Other alarms are computed."""
+    used = UsedAlarms()
+    first = alarm(5)
+    used.add(first, first.TRIGGER)
+    assert not used.contains(other, other.TRIGGER)
+
+
+def test_alarms_of_an_adapter_are_cached(calendars):
+    """The component is walked once for its alarms."""
+    event = calendars.raw.alarm_of_repeated_event.walk("VEVENT")[0]
+    adapter = EventAdapter(event)
+    assert adapter.alarms is adapter.alarms
+    assert adapter.alarms == event.walk("VALARM")
+
+
+@pytest.mark.parametrize(
+    "calendar_name",
+    [
+        "alarm_of_repeated_event",
+        "alarm_absolute",
+        "alarm_absolute_edited",
+        "alarm_removed_and_moved",
+    ],
+)
+def test_alarms_of_collected_parent_series(calendars, calendar_name):
+    """The parent series of a query can be used for the alarms."""
+    calendar = calendars.raw[calendar_name]
+    query = recurring_ical_events.of(calendar, components=["VEVENT", "VTODO"])
+    alarms = Alarms()
+    expected = alarms.collect_series_from(calendar, ())
+    series = alarms.alarm_series_of(query.series, ())
+    assert len(series) == len(expected)
+    assert [type(s) for s in series] == [type(s) for s in expected]
@@ -0,0 +1,188 @@
+"""Query large ICS files with an index of their components."""
+
+import shutil
+from datetime import datetime, timezone
+
+import icalendar
+import pytest
+
+from recurring_ical_events import of
+from recurring_ical_events.archive import Archive, ArchiveIndex, of_archive
+from recurring_ical_events.test.conftest import CALENDARS_FOLDER
+from recurring_ical_events.util import to_epoch
+
+CALENDAR_PATHS = sorted(CALENDARS_FOLDER.glob("*.ics"))
+SPANS = [
+    ((2019, 1, 1), (2020, 1, 1)),
+    ((2019, 3, 4), (2019, 3, 5)),
+    ((2010, 1, 1), (2025, 1, 1)),
+]
+ALL_COMPONENTS = ["VEVENT", "VTODO", "VJOURNAL", "VALARM"]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    """Return a function to copy a calendar into the temporary directory."""
+
+    def copy(name):
+        path = tmp_path / name
+        shutil.copy(CALENDARS_FOLDER / name, path)
+        return path
+
+    return copy
+
+
+def between(query, span):
+    """The ICS of the components or the type of the error."""
+    try:
+        return sorted(component.to_ical() for component in query.between(*span))
+    except Exception as error:  # noqa: BLE001
+        return type(error)
+
+
+@pytest.mark.parametrize("path", CALENDAR_PATHS, ids=lambda path: path.stem)
+@pytest.mark.parametrize("components", [["VEVENT"], ALL_COMPONENTS])
+def test_archive_has_the_same_occurrences(archive_path, path, components):
+    """The index does not lose any occurrences."""
+    query = of(
+        icalendar.Calendar.from_ical(path.read_bytes()),
+        components=components,
+        skip_bad_series=True,
+    )
+    archive = of_archive(
+        archive_path(path.name), components=components, skip_bad_series=True
+    )
+    for span in SPANS:
+        assert between(archive, span) == between(query, span)
+
+
+def test_only_the_series_in_the_span_are_created(archive_path):
+    """The components of other UIDs are not parsed."""
+    query = of_archive(archive_path("machbar_16_feb_2019.ics"))
+    assert query.series == []
+    assert query.at((2019, 3, 5))
+    assert 0 < len(query.series) < len(query.archive.index.entries)
+
+
+def test_index_is_saved_and_loaded(archive_path):
+    """The index is saved next to the file."""
+    path = archive_path("machbar_16_feb_2019.ics")
+    with Archive(path) as archive:
+        entries = archive.index.entries
+    index = ArchiveIndex.load(archive.index_path)
+    assert index is not None
+    assert index.entries == entries
+    assert index.is_index_of(path.stat())
+
+
+def test_changed_file_is_indexed_again(archive_path):
+    """The index is only used if the file is the same."""
+    path = archive_path("one_event.ics")
+    Archive(path).close()
+    path.write_bytes((CALENDARS_FOLDER / "machbar_16_feb_2019.ics").read_bytes())
+    with Archive(path) as archive:
+        assert len(archive.index.entries) > 1
+
+
+def test_index_is_not_saved(archive_path):
+    """Archives in read-only places can be queried."""
+    path = archive_path("one_event.ics")
+    with Archive(path, save_index=False) as archive:
+        assert not archive.index_path.exists()
+
+
+CALENDAR = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:single
+DTSTART:20240101T100000Z
+DTEND:20240101T110000Z
+END:VEVENT
+BEGIN:VEVENT
+UID:count
+DTSTART;VALUE=DATE:20240101
+RRULE:FREQ=DAILY;COUNT=3
+END:VEVENT
+BEGIN:VEVENT
+UID:until
+DTSTART;TZID=Europe/Berlin:20240101T100000
+DURATION:PT1H
+RRULE:FREQ=WEEKLY;UNTIL=20240201T000000Z
+END:VEVENT
+BEGIN:VEVENT
+UID:forever
+DTSTART:20240101T100000
+RRULE:FREQ=YEARLY
+END:VEVENT
+BEGIN:VEVENT
+UID:rdate
+DTSTART:20240101T100000
+RDATE:20200101T100000
+END:VEVENT
+BEGIN:VEVENT
+UID:modified
+DTSTART:20240101T100000Z
+RRULE:FREQ=DAILY;COUNT=2
+END:VEVENT
+BEGIN:VEVENT
+UID:modified
+RECURRENCE-ID:20240102T100000Z
+DTSTART:20240301T100000Z
+DTEND:20240301T120000Z
+BEGIN:VALARM
+TRIGGER;VALUE=DATE-TIME:20300101T000000Z
+ACTION:DISPLAY
+END:VALARM
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def epoch(*args):
+    """The epoch of a UTC time."""
+    return to_epoch(datetime(*args, tzinfo=timezone.utc))
+
+
+@pytest.mark.parametrize(
+    ("uid", "lower", "upper", "has_alarms"),
+    [
+        ("single", epoch(2024, 1, 1, 10), epoch(2024, 1, 1, 11), False),
+        ("count", epoch(2024, 1, 1), epoch(2024, 1, 3), False),
+        ("until", epoch(2024, 1, 1, 10), epoch(2024, 2, 1, 1), False),
+        ("forever", epoch(2024, 1, 1, 10), float("inf"), False),
+        ("rdate", float("-inf"), float("inf"), False),
+        ("modified", epoch(2024, 1, 1, 10), epoch(2024, 3, 1, 12), True),
+    ],
+)
+def test_bounds(uid, lower, upper, has_alarms):
+    """The bounds are computed from the properties."""
+    data = CALENDAR.encode()
+    index = ArchiveIndex.scan(data, len(data), 0)
+    (entry,) = [entry for entry in index.entries if entry.uid == uid]
+    assert (entry.lower, entry.upper, entry.has_alarms) == (lower, upper, has_alarms)
+    assert all(
+        data[start:stop].startswith(b"BEGIN:VEVENT") for start, stop in entry.ranges
+    )
+
+
+def test_entries_between():
+    """Entries are found by their bounds."""
+    data = CALENDAR.encode()
+    index = ArchiveIndex.scan(data, len(data), 0)
+    uids = [
+        entry.uid
+        for entry in index.entries_between(epoch(2024, 1, 5), epoch(2024, 1, 6))
+    ]
+    assert uids == ["until", "forever", "rdate", "modified"]
+    uids = [
+        entry.uid
+        for entry in index.entries_between(epoch(2025, 1, 1), epoch(2025, 1, 2))
+    ]
+    assert uids == ["forever", "rdate"]
+    uids = [
+        entry.uid
+        for entry in index.entries_between(
+            epoch(2025, 1, 1), epoch(2025, 1, 2), include_alarms=True
+        )
+    ]
+    assert uids == ["forever", "rdate", "modified"]
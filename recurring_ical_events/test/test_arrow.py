@@ -0,0 +1,147 @@
+"""Export occurrences to Apache Arrow."""
+
+import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from recurring_ical_events.arrow import (  # noqa: E402
+    _same_type,
+    batch_to_arrow,
+    occurrences_to_arrow,
+)
+
+
+def test_columns(calendars):
+    """The table has the time columns and the requested properties."""
+    table = calendars.machbar_16_feb_2019.to_arrow(
+        (2019, 1, 1), (2019, 4, 1), columns=["SUMMARY", "X-NOT-THERE"]
+    )
+    assert table.column_names == [
+        "uid",
+        "start",
+        "end",
+        "recurrence_id",
+        "sequence",
+        "SUMMARY",
+        "X-NOT-THERE",
+    ]
+    assert pa.types.is_dictionary(table.schema.field("uid").type)
+    assert table.schema.field("start").type == pa.timestamp("s")
+    assert table.column("X-NOT-THERE").null_count == len(table)
+
+
+def test_rows_are_the_occurrences(calendars):
+    """Each row is an occurrence."""
+    query = calendars.machbar_16_feb_2019
+    occurrences = query.occurrences_between((2019, 1, 1), (2019, 4, 1))
+    table = query.to_arrow((2019, 1, 1), (2019, 4, 1), columns=["SUMMARY"])
+    assert len(table) == len(occurrences)
+    rows = sorted(
+        (row["uid"], row["start"], row["SUMMARY"]) for row in table.to_pylist()
+    )
+    expected = sorted(
+        (
+            occurrence.uid,
+            occurrence.start.astimezone(datetime.timezone.utc).replace(tzinfo=None),
+            occurrence.as_component(keep_recurrence_attributes=False)["SUMMARY"],
+        )
+        for occurrence in occurrences
+    )
+    assert rows == expected
+
+
+def test_dates_and_recurrence_ids(calendars):
+    """Dates are at midnight and the recurrence id is the start."""
+    table = calendars.one_day_event_repeat_every_day.to_arrow(
+        (2019, 3, 4), (2019, 3, 8)
+    )
+    starts = sorted(table.column("start").to_pylist())
+    assert starts == [datetime.datetime(2019, 3, day) for day in range(4, 8)]
+    assert sorted(table.column("recurrence_id").to_pylist()) == starts
+    assert table.column("end").to_pylist() == [
+        start + datetime.timedelta(days=1)
+        for start in table.column("start").to_pylist()
+    ]
+
+
+def test_modifications_have_their_recurrence_id(calendars):
+    """The RECURRENCE-ID of a modification is exported."""
+    query = calendars.recurring_events_moved
+    table = query.to_arrow((2019, 3, 1), (2019, 4, 1))
+    moved = [row for row in table.to_pylist() if row["recurrence_id"] != row["start"]]
+    assert sorted((row["recurrence_id"], row["start"]) for row in moved) == [
+        (datetime.datetime(2019, 3, 8, 1), datetime.datetime(2019, 3, 8)),
+        (datetime.datetime(2019, 3, 9, 1), datetime.datetime(2019, 3, 9, 2)),
+    ]
+
+
+def test_empty_table(calendars):
+    """Nothing happens."""
+    table = calendars.one_day_event_repeat_every_day.to_arrow(
+        (2000, 1, 1), (2000, 1, 2), columns=["SUMMARY"]
+    )
+    assert len(table) == 0
+    assert "SUMMARY" in table.column_names
+
+
+def test_attendees_are_exported(calendars):
+    """Each occurrence has the attendees of its component."""
+    table = calendars.machbar_16_feb_2019.to_arrow(
+        (2000, 1, 1), (2030, 1, 1), columns=["ATTENDEE"]
+    )
+    attendees = table.column("ATTENDEE").drop_null().to_pylist()
+    assert attendees
+    assert all(str(attendee).startswith("mailto:") for attendee in attendees)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (["a", None], ["a", None]),
+        (["a", ("b", "c"), None], [("a",), ("b", "c"), None]),
+    ],
+)
+def test_single_values_become_lists_if_others_are(values, expected):
+    """Properties that occur more than once are lists."""
+    assert _same_type(values) == expected
+    assert pa.array(_same_type(values)).to_pylist() == [
+        None if value is None else list(value) if isinstance(value, tuple) else value
+        for value in expected
+    ]
+
+
+@pytest.mark.parametrize("rows_per_batch", [1, 3, 1000])
+def test_record_batches_have_the_same_rows(calendars, rows_per_batch):
+    """The table is created from record batches of the occurrences."""
+    query = calendars.machbar_16_feb_2019
+    occurrences = query.occurrences_between((2019, 1, 1), (2019, 4, 1))
+    table = occurrences_to_arrow(
+        iter(occurrences), ["SUMMARY", "ATTENDEE"], rows_per_batch=rows_per_batch
+    )
+    assert all(
+        len(batch) <= rows_per_batch for batch in table.to_batches(max_chunksize=None)
+    )
+    assert (
+        table.to_pylist()
+        == occurrences_to_arrow(occurrences, ["SUMMARY", "ATTENDEE"]).to_pylist()
+    )
+
+
+def test_batch_is_exported(calendars):
+    """An OccurrenceBatch has the same table as its occurrences."""
+    query = calendars.machbar_16_feb_2019
+    batch = query.batch_between((2019, 1, 1), (2019, 4, 1))
+    assert (
+        batch_to_arrow(batch, ["SUMMARY"]).to_pylist()
+        == query.to_arrow((2019, 1, 1), (2019, 4, 1), ["SUMMARY"]).to_pylist()
+    )
+
+
+def test_missing_sequence_is_null(calendars):
+    """Components without SEQUENCE have no sequence."""
+    table = calendars.one_day_event_repeat_every_day.to_arrow(
+        (2019, 3, 4), (2019, 3, 8)
+    )
+    assert table.column("sequence").null_count == len(table) == 4
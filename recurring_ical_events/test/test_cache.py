@@ -0,0 +1,146 @@
+"""Share the queries of the same calendars.
+
+See recurring_ical_events.cache.
+"""
+
+import threading
+import time
+
+import pytest
+
+import recurring_ical_events
+from recurring_ical_events.cache import CACHE, QueryCache
+from recurring_ical_events.test.conftest import CALENDARS_FOLDER
+
+
+@pytest.fixture
+def cache():
+    """An empty cache."""
+    return QueryCache()
+
+
+@pytest.fixture
+def data():
+    """The bytes of a calendar."""
+    return (CALENDARS_FOLDER / "three_events.ics").read_bytes()
+
+
+def test_same_bytes_return_the_same_query(cache, data):
+    """The query is created once."""
+    query = cache.of(data)
+    assert cache.of(bytes(data)) is query
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries, info.size) == (1, 1, 1, len(data))
+    assert info.hit_rate == 0.5
+
+
+def test_query_has_the_same_result_as_of(cache, data, calendars):
+    """The cached query is created with of()."""
+    expected = recurring_ical_events.of(calendars.raw.three_events).between(2000, 2030)
+    result = cache.of(data).between(2000, 2030)
+    assert [event.to_ical() for event in result] == [
+        event.to_ical() for event in expected
+    ]
+
+
+def test_arguments_are_part_of_the_key(cache, data):
+    """Queries with other arguments are other queries."""
+    events = cache.of(data, components=["VEVENT"])
+    todos = cache.of(data, components=["VTODO"])
+    assert events is not todos
+    assert cache.of(data, components=("VEVENT",)) is events
+    assert cache.of(data) is not events
+
+
+def test_path_is_recognized_by_modification(cache, tmp_path, data):
+    """Changed files are parsed again."""
+    path = tmp_path / "calendar.ics"
+    path.write_bytes(data)
+    query = cache.of(path)
+    assert cache.of(str(path)) is query
+    path.write_bytes(data.replace(b"END:VCALENDAR", b"X-CHANGED:1\r\nEND:VCALENDAR"))
+    assert cache.of(path) is not query
+    assert cache.info().misses == 2
+
+
+def test_least_recently_used_query_is_removed(data):
+    """The size of the sources is limited."""
+    cache = QueryCache(max_size=2 * len(data))
+    first = cache.of(data, components=["VEVENT"])
+    second = cache.of(data, components=["VTODO"])
+    assert cache.of(data, components=["VEVENT"]) is first
+    cache.of(data, components=["VJOURNAL"])
+    info = cache.info()
+    assert info.entries == 2
+    assert info.size == 2 * len(data)
+    assert cache.of(data, components=["VEVENT"]) is first
+    assert cache.of(data, components=["VTODO"]) is not second
+
+
+def test_large_source_is_kept(data):
+    """The last query is kept even if it is too large."""
+    cache = QueryCache(max_size=1)
+    query = cache.of(data)
+    assert cache.of(data) is query
+    assert cache.info().entries == 1
+
+
+def test_concurrent_misses_create_the_query_once(cache):
+    """Threads wait for the query that is created."""
+    created = []
+
+    def create():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("key", 1, create)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert results == created * 8
+    assert cache.info().misses == 1
+    assert cache.info().hits == 7
+
+
+def test_error_is_not_cached(cache):
+    """If the query cannot be created, it is tried again."""
+
+    def fail():
+        raise ValueError("bad calendar")
+
+    with pytest.raises(ValueError, match="bad calendar"):
+        cache.get("key", 1, fail)
+    assert cache.get("key", 1, lambda: "query") == "query"
+    assert cache.info().entries == 1
+
+
+def test_invalid_calendar_raises_the_error_of_icalendar(cache):
+    """Parsing errors are raised."""
+    with pytest.raises(ValueError):
+        cache.of(b"END:VEVENT\r\n")
+    assert cache.info().entries == 0
+
+
+def test_clear(cache, data):
+    """The cache can be emptied."""
+    query = cache.of(data)
+    cache.clear()
+    assert tuple(cache.info())[:4] == (0, 0, 0, 0)
+    assert cache.of(data) is not query
+
+
+def test_cached_of_uses_the_process_wide_cache(data):
+    """cached_of() shares the queries of the process."""
+    CACHE.clear()
+    query = recurring_ical_events.cached_of(data)
+    assert recurring_ical_events.cached_of(data) is query
+    assert recurring_ical_events.cache_info() == CACHE.info()
+    assert recurring_ical_events.cache_info().hits == 1
+    CACHE.clear()
@@ -0,0 +1,153 @@
+"""Views share the properties with the components in the calendar.
+
+They are only copied when they are modified.
+"""
+
+import copy
+import pickle
+from datetime import timedelta
+
+import pytest
+from icalendar import Event
+
+from recurring_ical_events import CalendarQuery, of
+from recurring_ical_events.view import ComponentView, create_view
+
+
+@pytest.fixture(params=[True, False])
+def keep_recurrence_attributes(request):
+    """Whether to keep RRULE, RDATE and EXDATE."""
+    return request.param
+
+
+def test_view_is_equal_to_copy(calendars, keep_recurrence_attributes):
+    """The view has the same properties as the copy."""
+    query = calendars.machbar_16_feb_2019
+    for occurrence in query.occurrences_between((2000, 1, 1), (2030, 1, 1)):
+        component = occurrence.as_component(keep_recurrence_attributes)
+        view = occurrence.as_component_view(keep_recurrence_attributes)
+        assert isinstance(view, type(component))
+        assert view == component
+        assert list(view) == list(component)
+        assert view.to_ical() == component.to_ical()
+
+
+def test_alarm_view_is_equal_to_copy(alarms):
+    """The alarm is added to the view."""
+    query = alarms.alarm_of_repeated_event
+    occurrences = query.occurrences_between((2024, 10, 1), (2024, 11, 7))
+    assert occurrences
+    for occurrence in occurrences:
+        component = occurrence.as_component(keep_recurrence_attributes=False)
+        view = occurrence.as_component_view(keep_recurrence_attributes=False)
+        assert view.to_ical() == component.to_ical()
+
+
+def test_query_returns_views(calendars):
+    """The query can return views instead of copies."""
+    calendar = calendars.raw.one_day_event_repeat_every_day
+    views = of(calendar, component_views=True).between((2019, 3, 4), (2019, 3, 8))
+    copies = of(calendar).between((2019, 3, 4), (2019, 3, 8))
+    assert len(views) == len(copies) == 4
+    assert views == copies
+    for view in views:
+        assert isinstance(view, ComponentView)
+        assert view.is_view()
+
+
+def test_paginated_views(calendars):
+    """The pages contain views."""
+    calendar = calendars.raw.one_day_event_repeat_every_day
+    page = next(of(calendar, component_views=True).paginate(2, (2019, 3, 4)))
+    assert len(page.components) == 2
+    assert all(isinstance(view, ComponentView) for view in page.components)
+
+
+@pytest.fixture
+def source():
+    """An event to create a view of."""
+    event = Event()
+    event.add("UID", "source")
+    event.add("SUMMARY", "Original")
+    event.add("DURATION", timedelta(hours=1))
+    event.add("LOCATION", "Berlin")
+    return event
+
+
+@pytest.fixture
+def view(source):
+    """A view of the source with another summary and without the duration."""
+    return create_view(source, {"SUMMARY": "Changed"}, frozenset(["DURATION"]))
+
+
+def test_read_the_view(view):
+    """The view shows the modified properties."""
+    assert view["summary"] == "Changed"
+    assert view["LOCATION"] == "Berlin"
+    assert "DURATION" not in view
+    assert view.get("DURATION") is None
+    assert list(view) == ["UID", "SUMMARY", "LOCATION"]
+    assert len(view) == 3
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda view: view.__setitem__("LOCATION", "Dresden"),
+        lambda view: view.pop("LOCATION"),
+        lambda view: view.update({"LOCATION": "Dresden"}),
+        lambda view: view.add("COMMENT", "new"),
+        lambda view: view.__delitem__("UID"),
+        lambda view: view.clear(),
+    ],
+)
+def test_modifying_the_view_copies_it(source, view, modify):
+    """The source is never modified."""
+    before = source.to_ical()
+    modify(view)
+    assert not view.is_view()
+    assert source.to_ical() == before
+
+
+def test_the_modified_view_keeps_its_properties(view):
+    """After the copy, the properties are the same."""
+    view["COMMENT"] = "new"
+    assert list(view) == ["UID", "SUMMARY", "LOCATION", "COMMENT"]
+    assert view["SUMMARY"] == "Changed"
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [
+        lambda view: pickle.loads(pickle.dumps(view)),  # noqa: S301
+        copy.deepcopy,
+        copy.copy,
+        lambda view: view.copy(),
+    ],
+)
+def test_copies_of_a_view_are_components(source, view, duplicate):
+    """Copies are of the class of the source."""
+    copied = duplicate(view)
+    assert type(copied) is type(source)
+    assert copied == view
+
+
+def test_query_class_with_four_arguments(calendars):
+    """The new arguments of of() are only passed if they are used."""
+
+    class Query(CalendarQuery):
+        def __init__(
+            self,
+            calendar,
+            keep_recurrence_attributes,
+            components,
+            skip_bad_series,
+        ):
+            super().__init__(
+                calendar, keep_recurrence_attributes, components, skip_bad_series
+            )
+
+    calendar = calendars.raw.one_day_event_repeat_every_day
+    query = of(calendar, calendar_query=Query)
+    assert isinstance(query, Query)
+    assert len(query.between((2019, 3, 4), (2019, 3, 8))) == 4
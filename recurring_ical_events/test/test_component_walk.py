@@ -0,0 +1,98 @@
+"""The calendar is walked once for all the selections of a query.
+
+See recurring_ical_events.selection.walk.
+"""
+
+import pytest
+
+import recurring_ical_events
+from recurring_ical_events.selection import AllKnownComponents, ComponentWalk
+from recurring_ical_events.series import Series
+
+NAMES = ["VEVENT", "VTODO", "VJOURNAL", "VALARM", "VTIMEZONE", "vevent"]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_walk_returns_the_components_of_the_calendar(calendars, calendar_name, name):
+    """The components are the same and in the same order."""
+    calendar = calendars.raw[calendar_name]
+    walk = ComponentWalk(calendar)
+    assert walk.walk(name) == calendar.walk(name)
+
+
+class WalkCounter:
+    """Count how often the calendar is walked."""
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.walks = 0
+        self._walk = calendar.walk
+        calendar.walk = self.walk
+
+    def walk(self, *args, **kw):
+        self.walks += 1
+        return self._walk(*args, **kw)
+
+
+@pytest.mark.parametrize(
+    "components",
+    [
+        ["VEVENT", "VTODO", "VJOURNAL", "VALARM"],
+        [AllKnownComponents()],
+        ["VALARM"],
+    ],
+)
+def test_calendar_is_walked_once(calendars, components):
+    """All selections use one walk."""
+    counter = WalkCounter(calendars.raw.alarm_of_repeated_event)
+    recurring_ical_events.of(counter.calendar, components=components)
+    assert counter.walks == 1
+
+
+def test_alarms_use_the_series_of_the_events(calendars):
+    """The series of the events are not created again for the alarms."""
+    query = recurring_ical_events.of(
+        calendars.raw.alarm_of_repeated_event, components=["VEVENT", "VALARM"]
+    )
+    events = [series for series in query.series if isinstance(series, Series)]
+    alarms = [series for series in query.series if not isinstance(series, Series)]
+    assert events
+    assert alarms
+    for alarm in alarms:
+        assert any(alarm._series is event for event in events)  # noqa: SLF001
+
+
+def test_selections_with_other_series_are_not_shared(calendars):
+    """Other series classes create their own series."""
+
+    class MySeries(Series):
+        pass
+
+    query = recurring_ical_events.of(
+        calendars.raw.alarm_of_repeated_event,
+        components=[
+            "VEVENT",
+            recurring_ical_events.ComponentsWithName("VEVENT", series=MySeries),
+        ],
+    )
+    assert len(query.series) == 2
+    assert type(query.series[0]) is Series
+    assert type(query.series[1]) is MySeries
+
+
+def test_the_source_is_used_for_other_attributes(calendars):
+    """The walk can be used like the calendar."""
+    calendar = calendars.raw.alarm_of_repeated_event
+    walk = ComponentWalk(calendar)
+    assert walk.subcomponents is calendar.subcomponents
+    assert walk.get("VERSION") == calendar.get("VERSION")
+    assert ComponentWalk.of(walk) is walk
+
+
+def test_events_are_not_converted_if_they_are_not_selected(calendars):
+    """X-WR-TIMEZONE is only applied to the selected events."""
+    query = recurring_ical_events.of(
+        calendars.raw.x_wr_timezone_simple_events_issue_59, components=["VTODO"]
+    )
+    assert query.series == []
+    assert query.calendar.standard_components == {}
@@ -0,0 +1,61 @@
+"""Test the integer time model used inside of the series calculation."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+import pytz
+
+from recurring_ical_events.util import (
+    to_epoch,
+    to_recurrence_epochs,
+    to_recurrence_ids,
+)
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+
+@pytest.mark.parametrize(
+    ("time", "epoch"),
+    [
+        (date(1970, 1, 1), 0),
+        (date(1970, 1, 2), 86400),
+        (date(1969, 12, 31), -86400),
+        (datetime(1970, 1, 1, 1, 2, 3), 3723),
+        (datetime(1970, 1, 1, tzinfo=timezone.utc), 0),
+        (datetime(1970, 1, 1, 1, tzinfo=ZoneInfo("Europe/Berlin")), 0),
+        (pytz.timezone("Europe/Berlin").localize(datetime(1970, 1, 1, 1)), 0),
+        (datetime(2019, 3, 4, 12, 30, 59, 999), 1551702659),
+    ],
+)
+def test_to_epoch(time, epoch):
+    """Check the conversion of times to integers."""
+    assert to_epoch(time) == epoch
+
+
+@pytest.mark.parametrize(
+    "time",
+    [
+        date(2019, 3, 4),
+        datetime(2019, 3, 4, 12),
+        datetime(2019, 3, 4, 12, tzinfo=ZoneInfo("Europe/Berlin")),
+        datetime(2019, 3, 31, 12, tzinfo=ZoneInfo("Europe/Berlin")),
+        pytz.timezone("America/New_York").localize(datetime(2019, 11, 3, 1, 30)),
+        datetime(2019, 3, 4, 12, tzinfo=timezone.utc),
+    ],
+)
+def test_recurrence_epochs_match_recurrence_ids(time):
+    """The integers identify the same times as the recurrence ids."""
+    assert to_recurrence_epochs(time) == tuple(
+        to_epoch(recurrence_id) for recurrence_id in to_recurrence_ids(time)
+    )
+
+
+def test_floating_time_matches_wall_clock():
+    """A floating RECURRENCE-ID matches a time with timezone by its wall clock."""
+    zoned = datetime(2019, 3, 4, 12, tzinfo=ZoneInfo("Europe/Berlin"))
+    floating = datetime(2019, 3, 4, 12)
+    assert to_recurrence_epochs(floating)[0] in to_recurrence_epochs(zoned)
+    assert to_recurrence_epochs(floating)[0] != to_recurrence_epochs(zoned)[0]
@@ -93,3 +93,21 @@ def test_convert_to_date_range(dt, start, stop):
     """Test converting the date range."""
     date_range = convert_to_date_range(dt)
     assert date_range == (start, stop)
+
+
+def test_skipping_is_computed_once_per_series(calendars, monkeypatch):
+    """We do not expand the rule again for every query."""
+    query = calendars.issue_253_additional_recurrence_id
+    calls = []
+    for series in query.series:
+        skip = series.skip_core_modification
+
+        def skip_core_modification(modification, skip=skip):
+            calls.append(modification)
+            return skip(modification)
+
+        monkeypatch.setattr(series, "skip_core_modification", skip_core_modification)
+    for month in range(1, 13):
+        query.at((2024, month))
+    assert calls
+    assert len(calls) == len(set(calls))
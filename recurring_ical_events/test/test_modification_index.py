@@ -0,0 +1,86 @@
+"""Modifications are looked up by their start and end.
+
+Calendars can contain thousands of RECURRENCE-ID overrides.
+Only those near the query span should be checked.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from icalendar import Calendar, Event
+
+from recurring_ical_events import of
+from recurring_ical_events.series.rrule import ModificationIndex
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+DAYS = 400
+
+
+def moved_daily_event(tzinfo=None) -> Calendar:
+    """An event every day that is moved forward by 3 hours every day."""
+    calendar = Calendar()
+    core = Event()
+    core.add("UID", "moved")
+    core.add("DTSTART", datetime(2020, 1, 1, 10, tzinfo=tzinfo))
+    core.add("DURATION", timedelta(hours=1))
+    core.add("RRULE", {"FREQ": "DAILY", "COUNT": DAYS})
+    calendar.add_component(core)
+    for day in range(DAYS):
+        recurrence_id = datetime(2020, 1, 1, 10, tzinfo=tzinfo) + timedelta(days=day)
+        modification = Event()
+        modification.add("UID", "moved")
+        modification.add("RECURRENCE-ID", recurrence_id)
+        modification.add("DTSTART", recurrence_id + timedelta(hours=3))
+        modification.add("DURATION", timedelta(hours=1))
+        modification.add("SUMMARY", f"day {day}")
+        calendar.add_component(modification)
+    return calendar
+
+
+@pytest.mark.parametrize("tzinfo", [None, timezone.utc, ZoneInfo("Europe/Berlin")])
+@pytest.mark.parametrize(
+    ("span", "summaries"),
+    [
+        ((2020, 1, 1), ["day 0"]),
+        ((2020, 2, 1), ["day 31"]),
+        ((2021, 1, 1), ["day 366"]),
+        ((2022, 1, 1), []),
+        ((2020, 1, 1, 13), ["day 0"]),
+        ((2020, 1, 1, 10), []),
+    ],
+)
+def test_modifications_at(tzinfo, span, summaries):
+    """Check that we get the modifications we ask for."""
+    events = of(moved_daily_event(tzinfo)).at(span)
+    assert [event["SUMMARY"] for event in events] == summaries
+
+
+def test_query_across_timezones():
+    """Floating times are compared in the timezone of the query span."""
+    query = of(moved_daily_event())
+    tz = ZoneInfo("Pacific/Kiritimati")  # UTC+14
+    events = query.between(
+        datetime(2020, 1, 2, 13, tzinfo=tz), datetime(2020, 1, 2, 14, tzinfo=tz)
+    )
+    assert [event["SUMMARY"] for event in events] == ["day 1"]
+
+
+def test_index_only_returns_modifications_near_the_span():
+    """We do not visit all modifications."""
+    query = of(moved_daily_event())
+    (series,) = query.series
+    index = series.modification_index
+    assert len(index) == DAYS
+    candidates = index.between(date(2020, 6, 1), date(2020, 6, 2))
+    assert 1 <= len(candidates) <= 4
+
+
+def test_empty_index():
+    """An index without modifications returns nothing."""
+    index = ModificationIndex([])
+    assert index.between(date(2020, 6, 1), date(2020, 6, 2)) == []
+    assert len(index) == 0
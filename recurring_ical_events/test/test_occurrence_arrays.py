@@ -0,0 +1,70 @@
+"""The times of occurrences as NumPy arrays."""
+
+import pytest
+
+from recurring_ical_events import of
+from recurring_ical_events.test.conftest import ICSCalendars
+from recurring_ical_events.util import to_epoch
+
+np = pytest.importorskip("numpy")
+
+
+def epochs(array):
+    """The integer seconds of a datetime64[s] array."""
+    return array.view(np.int64).tolist()
+
+
+def test_arrays_have_the_times_of_the_occurrences(tzp, calendar_name):
+    """The arrays contain the same times as the occurrences."""
+    calendar = ICSCalendars(tzp)[calendar_name]
+    query = of(
+        calendar,
+        components=["VEVENT", "VTODO", "VJOURNAL", "VALARM"],
+        skip_bad_series=True,
+    )
+    arrays = query.occurrence_arrays((2019, 1, 1), (2020, 1, 1))
+    occurrences = query.occurrences_between((2019, 1, 1), (2020, 1, 1))
+    assert arrays.starts.dtype == np.dtype("datetime64[s]")
+    assert arrays.ends.dtype == np.dtype("datetime64[s]")
+    assert sorted(zip(epochs(arrays.starts), epochs(arrays.ends))) == sorted(
+        (to_epoch(occurrence.start), to_epoch(occurrence.end))
+        for occurrence in occurrences
+    )
+
+
+def test_series_indexes(calendars):
+    """The occurrences of a series are next to each other."""
+    query = calendars.machbar_16_feb_2019
+    arrays = query.occurrence_arrays((2019, 1, 1), (2019, 4, 1))
+    assert len(arrays) == len(arrays.series_indexes)
+    assert (np.diff(arrays.series_indexes) >= 0).all()
+    for index, series in enumerate(arrays.series):
+        starts, ends = arrays.of_series(index)
+        span = query._between_span((2019, 1, 1), (2019, 4, 1))  # noqa: SLF001
+        assert epochs(starts) == [
+            to_epoch(occurrence.start) for occurrence in series.between(*span)
+        ]
+        assert len(ends) == len(starts)
+
+
+def test_all_day_events(calendars):
+    """Dates are counted from midnight."""
+    query = calendars.one_day_event_repeat_every_day
+    arrays = query.occurrence_arrays((2019, 3, 4), (2019, 3, 8))
+    assert arrays.starts.tolist() == [
+        np.datetime64("2019-03-04T00:00:00").item(),
+        np.datetime64("2019-03-05T00:00:00").item(),
+        np.datetime64("2019-03-06T00:00:00").item(),
+        np.datetime64("2019-03-07T00:00:00").item(),
+    ]
+    assert (arrays.ends - arrays.starts == np.timedelta64(1, "D")).all()
+    assert arrays.series_indexes.tolist() == [0, 0, 0, 0]
+
+
+def test_no_occurrences(calendars):
+    """The arrays can be empty."""
+    arrays = calendars.one_day_event_repeat_every_day.occurrence_arrays(
+        (1900, 1, 1), (1900, 1, 2)
+    )
+    assert len(arrays) == 0
+    assert arrays.starts.dtype == np.dtype("datetime64[s]")
@@ -0,0 +1,140 @@
+"""Store many occurrences in arrays instead of objects."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from recurring_ical_events import AlarmOccurrence, Occurrence, OccurrenceBatch
+from recurring_ical_events.util import to_epoch
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+
+def test_occurrences_have_no_dict(calendars):
+    """Occurrences use __slots__ to save memory."""
+    occurrence = calendars.one_event.first_occurrence
+    assert not hasattr(occurrence, "__dict__")
+
+
+def test_the_id_is_computed_once(calendars):
+    """The id is cached."""
+    occurrence = calendars.one_event.first_occurrence
+    assert occurrence.id is occurrence.id
+
+
+def test_batch_has_the_same_occurrences(calendars):
+    """The batch creates the same occurrences."""
+    query = calendars.machbar_16_feb_2019
+    occurrences = query.occurrences_between((2000, 1, 1), (2030, 1, 1))
+    batch = query.batch_between((2000, 1, 1), (2030, 1, 1))
+    assert len(batch) == len(occurrences) > 1
+    assert list(batch) == occurrences
+    for occurrence, copy in zip(occurrences, batch):
+        assert type(copy) is type(occurrence)
+        assert copy.start == occurrence.start
+        assert copy.end == occurrence.end
+        assert copy.sequence == occurrence.sequence
+        assert copy.as_component(keep_recurrence_attributes=False) == (
+            occurrence.as_component(keep_recurrence_attributes=False)
+        )
+
+
+def same_time(time1, time2) -> bool:
+    """Whether the times are equal and look the same."""
+    return (type(time1), time1, str(time1)) == (type(time2), time2, str(time2))
+
+
+def test_batch_has_the_same_times(calendars, calendar_name):
+    """The times created from the epochs are the same as in the occurrences."""
+    calendars.skip_bad_series = True
+    query = calendars[calendar_name]
+    occurrences = query.occurrences_between((2000, 1, 1), (2030, 1, 1))[:200]
+    batch = OccurrenceBatch(occurrences)
+    assert len(batch) == len(occurrences)
+    for index, occurrence in enumerate(occurrences):
+        assert same_time(batch.starts[index], occurrence.start)
+        assert same_time(batch.ends[index], occurrence.end)
+
+
+def test_batch_stores_arrays(calendars):
+    """The times are stored in parallel."""
+    batch = calendars.one_day_event_repeat_every_day.batch_between(
+        (2019, 3, 4), (2019, 3, 8)
+    )
+    assert len(batch.starts) == len(batch.ends) == len(batch.sequences) == len(batch)
+    assert len(batch.adapters) == 1
+    assert list(batch.adapter_indexes) == [0] * len(batch)
+    assert batch[2].start == batch.starts[2] == batch.starts[-len(batch) + 2]
+    assert batch.start_epochs.typecode == batch.end_epochs.typecode == "q"
+    assert list(batch.start_epochs) == [to_epoch(start) for start in batch.starts]
+    assert batch.time_types == [(date, date)]
+
+
+def test_batch_of_alarms(alarms):
+    """Alarm occurrences are stored with their alarm and parent."""
+    query = alarms.alarm_of_repeated_event
+    occurrences = query.occurrences_between((2024, 10, 1), (2024, 11, 7))
+    batch = query.batch_between((2024, 10, 1), (2024, 11, 7))
+    assert occurrences
+    assert list(batch) == occurrences
+    for occurrence in batch:
+        assert isinstance(occurrence, AlarmOccurrence)
+
+
+def test_empty_batch():
+    """An empty batch has no occurrences."""
+    batch = OccurrenceBatch()
+    assert len(batch) == 0
+    assert list(batch) == []
+    with pytest.raises(IndexError):
+        batch[0]
+
+
+class Adapter:
+    """A minimal adapter."""
+
+    start = date(2020, 1, 1)
+    end = date(2020, 1, 2)
+    uid = "uid"
+    recurrence_ids = ()
+
+    @staticmethod
+    def component_name():
+        return "VEVENT"
+
+
+def test_adapters_are_stored_once():
+    """Occurrences of the same adapter share it."""
+    adapter = Adapter()
+    batch = OccurrenceBatch(
+        [
+            Occurrence(adapter, date(2020, 1, day), date(2020, 1, day + 1), 2)
+            for day in range(1, 11)
+        ]
+    )
+    assert len(batch) == 10
+    assert len(batch.adapters) == 1
+    assert batch[9].start == date(2020, 1, 10)
+    assert batch[9].sequence == 2
+
+
+@pytest.mark.parametrize(
+    "start",
+    [
+        # The clock skips this time.
+        datetime(2024, 3, 31, 2, 30, tzinfo=ZoneInfo("Europe/Berlin")),
+        # This time happens twice.
+        datetime(2024, 10, 27, 2, 30, fold=1, tzinfo=ZoneInfo("Europe/Berlin")),
+        datetime(2024, 1, 1, 10, 0, 0, 500, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 10, 0, 0, 500),
+    ],
+)
+def test_times_that_cannot_be_created_from_their_epoch(start):
+    """Times that differ after the conversion are kept as they are."""
+    batch = OccurrenceBatch([Occurrence(Adapter(), start, start)])
+    assert same_time(batch[0].start, start)
+    assert batch[0].start.fold == start.fold
+    assert same_time(batch.ends[0], start)
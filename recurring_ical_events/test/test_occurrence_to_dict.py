@@ -0,0 +1,114 @@
+"""Export occurrences as dicts and JSON without creating components."""
+
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from icalendar.prop import vCategory, vDDDLists, vGeo, vRecur, vText
+
+from recurring_ical_events import of
+from recurring_ical_events.test.conftest import ICSCalendars
+from recurring_ical_events.util import to_json_value
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        (vText("text"), "text"),
+        (date(2024, 1, 2), "2024-01-02"),
+        (datetime(2024, 1, 2, 3, 4, 5), "2024-01-02T03:04:05"),
+        (
+            datetime(2024, 1, 2, 3, 4, tzinfo=timezone.utc),
+            "2024-01-02T03:04:00+00:00",
+        ),
+        (timedelta(hours=1), "PT1H"),
+        (vDDDLists([date(2024, 1, 1), date(2024, 1, 2)]), ("2024-01-01", "2024-01-02")),
+        (vCategory(["a", "b"]), ("a", "b")),
+        (vGeo((1.5, 2.5)), (1.5, 2.5)),
+        (vRecur({"FREQ": "DAILY"}), "FREQ=DAILY"),
+        ([vText("a"), vText("b")], ("a", "b")),
+        (3, 3),
+    ],
+)
+def test_json_values(value, expected):
+    """Convert the values of properties."""
+    assert to_json_value(value) == expected
+
+
+def test_dict_has_the_properties_of_the_component(calendars):
+    """The dict has the same properties as the component."""
+    query = calendars.machbar_16_feb_2019
+    for occurrence in query.occurrences_between((2019, 1, 1), (2019, 4, 1)):
+        component = occurrence.as_component(keep_recurrence_attributes=False)
+        data = occurrence.to_dict()
+        assert list(data) == list(component)
+        assert data["DTSTART"] == to_json_value(component["DTSTART"])
+        assert data["DTEND"] == to_json_value(component["DTEND"])
+        assert data["SUMMARY"] == component["SUMMARY"]
+
+
+def test_fields_are_spelled_as_requested(calendars):
+    """Only the fields are returned."""
+    occurrence = calendars.one_day_event_repeat_every_day.first_occurrence
+    assert occurrence.to_dict(["summary", "DTSTART", "X-NOT-THERE"]) == {
+        "summary": "test3",
+        "DTSTART": "2019-03-04",
+        "X-NOT-THERE": None,
+    }
+
+
+def test_recurrence_attributes(calendars):
+    """RRULE is only exported if we keep it."""
+    occurrence = calendars.one_day_event_repeat_every_day.first_occurrence
+    assert "RRULE" not in occurrence.to_dict()
+    assert occurrence.to_dict(keep_recurrence_attributes=True)["RRULE"] == (
+        "FREQ=DAILY"
+    )
+
+
+def test_alarms_have_a_trigger(alarms):
+    """The time of the alarm is exported."""
+    query = alarms.alarm_of_repeated_event
+    occurrences = query.occurrences_between((2024, 10, 1), (2024, 11, 7))
+    assert occurrences
+    for occurrence in occurrences:
+        data = occurrence.to_dict(["UID", "trigger"])
+        assert data["trigger"] == occurrence.start.isoformat()
+
+
+def test_dicts_can_be_encoded(tzp, calendar_name):
+    """All dicts can be encoded as JSON."""
+    calendar = ICSCalendars(tzp)[calendar_name]
+    query = of(
+        calendar,
+        components=["VEVENT", "VTODO", "VJOURNAL", "VALARM"],
+        skip_bad_series=True,
+    )
+    for data in query.iter_dicts((2019, 1, 1), (2020, 1, 1)):
+        json.dumps(data)
+
+
+def test_iterate_dicts(calendars):
+    """The dicts are the same as those of the occurrences."""
+    query = calendars.machbar_16_feb_2019
+    occurrences = query.occurrences_between((2019, 1, 1), (2019, 4, 1))
+    assert list(query.iter_dicts((2019, 1, 1), (2019, 4, 1), ["UID"])) == [
+        occurrence.to_dict(["UID"]) for occurrence in occurrences
+    ]
+
+
+def test_write_json_lines(calendars):
+    """Each occurrence is written on a line."""
+    query = calendars.one_day_event_repeat_every_day
+    file = io.StringIO()
+    count = query.to_jsonl(file, (2019, 3, 4), (2019, 3, 8), ["DTSTART", "DTEND"])
+    lines = file.getvalue().splitlines()
+    assert count == len(lines) == 4
+    assert sorted(json.loads(line)["DTSTART"] for line in lines) == [
+        "2019-03-04",
+        "2019-03-05",
+        "2019-03-06",
+        "2019-03-07",
+    ]
@@ -0,0 +1,57 @@
+"""Occurrences can be serialized without creating a component.
+
+The properties that do not change are encoded once per component.
+"""
+
+import pytest
+
+from recurring_ical_events import of
+from recurring_ical_events.test.conftest import ICSCalendars
+
+
+@pytest.mark.parametrize("keep_recurrence_attributes", [True, False])
+def test_same_ics_as_the_component(tzp, calendar_name, keep_recurrence_attributes):
+    """The ICS is the same as that of the component."""
+    calendar = ICSCalendars(tzp)[calendar_name]
+    query = of(
+        calendar,
+        keep_recurrence_attributes,
+        components=["VEVENT", "VTODO", "VJOURNAL"],
+        skip_bad_series=True,
+    )
+    for occurrence in query.occurrences_between((2000, 1, 1), (2030, 1, 1))[:50]:
+        assert (
+            occurrence.to_ical(keep_recurrence_attributes)
+            == occurrence.as_component(keep_recurrence_attributes).to_ical()
+        )
+
+
+def test_alarms_have_the_same_ics(alarms):
+    """Alarms are serialized with the component."""
+    query = alarms.alarm_of_repeated_event
+    occurrences = query.occurrences_between((2024, 10, 1), (2024, 11, 7))
+    assert occurrences
+    for occurrence in occurrences:
+        assert (
+            occurrence.to_ical(keep_recurrence_attributes=False)
+            == occurrence.as_component(keep_recurrence_attributes=False).to_ical()
+        )
+
+
+def test_the_template_is_reused(calendars):
+    """The invariant properties are encoded once."""
+    occurrences = calendars.one_day_event_repeat_every_day.occurrences_between(
+        (2019, 3, 4), (2019, 3, 8)
+    )
+    adapter = occurrences[0]._adapter  # noqa: SLF001
+    icals = [
+        occurrence.to_ical(keep_recurrence_attributes=False)
+        for occurrence in occurrences
+    ]
+    assert len(set(icals)) == 4
+    assert len(adapter._ical_templates) == 1  # noqa: SLF001
+    template = adapter._ical_template(  # noqa: SLF001
+        keep_recurrence_attributes=False, has_sequence=False
+    )
+    assert "DTSTART" in template
+    assert any(isinstance(chunk, bytes) and b"SUMMARY" in chunk for chunk in template)
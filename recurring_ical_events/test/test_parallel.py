@@ -0,0 +1,66 @@
+"""Parse calendars in several processes."""
+
+import icalendar
+import pytest
+
+from recurring_ical_events import of, of_parallel
+from recurring_ical_events.parallel import parse_calendar, split_calendar
+from recurring_ical_events.test.conftest import CALENDARS_FOLDER
+
+CALENDAR_PATHS = sorted(CALENDARS_FOLDER.glob("*.ics"))
+
+
+def parse(parser, data):
+    """The ICS of the parsed calendar or the type of the error."""
+    try:
+        return parser(data).to_ical()
+    except Exception as error:  # noqa: BLE001
+        return type(error)
+
+
+@pytest.mark.parametrize("path", CALENDAR_PATHS, ids=lambda path: path.stem)
+def test_batches_are_parsed_like_the_calendar(path):
+    """The result is the same as parsing the calendar at once."""
+    data = path.read_bytes()
+    assert parse(lambda data: parse_calendar(data, 1), data) == parse(
+        icalendar.Calendar.from_ical, data
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "machbar_16_feb_2019",
+        "issue_61_time_zone_error",
+        "x_wr_timezone_simple_events_issue_59",
+        "alarm_several_in_one",
+    ],
+)
+def test_processes_return_the_same_occurrences(name):
+    """Components parsed in other processes work the same."""
+    path = CALENDARS_FOLDER / f"{name}.ics"
+    components = ["VEVENT", "VTODO", "VJOURNAL", "VALARM"]
+    expected = of(
+        icalendar.Calendar.from_ical(path.read_bytes()), components=components
+    ).between(2000, 2030)
+    query = of_parallel(path, processes=2, components=components)
+    assert [component.to_ical() for component in query.between(2000, 2030)] == [
+        component.to_ical() for component in expected
+    ]
+    assert [component.start for component in query.between(2000, 2030)] == [
+        component.start for component in expected
+    ]
+
+
+@pytest.mark.parametrize("batches", [1, 2, 3, 100])
+def test_split_calendar(batches):
+    """All components are in the batches in their order."""
+    data = (CALENDARS_FOLDER / "issue_61_time_zone_error.ics").read_bytes()
+    header, timezones, ranges = split_calendar(data, batches)
+    assert header.startswith(b"PRODID")
+    assert timezones.startswith(b"BEGIN:VTIMEZONE")
+    assert 1 <= len(ranges) <= batches
+    assert all(data[start:stop].startswith(b"BEGIN:") for start, stop in ranges)
+    assert all(
+        stop <= next_start for (_, stop), (next_start, _) in zip(ranges, ranges[1:])
+    )
@@ -0,0 +1,89 @@
+"""Return components with only some properties."""
+
+import pytest
+
+from recurring_ical_events import of
+
+PROPERTIES = ["UID", "SUMMARY", "DTSTART", "DTEND"]
+
+
+def test_only_the_properties_are_returned(calendars):
+    """The components have the projected properties."""
+    query = of(calendars.raw.machbar_16_feb_2019, properties=PROPERTIES)
+    components = query.between((2019, 1, 1), (2019, 4, 1))
+    assert components
+    for component in components:
+        assert set(component) == set(PROPERTIES)
+
+
+def test_projected_properties_have_the_same_values(calendars):
+    """The properties are those of the complete component."""
+    query = calendars.machbar_16_feb_2019
+    for occurrence in query.occurrences_between((2019, 1, 1), (2019, 4, 1)):
+        component = occurrence.as_component(keep_recurrence_attributes=False)
+        projection = occurrence.as_projected_component(
+            keep_recurrence_attributes=False,
+            properties=["dtstart", "DTEND", "RECURRENCE-ID", "SEQUENCE", "SUMMARY"],
+        )
+        for name in projection:
+            assert projection[name] == component[name]
+
+
+@pytest.mark.parametrize(
+    ("keep_recurrence_attributes", "has_rrule"), [(True, True), (False, False)]
+)
+def test_recurrence_attributes_are_projected_if_kept(
+    calendars, keep_recurrence_attributes, has_rrule
+):
+    """RRULE is only returned if we keep it."""
+    occurrence = calendars.one_day_event_repeat_every_day.first_occurrence
+    component = occurrence.as_projected_component(
+        keep_recurrence_attributes, ["UID", "RRULE"]
+    )
+    assert ("RRULE" in component) == has_rrule
+
+
+def test_absent_properties_are_not_added(calendars):
+    """We do not create properties that the component does not have."""
+    occurrence = calendars.one_day_event_repeat_every_day.first_occurrence
+    component = occurrence.as_projected_component(
+        keep_recurrence_attributes=False, properties=["UID", "X-NOT-THERE"]
+    )
+    assert list(component) == ["UID"]
+
+
+def test_without_subcomponents(calendars):
+    """The alarms of events can be excluded."""
+    calendar = calendars.raw.alarm_1_week_before_event
+    with_alarms = of(calendar).between((2000, 1, 1), (2030, 1, 1))
+    without_alarms = of(calendar, include_subcomponents=False).between(
+        (2000, 1, 1), (2030, 1, 1)
+    )
+    assert with_alarms[0].subcomponents
+    assert without_alarms[0].subcomponents == []
+    assert dict(without_alarms[0]) == dict(with_alarms[0])
+
+
+@pytest.mark.parametrize("include_subcomponents", [True, False])
+def test_alarms_are_projected(alarms, include_subcomponents):
+    """The alarm is the only subcomponent."""
+    query = of(
+        alarms.raw.alarm_of_repeated_event,
+        components=["VALARM"],
+        properties=["UID"],
+        include_subcomponents=include_subcomponents,
+    )
+    components = query.between((2024, 10, 1), (2024, 11, 7))
+    assert components
+    for component in components:
+        assert list(component) == ["UID"]
+        assert len(component.subcomponents) == include_subcomponents
+
+
+def test_pages_are_projected(calendars):
+    """Pagination uses the projection."""
+    query = of(calendars.raw.machbar_16_feb_2019, properties=["UID"])
+    page = next(query.paginate(3, (2019, 1, 1)))
+    assert len(page.components) == 3
+    for component in page.components:
+        assert list(component) == ["UID"]
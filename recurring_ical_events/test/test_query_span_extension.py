@@ -0,0 +1,109 @@
+"""The query span is extended for each segment of a series on its own.
+
+We count how many candidates are generated for the occurrences
+that are returned so that we can see how precise the extension is.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from icalendar import Calendar, Event
+
+from recurring_ical_events import of
+
+
+def daily_event_with_long_modifications() -> Calendar:
+    """A daily event and a far moved modification that lasts weeks."""
+    calendar = Calendar()
+    core = Event()
+    core.add("UID", "daily")
+    core.add("DTSTART", datetime(2020, 1, 1, 10))
+    core.add("DURATION", timedelta(hours=1))
+    core.add("RRULE", {"FREQ": "DAILY"})
+    core.add("RDATE", [(datetime(2021, 1, 1, 10), datetime(2021, 1, 20, 10))])
+    calendar.add_component(core)
+    modification = Event()
+    modification.add("UID", "daily")
+    modification.add("RECURRENCE-ID", datetime(2020, 1, 2, 10))
+    modification.add("DTSTART", datetime(2020, 3, 1, 10))
+    modification.add("DURATION", timedelta(weeks=6))
+    calendar.add_component(modification)
+    return calendar
+
+
+def test_rdate_period_longer_than_the_event():
+    """We find an RDATE with a PERIOD after its start."""
+    query = of(daily_event_with_long_modifications())
+    starts = [event["DTSTART"].dt for event in query.at((2021, 1, 10))]
+    assert datetime(2021, 1, 1, 10) in starts
+
+
+def test_moved_modification_is_found():
+    """The modification is found where it was moved to."""
+    query = of(daily_event_with_long_modifications())
+    starts = [event["DTSTART"].dt for event in query.at((2020, 4, 1))]
+    assert sorted(starts) == [datetime(2020, 3, 1, 10), datetime(2020, 4, 1, 10)]
+    assert datetime(2020, 1, 2, 10) not in [
+        event["DTSTART"].dt for event in query.at((2020, 1, 2))
+    ]
+
+
+def test_candidates_are_counted():
+    """A short query does not calculate weeks of occurrences."""
+    query = of(daily_event_with_long_modifications())
+    (series,) = query.series
+    assert series.generated_candidates == series.yielded_occurrences == 0
+    assert series.checked_modifications == 0
+    events = query.at((2020, 6, 1, 10))
+    assert len(events) == 1
+    assert series.yielded_occurrences == 1
+    assert series.generated_candidates <= 3
+
+
+def daily_event_rescheduled_every_week(weeks: int) -> Calendar:
+    """A daily event that moves an hour later with RANGE=THISANDFUTURE each week."""
+    calendar = Calendar()
+    core = Event()
+    core.add("UID", "rescheduled")
+    core.add("DTSTART", datetime(2020, 1, 6, 8))
+    core.add("DURATION", timedelta(hours=1))
+    core.add("RRULE", {"FREQ": "DAILY"})
+    calendar.add_component(core)
+    for week in range(1, weeks):
+        recurrence_id = datetime(2020, 1, 6, 8) + timedelta(weeks=week)
+        modification = Event()
+        modification.add("UID", "rescheduled")
+        modification.add("RECURRENCE-ID", recurrence_id, {"RANGE": "THISANDFUTURE"})
+        modification.add("DTSTART", recurrence_id + timedelta(hours=week % 10))
+        modification.add("DURATION", timedelta(hours=1))
+        calendar.add_component(modification)
+    return calendar
+
+
+@pytest.mark.parametrize("weeks", [1, 10, 50])
+def test_candidates_grow_with_the_span_and_not_with_the_segments(weeks):
+    """Each segment only calculates its own recurrences."""
+    query = of(daily_event_rescheduled_every_week(50))
+    (series,) = query.series
+    events = query.between((2020, 1, 6), timedelta(weeks=weeks))
+    assert len(events) == weeks * 7
+    # Each segment in the span can calculate the recurrences at its bounds.
+    assert weeks * 7 <= series.generated_candidates <= weeks * 7 + 2 * (weeks + 1)
+    # The modifications near the span are checked, too.
+    assert weeks - 1 <= series.checked_modifications <= weeks + 1
+
+
+def test_all_calculated_recurrences_are_counted(monkeypatch):
+    """The recurrences of other segments are counted, too."""
+    (series,) = of(daily_event_rescheduled_every_week(50)).series
+    calculated = []
+    rrule_between = series.recurrence.rrule_between
+
+    def count(span_start, span_stop):
+        for start in rrule_between(span_start, span_stop):
+            calculated.append(start)
+            yield start
+
+    monkeypatch.setattr(series.recurrence, "rrule_between", count)
+    recurrences = list(series.rrule_between(datetime(2020, 1, 6), datetime(2020, 4, 6)))
+    assert len(recurrences) < len(calculated) == series.generated_candidates
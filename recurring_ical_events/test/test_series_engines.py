@@ -0,0 +1,141 @@
+"""Series with only dates or only UTC do not need timezone calculations.
+
+These series use their own strategy to calculate the recurrences.
+The occurrences must be the same as with the general strategy.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytz
+from icalendar import Event
+
+from recurring_ical_events import ComponentsWithName, Series, of
+from recurring_ical_events.adapters.event import EventAdapter
+from recurring_ical_events.test.conftest import ICSCalendars
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+
+class GeneralSeries(Series):
+    """Calculate every series with timezones."""
+
+    UTCRecurrenceRules = Series.RecurrenceRules
+    AllDayRecurrenceRules = Series.RecurrenceRules
+
+
+def series_of(start, end=None, **properties):
+    """Return a series of an event."""
+    event = Event()
+    event.add("UID", "test")
+    event.add("DTSTART", start)
+    if end is not None:
+        event.add("DTEND", end)
+    for name, value in properties.items():
+        event.add(name, value)
+    return Series([EventAdapter(event)])
+
+
+@pytest.mark.parametrize(
+    ("series", "strategy"),
+    [
+        (series_of(date(2024, 1, 1)), Series.AllDayRecurrenceRules),
+        (
+            series_of(date(2024, 1, 1), date(2024, 1, 3), EXDATE=date(2024, 1, 8)),
+            Series.AllDayRecurrenceRules,
+        ),
+        (
+            series_of(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            Series.UTCRecurrenceRules,
+        ),
+        (series_of(pytz.utc.localize(datetime(2024, 1, 1))), Series.UTCRecurrenceRules),
+        (
+            series_of(datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))),
+            Series.UTCRecurrenceRules,
+        ),
+        (series_of(datetime(2024, 1, 1)), Series.UTCRecurrenceRules),
+        (
+            series_of(
+                datetime(2024, 1, 1), RDATE=datetime(2024, 1, 1, tzinfo=timezone.utc)
+            ),
+            Series.UTCRecurrenceRules,
+        ),
+        (
+            series_of(datetime(2024, 1, 1, tzinfo=ZoneInfo("Europe/Berlin"))),
+            Series.RecurrenceRules,
+        ),
+        (
+            series_of(
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+                EXDATE=datetime(2024, 1, 1, tzinfo=ZoneInfo("Europe/London")),
+            ),
+            Series.RecurrenceRules,
+        ),
+        (
+            series_of(date(2024, 1, 1), RDATE=datetime(2024, 1, 3, 12)),
+            Series.RecurrenceRules,
+        ),
+        (
+            series_of(datetime(2024, 1, 1), DURATION=timedelta(hours=1)),
+            Series.UTCRecurrenceRules,
+        ),
+        (
+            series_of(
+                datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            ),
+            Series.RecurrenceRules,
+        ),
+    ],
+)
+def test_strategy_is_chosen_by_the_times(series, strategy):
+    """Check which strategy calculates the series."""
+    assert type(series.recurrence) is strategy
+
+
+def test_series_without_core_has_no_recurrence():
+    """Modifications on their own do not recur."""
+    series = series_of(date(2024, 1, 2), **{"RECURRENCE-ID": date(2024, 1, 1)})
+    assert type(series.recurrence) is Series.NoRecurrence
+
+
+def test_all_day_occurrences_are_dates():
+    """The occurrences of a series with dates are dates."""
+    series = series_of(date(2024, 1, 1), date(2024, 1, 2), RRULE={"FREQ": "DAILY"})
+    occurrences = list(series.between(date(2024, 1, 1), date(2024, 1, 4)))
+    assert sorted(occurrence.start for occurrence in occurrences) == [
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+        date(2024, 1, 3),
+    ]
+    for occurrence in occurrences:
+        assert type(occurrence.end) is date
+
+
+def occurrence_times(occurrences):
+    """The times of the occurrences with their types."""
+    return sorted(
+        (
+            occurrence.uid,
+            str(occurrence.start),
+            str(occurrence.end),
+            type(occurrence.start).__name__,
+        )
+        for occurrence in occurrences
+    )
+
+
+def test_same_occurrences_as_general_strategy(tzp, calendar_name):
+    """The occurrences are the same as if we calculated them with timezones."""
+    calendar = ICSCalendars(tzp)[calendar_name]
+    fast = of(calendar, skip_bad_series=True)
+    general = of(
+        calendar,
+        skip_bad_series=True,
+        components=[ComponentsWithName("VEVENT", series=GeneralSeries)],
+    )
+    assert occurrence_times(
+        fast.occurrences_between((2015, 1, 1), (2026, 1, 1))
+    ) == occurrence_times(general.occurrences_between((2015, 1, 1), (2026, 1, 1)))
@@ -0,0 +1,109 @@
+"""Read calendars incrementally."""
+
+import io
+
+import icalendar
+import pytest
+
+from recurring_ical_events import of, of_file, of_stream
+from recurring_ical_events.stream import calendar_from_stream, unfold_lines
+from recurring_ical_events.test.conftest import CALENDARS_FOLDER
+
+CALENDAR_PATHS = sorted(CALENDARS_FOLDER.glob("*.ics"))
+
+
+def chunked(data, size):
+    """Split the data into chunks."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("path", CALENDAR_PATHS, ids=lambda path: path.stem)
+@pytest.mark.parametrize("chunk_size", [1, 7, 100000])
+def test_calendar_is_the_same_as_parsed_by_icalendar(path, chunk_size):
+    """The chunks can be split anywhere."""
+    data = path.read_bytes()
+    calendar = calendar_from_stream(chunked(data, chunk_size))
+    assert calendar.to_ical() == icalendar.Calendar.from_ical(data).to_ical()
+
+
+@pytest.mark.parametrize(
+    ("chunks", "lines"),
+    [
+        (["A:1\r\nB:2\r\n"], ["A:1", "B:2"]),
+        (["A:1\nB:2"], ["A:1", "B:2"]),
+        (["A:1\r", "\n 2\r\n\tx"], ["A:12x"]),
+        ([b"\xef\xbb\xbfA:\xc3", b"\xb6"], ["A:ö"]),
+        (["\ufeffA:1"], ["A:1"]),
+        ([], []),
+    ],
+)
+def test_unfold_lines(chunks, lines):
+    """Lines are unfolded across chunks."""
+    assert list(unfold_lines(chunks)) == lines
+
+
+def test_of_file_with_path():
+    """A file can be read from a path."""
+    path = CALENDARS_FOLDER / "machbar_16_feb_2019.ics"
+    expected = of(icalendar.Calendar.from_ical(path.read_bytes()))
+    for query in of_file(path), of_file(str(path)):
+        assert [event.to_ical() for event in query.between(2019, 2020)] == [
+            event.to_ical() for event in expected.between(2019, 2020)
+        ]
+
+
+@pytest.mark.parametrize("mode", ["rb", "r"])
+def test_of_file_with_open_file(mode):
+    """Files can be read as text and as bytes."""
+    path = CALENDARS_FOLDER / "one_day_event_repeat_every_day.ics"
+    with path.open(mode) as file:
+        query = of_file(file, components=["VEVENT"])
+    assert len(query.between((2019, 3, 4), (2019, 3, 8))) == 4
+
+
+def test_of_stream_passes_arguments():
+    """The arguments of of() can be used."""
+    data = (CALENDARS_FOLDER / "one_day_event_repeat_every_day.ics").read_text()
+    query = of_stream(chunked(data, 10), keep_recurrence_attributes=True)
+    assert "RRULE" in query.first
+
+
+FORWARD_REFERENCE = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:test
+BEGIN:VEVENT
+UID:forward-reference
+DTSTART;TZID="Stream Test/Forward Reference":20240101T120000
+DURATION:PT1H
+END:VEVENT
+BEGIN:VTIMEZONE
+TZID:Stream Test/Forward Reference
+BEGIN:STANDARD
+DTSTART:19700101T000000
+TZOFFSETFROM:+0530
+TZOFFSETTO:+0530
+END:STANDARD
+END:VTIMEZONE
+END:VCALENDAR
+"""
+
+
+def test_timezone_after_the_event():
+    """A VTIMEZONE can come after the components that use it."""
+    query = of_stream(io.StringIO(FORWARD_REFERENCE))
+    event = query.first
+    assert event.start.utcoffset().total_seconds() == 5.5 * 3600
+
+
+@pytest.mark.parametrize(
+    "ics",
+    [
+        "BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\nBEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n",
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:1\r\n",
+        "END:VEVENT\r\n",
+    ],
+)
+def test_invalid_calendars(ics):
+    """Invalid calendars raise a ValueError."""
+    with pytest.raises(ValueError):
+        calendar_from_stream([ics])
@@ -0,0 +1,128 @@
+"""Series that are rescheduled often with RANGE=THISANDFUTURE.
+
+Each modification with RANGE=THISANDFUTURE starts a new segment of the series.
+The segment of an occurrence is found by bisection and only the segments
+that can have occurrences in the query span are calculated.
+
+See also test_issue_75_range_parameter.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from icalendar import Calendar, Event
+
+from recurring_ical_events import of
+from recurring_ical_events.util import to_epoch
+
+WEEKS = 100
+
+
+def rescheduled_every_week() -> Calendar:
+    """A daily event of which the time moves an hour later every week.
+
+    The event of week n starts at 8 + n % 10 o'clock and lasts n % 3 + 1 hours.
+    """
+    calendar = Calendar()
+    core = Event()
+    core.add("UID", "rescheduled")
+    core.add("DTSTART", datetime(2020, 1, 6, 8))
+    core.add("DURATION", timedelta(hours=1))
+    core.add("RRULE", {"FREQ": "DAILY"})
+    core.add("SUMMARY", "week 0")
+    calendar.add_component(core)
+    for week in range(1, WEEKS):
+        recurrence_id = datetime(2020, 1, 6, 8) + timedelta(weeks=week)
+        start = recurrence_id + timedelta(hours=week % 10)
+        modification = Event()
+        modification.add("UID", "rescheduled")
+        modification.add("RECURRENCE-ID", recurrence_id, {"RANGE": "THISANDFUTURE"})
+        modification.add("DTSTART", start)
+        modification.add("DURATION", timedelta(hours=week % 3 + 1))
+        modification.add("SUMMARY", f"week {week}")
+        calendar.add_component(modification)
+    return calendar
+
+
+@pytest.fixture(scope="module")
+def query():
+    """The query for the rescheduled calendar."""
+    return of(rescheduled_every_week())
+
+
+@pytest.mark.parametrize("week", [0, 1, 2, 9, 10, 50, 99])
+@pytest.mark.parametrize("day", range(7))
+def test_event_in_the_right_week(query, week, day):
+    """Each week has its own time and duration."""
+    date = datetime(2020, 1, 6) + timedelta(weeks=week, days=day)
+    (event,) = query.at(date.date())
+    assert event["SUMMARY"] == f"week {week}"
+    hour = 8 + (week % 10 if week else 0)
+    assert event["DTSTART"].dt == date + timedelta(hours=hour)
+    duration = timedelta(hours=week % 3 + 1 if week else 1)
+    assert event["DTEND"].dt - event["DTSTART"].dt == duration
+
+
+def test_all_weeks_are_there(query):
+    """We have one event each day."""
+    events = query.between((2020, 1, 6), datetime(2020, 1, 6) + timedelta(weeks=WEEKS))
+    assert len(events) == WEEKS * 7
+    assert len({event["SUMMARY"] for event in events}) == WEEKS
+
+
+def test_segments(query):
+    """The series has one segment per component with RANGE=THISANDFUTURE."""
+    (series,) = query.series
+    assert len(series.segments) == WEEKS
+    assert series.segments[0].start is None
+    assert series.segments[-1].stop is None
+    for segment1, segment2 in zip(series.segments, series.segments[1:]):
+        assert segment1.stop == segment2.start
+
+
+def count_expansions(series, monkeypatch) -> list[list]:
+    """Record the recurrences of each expansion of the rule of the series."""
+    expanded = []
+    rrule_between = series.recurrence.rrule_between
+
+    def count(span_start, span_stop):
+        expanded.append([])
+        for start in rrule_between(span_start, span_stop):
+            expanded[-1].append(start)
+            yield start
+
+    monkeypatch.setattr(series.recurrence, "rrule_between", count)
+    return expanded
+
+
+def test_only_few_segments_are_calculated(query, monkeypatch):
+    """We do not expand the rule for segments far away."""
+    (series,) = query.series
+    expanded = count_expansions(series, monkeypatch)
+    query.at((2021, 1, 1))
+    assert 1 <= len(expanded) <= 2
+
+
+def test_each_recurrence_is_expanded_by_its_segment(query, monkeypatch):
+    """The segments do not calculate the recurrences of the other segments."""
+    (series,) = query.series
+    expanded = count_expansions(series, monkeypatch)
+    events = query.between((2020, 1, 6), datetime(2020, 1, 6) + timedelta(weeks=WEEKS))
+    assert len(events) == WEEKS * 7
+    # Each segment can calculate the recurrences at its bounds.
+    assert len(expanded) == WEEKS
+    assert sum(map(len, expanded)) <= WEEKS * 7 + 2 * WEEKS
+
+
+@pytest.mark.parametrize("week", [0, 1, 50, 99])
+def test_component_for_recurrence_id(query, week):
+    """The component is found by an epoch or a datetime in UTC."""
+    (series,) = query.series
+    recurrence_id = datetime(2020, 1, 6, 8) + timedelta(weeks=week, days=1)
+    component = series.get_component_for_recurrence_id(recurrence_id)
+    assert component.start == datetime(2020, 1, 6, 8) + timedelta(
+        weeks=week, hours=week % 10
+    )
+    assert series.get_component_for_recurrence_id(to_epoch(recurrence_id)) is component
@@ -0,0 +1,223 @@
+"""Test the compiled timezones that are shared by all series."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import icalendar
+import pytest
+import pytz
+
+from recurring_ical_events.adapters.event import EventAdapter
+from recurring_ical_events.series import Series
+from recurring_ical_events.timezones import (
+    TIMEZONE_REGISTRY,
+    TimezoneRegistry,
+    TransitionTable,
+    compile_timezone,
+)
+from recurring_ical_events.util import convert_to_datetime, to_epoch
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+BERLIN = [ZoneInfo("Europe/Berlin"), pytz.timezone("Europe/Berlin")]
+
+
+@pytest.fixture(params=BERLIN)
+def berlin(request):
+    """The table of Berlin with both timezone implementations."""
+    return compile_timezone(request.param)
+
+
+# summer time 2024 in Berlin: 31.3. 02:00 -> 03:00 and 27.10. 03:00 -> 02:00
+WINTER = to_epoch(datetime(2024, 1, 1, 12))
+SUMMER = to_epoch(datetime(2024, 7, 1, 12))
+GAP = to_epoch(datetime(2024, 3, 31, 2, 30))
+FOLD = to_epoch(datetime(2024, 10, 27, 2, 30))
+
+
+@pytest.mark.parametrize(
+    ("local", "offset"),
+    [
+        (WINTER, 3600),
+        (SUMMER, 7200),
+        (to_epoch(datetime(2024, 3, 31, 1, 59, 59)), 3600),
+        (to_epoch(datetime(2024, 3, 31, 3)), 7200),
+        (to_epoch(datetime(2024, 10, 27, 1, 59, 59)), 7200),
+        (to_epoch(datetime(2024, 10, 27, 3)), 3600),
+    ],
+)
+def test_convert_local_and_utc(berlin, local, offset):
+    """Convert unambiguous wall clock times."""
+    assert berlin.to_utc(local) == local - offset
+    assert berlin.from_utc(local - offset) == local
+    assert berlin.utc_offset(local - offset) == offset
+
+
+@pytest.mark.parametrize("local", [GAP, FOLD])
+def test_the_timezone_decides_at_transitions(berlin, local):
+    """Skipped and repeated times are left to the timezone."""
+    assert berlin.to_utc(local) is None
+
+
+def test_compiled_zoneinfo_is_limited_to_the_range():
+    """We do not know what happens outside of the compiled range."""
+    table = compile_timezone(ZoneInfo("Europe/Berlin"))
+    assert table.from_utc(to_epoch(date(2100, 1, 1))) is None
+    assert table.to_utc(to_epoch(date(1900, 1, 1))) is None
+
+
+@pytest.mark.parametrize(
+    ("tzinfo", "offset"),
+    [
+        (timezone.utc, 0),
+        (timezone(timedelta(hours=-5)), -18000),
+        (pytz.utc, 0),
+    ],
+)
+def test_fixed_offset(tzinfo, offset):
+    """Fixed offsets have no transitions."""
+    table = TimezoneRegistry().get(tzinfo)
+    assert table.transitions == ()
+    assert table.to_utc(SUMMER) == SUMMER - offset
+
+
+def test_pytz_timezones_share_their_table():
+    """pytz has a tzinfo for each offset of a timezone."""
+    registry = TimezoneRegistry()
+    tz = pytz.timezone("Europe/Berlin")
+    summer = tz.localize(datetime(2024, 7, 1)).tzinfo
+    winter = tz.localize(datetime(2024, 1, 1)).tzinfo
+    assert summer is not winter
+    assert registry.get(summer) is registry.get(winter)
+    assert registry.compiled == 1
+
+
+def test_a_timezone_is_compiled_once():
+    """The registry remembers the timezones."""
+    registry = TimezoneRegistry()
+    table = registry.get(ZoneInfo("Europe/Berlin"))
+    assert registry.get(ZoneInfo("Europe/Berlin")) is table
+    assert registry.compiled == 1
+    assert len(registry) == 1
+
+
+CUSTOM_TIMEZONE = b"""BEGIN:VCALENDAR
+BEGIN:VTIMEZONE
+TZID:My Custom Zone
+BEGIN:STANDARD
+DTSTART:19701025T030000
+RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU
+TZOFFSETFROM:+0200
+TZOFFSETTO:+0100
+END:STANDARD
+BEGIN:DAYLIGHT
+DTSTART:19700329T020000
+RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU
+TZOFFSETFROM:+0100
+TZOFFSETTO:+0200
+END:DAYLIGHT
+END:VTIMEZONE
+BEGIN:VEVENT
+UID:custom
+DTSTART;TZID=My Custom Zone:20240701T120000
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+@pytest.mark.parametrize("use_provider", [icalendar.use_pytz, icalendar.use_zoneinfo])
+def test_same_vtimezone_in_different_calendars_is_shared(use_provider):
+    """Custom timezones are created per calendar but compiled to the same table."""
+    use_provider()
+    try:
+        registry = TimezoneRegistry()
+        tables = []
+        for _ in range(2):
+            calendar = icalendar.Calendar.from_ical(CUSTOM_TIMEZONE)
+            tzinfo = calendar.walk("VEVENT")[0]["DTSTART"].dt.tzinfo
+            tables.append(registry.get(tzinfo))
+        assert tables[0] is tables[1]
+        assert tables[0].to_utc(SUMMER) == SUMMER - 7200
+    finally:
+        icalendar.use_zoneinfo()
+
+
+def custom_timezone(dtstart: str = "19701025T030000"):
+    """The custom timezone of a VTIMEZONE parsed by dateutil."""
+    icalendar.use_zoneinfo()
+    calendar = icalendar.Calendar.from_ical(
+        CUSTOM_TIMEZONE.replace(b"19701025T030000", dtstart.encode())
+    )
+    return calendar.walk("VEVENT")[0]["DTSTART"].dt.tzinfo
+
+
+def test_vtimezone_is_compiled_from_its_rules():
+    """The transitions are the onsets of STANDARD and DAYLIGHT."""
+    tzinfo = custom_timezone()
+    table = compile_timezone(tzinfo)
+    berlin = compile_timezone(ZoneInfo("Europe/Berlin"))
+    since_1996 = to_epoch(date(1996, 1, 1))
+    assert [t for t in table.transitions if t >= since_1996] == [
+        t for t in berlin.transitions if t >= since_1996
+    ]
+    assert table.utc_offset(0) == 3600
+
+
+@pytest.mark.parametrize("year", [1975, 2000, 2024, 2037])
+def test_vtimezone_converts_like_dateutil(year):
+    """The wall clock times have the offsets that dateutil calculates."""
+    tzinfo = custom_timezone()
+    table = compile_timezone(tzinfo)
+    local = datetime(year, 1, 1)
+    while local.year == year:
+        utc = table.to_utc(to_epoch(local))
+        if utc is not None:
+            assert utc == to_epoch(local.replace(tzinfo=tzinfo))
+        local += timedelta(hours=5)
+
+
+@pytest.mark.parametrize("dtstart", ["16011028T030000", "19701025T030000"])
+def test_onsets_before_the_range_are_used(dtstart):
+    """The table starts with the offset of the last onset before it."""
+    table = compile_timezone(
+        custom_timezone(dtstart), SUMMER - 7200, to_epoch(date(2025, 1, 1))
+    )
+    assert table.utc_offset(SUMMER - 7200) == 7200
+    assert table.to_utc(WINTER) is None
+    assert (
+        table.to_utc(to_epoch(datetime(2024, 12, 1)))
+        == to_epoch(datetime(2024, 12, 1)) - 3600
+    )
+
+
+def test_there_is_one_offset_more_than_transitions():
+    """Check the structure of the table."""
+    with pytest.raises(ValueError):
+        TransitionTable([1, 2], [0, 1])
+
+
+@pytest.mark.parametrize("tzinfo", [*BERLIN, None])
+@pytest.mark.parametrize(
+    "time",
+    [
+        date(2024, 1, 1),
+        datetime(2024, 7, 1, 12),
+        datetime(2024, 3, 31, 2, 30),
+        datetime(2024, 10, 27, 2, 30),
+        datetime(2024, 10, 27, 2, 30, tzinfo=timezone.utc),
+    ],
+)
+def test_span_is_normalized_like_before(tzinfo, time):
+    """The series converts the query span with the shared table."""
+    start = datetime(2024, 1, 1)
+    start = start if tzinfo is None else convert_to_datetime(start, tzinfo)
+    event = icalendar.Event()
+    event.add("UID", "test")
+    event.add("DTSTART", start)
+    event.add("RRULE", {"FREQ": "DAILY"})
+    recurrence = Series([EventAdapter(event)]).recurrence
+    assert recurrence.span_epoch(time) == to_epoch(convert_to_datetime(time, tzinfo))
+    if tzinfo is not None:
+        assert recurrence.transitions is TIMEZONE_REGISTRY.get(tzinfo)
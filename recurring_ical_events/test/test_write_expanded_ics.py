@@ -0,0 +1,90 @@
+"""Write the occurrences into a calendar without recurrences."""
+
+import io
+
+import icalendar
+import pytest
+
+from recurring_ical_events import of
+from recurring_ical_events.test.conftest import ICSCalendars
+
+SPAN = ((2019, 1, 1), (2020, 1, 1))
+
+
+def expand(query, start=SPAN[0], stop=SPAN[1]):
+    """Return the count and the written calendar."""
+    file = io.BytesIO()
+    count = query.write_expanded_ics(file, start, stop)
+    return count, icalendar.Calendar.from_ical(file.getvalue())
+
+
+def test_all_occurrences_are_written(tzp, calendar_name):
+    """The calendar has one component for each occurrence."""
+    calendar = ICSCalendars(tzp)[calendar_name]
+    query = of(
+        calendar, components=["VEVENT", "VTODO", "VJOURNAL"], skip_bad_series=True
+    )
+    count, expanded = expand(query)
+    components = query.between(*SPAN)
+    assert count == len(components)
+    assert len(expanded.subcomponents) - len(expanded.timezones) == count
+    assert [component.to_ical() for component in components] == [
+        component.to_ical()
+        for component in expanded.subcomponents
+        if component.name != "VTIMEZONE"
+    ]
+
+
+def test_expanded_calendar_has_no_recurrences(calendars):
+    """The occurrences of the expanded calendar are the same."""
+    query = calendars.machbar_16_feb_2019
+    count, expanded = expand(query)
+    assert count > 0
+    assert all("RRULE" not in event for event in expanded.events)
+    assert [event.start for event in of(expanded).between(*SPAN)] == [
+        event.start for event in query.between(*SPAN)
+    ]
+
+
+def test_header_is_copied(calendars):
+    """The properties of the calendar are kept."""
+    _, expanded = expand(calendars.machbar_16_feb_2019)
+    assert expanded["PRODID"] == "-//Google Inc//Google Calendar 70.9054//EN"
+    assert expanded["METHOD"] == "PUBLISH"
+
+
+def test_header_has_the_required_properties():
+    """A calendar without VERSION and PRODID gets them."""
+    calendar = icalendar.Calendar()
+    event = icalendar.Event()
+    event.add("UID", "event")
+    event.add("DTSTART", icalendar.vDate.from_ical("20190304"))
+    calendar.add_component(event)
+    count, expanded = expand(of(calendar))
+    assert count == 1
+    assert expanded["VERSION"] == "2.0"
+    assert expanded["PRODID"] == of(calendar).expanded_calendar_defaults["PRODID"]
+
+
+@pytest.mark.parametrize(
+    ("calendar_name", "tzids"),
+    [
+        ("machbar_16_feb_2019", ["Europe/Berlin"]),
+        ("one_day_event_repeat_every_day", []),
+    ],
+)
+def test_only_referenced_timezones_are_written(calendars, calendar_name, tzids):
+    """Unused VTIMEZONEs are left out."""
+    calendar = calendars.raw[calendar_name]
+    calendar.add_component(icalendar.Timezone.from_tzid("Asia/Tokyo"))
+    _, expanded = expand(of(calendar))
+    assert [timezone["TZID"] for timezone in expanded.timezones] == tzids
+
+
+def test_projection_is_used(calendars):
+    """The components have only the selected properties."""
+    query = of(calendars.raw.machbar_16_feb_2019, properties=["UID", "DTSTART"])
+    _, expanded = expand(query)
+    assert expanded.events
+    for event in expanded.events:
+        assert set(event) == {"UID", "DTSTART"}
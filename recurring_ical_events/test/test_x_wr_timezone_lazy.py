@@ -0,0 +1,91 @@
+"""X-WR-TIMEZONE is applied to the components when they are walked.
+
+The result should be the same as that of x_wr_timezone.to_standard().
+"""
+
+import pytest
+import x_wr_timezone
+
+import recurring_ical_events
+from recurring_ical_events.standard import StandardCalendar, to_standard
+
+X_WR_TIMEZONE_CALENDARS = [
+    "Germany_Holidays",
+    "daylight_saving_time",
+    "discourse_no_dtend",
+    "issue_61_time_zone_error",
+    "issue_62_moved_event",
+    "issue_86_x_wr_timezone_without_time_zone_in_dt",
+    "machbar_16_feb_2019",
+    "x_wr_timezone_simple_events_issue_59",
+]
+
+
+@pytest.mark.parametrize("calendar_name", X_WR_TIMEZONE_CALENDARS)
+@pytest.mark.parametrize("name", ["VEVENT", "VTIMEZONE", "VALARM", None])
+def test_walk_is_the_same_as_x_wr_timezone(calendars, calendar_name, name):
+    """We convert the components like x_wr_timezone."""
+    expected = x_wr_timezone.to_standard(calendars.raw[calendar_name]).walk(name)
+    calendar = calendars.raw[calendar_name]
+    standard = to_standard(calendar)
+    assert isinstance(standard, StandardCalendar)
+    assert [component.to_ical() for component in standard.walk(name)] == [
+        component.to_ical() for component in expected
+    ]
+
+
+@pytest.mark.parametrize("calendar_name", X_WR_TIMEZONE_CALENDARS)
+def test_original_calendar_is_not_changed(calendars, calendar_name):
+    """The calendar that we get is not modified."""
+    calendar = calendars.raw[calendar_name]
+    ics = calendar.to_ical()
+    to_standard(calendar).walk()
+    assert calendar.to_ical() == ics
+
+
+@pytest.mark.parametrize("calendar_name", X_WR_TIMEZONE_CALENDARS)
+def test_components_are_shared(calendars, calendar_name):
+    """The components are not copied with the calendar."""
+    calendar = calendars.raw[calendar_name]
+    standard = to_standard(calendar)
+    assert standard.subcomponents is calendar.subcomponents
+    assert standard["X-WR-TIMEZONE"] == calendar["X-WR-TIMEZONE"]
+
+
+def test_events_are_converted_once(calendars):
+    """Several walks return the same converted events."""
+    standard = to_standard(calendars.raw.x_wr_timezone_simple_events_issue_59)
+    events = standard.walk("VEVENT")
+    assert events
+    for event, again in zip(events, standard.walk("VEVENT")):
+        assert event is again
+
+
+def test_no_x_wr_timezone_is_not_changed(calendars):
+    """Calendars without X-WR-TIMEZONE are returned as they are."""
+    calendar = calendars.raw.three_events
+    assert to_standard(calendar) is calendar
+
+
+def test_of_does_not_copy_the_calendar(calendars):
+    """The query uses the components of the calendar."""
+    calendar = calendars.raw.x_wr_timezone_simple_events_issue_59
+    query = recurring_ical_events.of(calendar)
+    assert query.calendar.subcomponents is calendar.subcomponents
+
+
+@pytest.mark.parametrize("calendar_name", X_WR_TIMEZONE_CALENDARS)
+@pytest.mark.parametrize("components", [["VEVENT"], ["VALARM"], ["VEVENT", "VTODO"]])
+def test_query_is_the_same_as_x_wr_timezone(calendars, calendar_name, components):
+    """The occurrences are the same."""
+    expected = recurring_ical_events.CalendarQuery(
+        x_wr_timezone.to_standard(calendars.raw[calendar_name]),
+        components=components,
+        skip_bad_series=True,
+    )
+    query = recurring_ical_events.of(
+        calendars.raw[calendar_name], components=components, skip_bad_series=True
+    )
+    assert [component.to_ical() for component in query.between(2019, 2021)] == [
+        component.to_ical() for component in expected.between(2019, 2021)
+    ]
@@ -0,0 +1,82 @@
+"""Calculate calendars with pytz timezones in zoneinfo.
+
+ZoneInfoSeries converts the pytz timezones once so that the calculation
+does not need to localize and normalize the times.
+The occurrences must happen at the same times.
+"""
+
+from datetime import datetime
+
+import icalendar
+import pytest
+
+from recurring_ical_events import ComponentsWithName, ZoneInfoSeries, of
+from recurring_ical_events.test.conftest import ICSCalendars
+from recurring_ical_events.util import is_pytz_dt, pytz_to_zoneinfo, to_epoch
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+import pytz
+
+
+@pytest.fixture
+def pytz_calendar(calendar_name):
+    """The calendar parsed with pytz timezones."""
+    try:
+        yield ICSCalendars(icalendar.use_pytz)[calendar_name]
+    finally:
+        icalendar.use_zoneinfo()
+
+
+def times(components):
+    """The times of the components."""
+    return sorted(
+        (
+            component.get("UID", ""),
+            to_epoch(component["DTSTART"].dt),
+            to_epoch(component["DTEND"].dt) if "DTEND" in component else None,
+        )
+        for component in components
+    )
+
+
+def test_same_occurrences_as_with_pytz(pytz_calendar):
+    """The occurrences happen at the same time."""
+    pytz_query = of(pytz_calendar, skip_bad_series=True)
+    zoneinfo_query = of(
+        pytz_calendar,
+        skip_bad_series=True,
+        components=[ComponentsWithName("VEVENT", series=ZoneInfoSeries)],
+    )
+    pytz_events = pytz_query.between((2015, 1, 1), (2026, 1, 1))
+    zoneinfo_events = zoneinfo_query.between((2015, 1, 1), (2026, 1, 1))
+    assert times(zoneinfo_events) == times(pytz_events)
+    for event in zoneinfo_events:
+        assert not is_pytz_dt(event["DTSTART"].dt)
+
+
+@pytest.mark.parametrize(
+    ("time", "expected"),
+    [
+        (
+            pytz.timezone("Europe/Berlin").localize(datetime(2019, 3, 31, 12)),
+            datetime(2019, 3, 31, 12, tzinfo=ZoneInfo("Europe/Berlin")),
+        ),
+        (
+            pytz.timezone("America/New_York").localize(
+                datetime(2019, 11, 3, 1, 30), is_dst=False
+            ),
+            datetime(2019, 11, 3, 1, 30, fold=1, tzinfo=ZoneInfo("America/New_York")),
+        ),
+        (datetime(2019, 3, 31, 12), datetime(2019, 3, 31, 12)),
+    ],
+)
+def test_pytz_to_zoneinfo(time, expected):
+    """Check the conversion keeps the time and wall clock."""
+    converted = pytz_to_zoneinfo(time)
+    assert converted.tzinfo == expected.tzinfo
+    assert converted.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert converted.fold == expected.fold
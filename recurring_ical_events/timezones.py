@@ -0,0 +1,278 @@
+"""Timezones compiled to integer transition tables.
+
+Converting between local time and UTC through a tzinfo object calls
+its Python implementation again and again.
+A :class:`TransitionTable` compiles the UTC offsets of a timezone once
+so that conversions of epochs (see :func:`recurring_ical_events.util.to_epoch`)
+are a binary search.
+
+The :data:`TIMEZONE_REGISTRY` is shared by all series and calendars in the
+process so that each timezone is compiled only once.
+"""
+
+from __future__ import annotations
+
+import datetime
+import weakref
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from recurring_ical_events.constants import DATE_MAX, DATE_MIN
+from recurring_ical_events.util import (
+    EPOCH,
+    EPOCH_UTC,
+    SECONDS_PER_DAY,
+    is_pytz,
+    to_epoch,
+)
+
+if TYPE_CHECKING:
+    from recurring_ical_events.types import Epoch
+
+
+def _seconds(delta: datetime.timedelta) -> Epoch:
+    """Return the timedelta in whole seconds."""
+    return delta.days * SECONDS_PER_DAY + delta.seconds
+
+
+class TransitionTable:
+    """The UTC offsets of a timezone as integers.
+
+    ``offsets[0]`` applies before the first transition.
+    ``offsets[i]`` applies from ``transitions[i - 1]`` (UTC, inclusive)
+    until ``transitions[i]`` (UTC, exclusive).
+
+    ``first`` and ``last`` limit the UTC epochs that the table knows.
+    Conversions outside of them return None.
+    """
+
+    def __init__(
+        self,
+        transitions: Sequence[Epoch],
+        offsets: Sequence[Epoch],
+        first: Optional[Epoch] = None,
+        last: Optional[Epoch] = None,
+    ):
+        """Create a new table of transitions."""
+        if len(offsets) != len(transitions) + 1:
+            raise ValueError("There must be one offset more than transitions.")
+        self.transitions = tuple(transitions)
+        self.offsets = tuple(offsets)
+        self.first = first
+        self.last = last
+        # The wall clock time at which the offsets start and stop to be used.
+        self._local_starts = [
+            transition + offset
+            for transition, offset in zip(self.transitions, self.offsets[1:])
+        ]
+        self._local_stops = [
+            transition + offset
+            for transition, offset in zip(self.transitions, self.offsets)
+        ]
+
+    @property
+    def key(self) -> tuple:
+        """Tables with the same key convert in the same way."""
+        return (self.transitions, self.offsets, self.first, self.last)
+
+    def _knows(self, utc: Epoch) -> bool:
+        """Whether the UTC epoch is within the range of this table."""
+        return (self.first is None or self.first <= utc) and (
+            self.last is None or utc <= self.last
+        )
+
+    def utc_offset(self, utc: Epoch) -> Optional[Epoch]:
+        """The UTC offset in seconds at the UTC epoch."""
+        if not self._knows(utc):
+            return None
+        return self.offsets[bisect_right(self.transitions, utc)]
+
+    def from_utc(self, utc: Epoch) -> Optional[Epoch]:
+        """Convert the UTC epoch to the wall clock epoch."""
+        offset = self.utc_offset(utc)
+        return None if offset is None else utc + offset
+
+    def to_utc(self, local: Epoch) -> Optional[Epoch]:
+        """Convert the wall clock epoch to the UTC epoch.
+
+        Wall clock times that do not exist or exist twice because of
+        a transition return None. For those, the timezone has to decide.
+        """
+        index = bisect_right(self._local_starts, local)
+        if index < len(self._local_stops) and local >= self._local_stops[index]:
+            # The clock skipped this time.
+            return None
+        if index > 0 and local < self._local_stops[index - 1]:
+            # The clock was set back and this time happens twice.
+            return None
+        utc = local - self.offsets[index]
+        return utc if self._knows(utc) else None
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        return f"<{self.__class__.__name__} with {len(self.transitions)} transitions>"
+
+
+def compile_timezone(
+    tzinfo: datetime.tzinfo,
+    first: Epoch = to_epoch(datetime.date(*DATE_MIN)),  # noqa: B008
+    last: Epoch = to_epoch(datetime.date(*DATE_MAX)),  # noqa: B008
+    step: Epoch = 7 * SECONDS_PER_DAY,
+) -> TransitionTable:
+    """Compile the transitions of a timezone into a table.
+
+    - Fixed offsets have no transitions.
+    - pytz timezones carry their transitions with them.
+    - VTIMEZONEs parsed by dateutil are compiled from their rules,
+      see :func:`compile_vtimezone`.
+    - Other timezones are sampled from first to last every step seconds.
+      Transitions are then found to the second.
+      Changes that are reverted within one step are not found.
+    """
+    fixed_offset = tzinfo.utcoffset(None)
+    if fixed_offset is not None:
+        return TransitionTable((), (_seconds(fixed_offset),))
+    if is_pytz(tzinfo) and hasattr(tzinfo, "_utc_transition_times"):
+        # The first transition is datetime.min.
+        return TransitionTable(
+            [to_epoch(time) for time in tzinfo._utc_transition_times[1:]],  # noqa: SLF001
+            [_seconds(info[0]) for info in tzinfo._transition_info],  # noqa: SLF001
+        )
+    if hasattr(tzinfo, "_comps"):
+        # dateutil creates this from a VTIMEZONE
+        return compile_vtimezone(tzinfo, first, last)
+
+    def offset_at(utc: Epoch) -> Epoch:
+        time = EPOCH_UTC + datetime.timedelta(seconds=utc)
+        return _seconds(time.astimezone(tzinfo).utcoffset())
+
+    transitions = []
+    offsets = [offset_at(first)]
+    current = first
+    while current < last:
+        following = min(current + step, last)
+        if offset_at(following) == offsets[-1]:
+            current = following
+            continue
+        # binary search for the first second with a new offset
+        before, after = current, following
+        while after - before > 1:
+            middle = (before + after) // 2
+            if offset_at(middle) == offsets[-1]:
+                before = middle
+            else:
+                after = middle
+        transitions.append(after)
+        offsets.append(offset_at(after))
+        current = after
+    return TransitionTable(transitions, offsets, first, last)
+
+
+def compile_vtimezone(
+    tzinfo: datetime.tzinfo, first: Epoch, last: Epoch
+) -> TransitionTable:
+    """Compile a VTIMEZONE parsed by dateutil from its STANDARD and DAYLIGHT rules.
+
+    Each onset of a rule is a wall clock time in the offset before it.
+    Sampling the timezone instead would call dateutil for every sample.
+    Like dateutil, the first STANDARD rule applies before the first onset.
+    """
+    components = tzinfo._comps  # noqa: SLF001
+    # The onsets are wall clock times, so we expand them a day longer.
+    stop = EPOCH + datetime.timedelta(seconds=last + SECONDS_PER_DAY)
+    onsets = []
+    for component in components:
+        offset_from = _seconds(component.tzoffsetfrom)
+        offset_to = _seconds(component.tzoffsetto)
+        for onset in component.rrule:
+            if onset > stop:
+                break
+            onsets.append((to_epoch(onset) - offset_from, offset_to))
+    onsets.sort()
+    standard = next(
+        (component for component in components if not component.isdst),
+        components[0],
+    )
+    transitions = []
+    offsets = [_seconds(standard.tzoffsetto)]
+    for utc, offset in onsets:
+        if utc <= first:
+            offsets[0] = offset
+        elif utc <= last and offset != offsets[-1]:
+            transitions.append(utc)
+            offsets.append(offset)
+    return TransitionTable(transitions, offsets, first, last)
+
+
+class TimezoneRegistry:
+    """Compiled timezones shared by all series and calendars.
+
+    Each timezone is compiled once.
+    Timezones with the same definition share the same table,
+    for example the same VTIMEZONE in different calendars.
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._tables: weakref.WeakKeyDictionary[object, TransitionTable] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._fixed: dict[Epoch, TransitionTable] = {}
+        self._interned: weakref.WeakValueDictionary[tuple, TransitionTable] = (
+            weakref.WeakValueDictionary()
+        )
+        self.compiled = 0
+
+    @staticmethod
+    def _key(tzinfo: datetime.tzinfo) -> object:
+        """The object that identifies the timezone.
+
+        pytz creates one tzinfo per UTC offset of a zone.
+        They share their class.
+        """
+        return type(tzinfo) if is_pytz(tzinfo) else tzinfo
+
+    def get(self, tzinfo: datetime.tzinfo) -> TransitionTable:
+        """Return the compiled table of the timezone."""
+        key = self._key(tzinfo)
+        try:
+            return self._tables[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # The timezone cannot be referenced weakly like datetime.timezone.
+            return self._get_fixed(tzinfo)
+        table = self._intern(compile_timezone(tzinfo))
+        self._tables[key] = table
+        return table
+
+    def _get_fixed(self, tzinfo: datetime.tzinfo) -> TransitionTable:
+        """Return the table of a timezone with a fixed offset."""
+        offset = tzinfo.utcoffset(None)
+        if offset is None:
+            return self._intern(compile_timezone(tzinfo))
+        offset = _seconds(offset)
+        table = self._fixed.get(offset)
+        if table is None:
+            table = self._fixed[offset] = self._intern(compile_timezone(tzinfo))
+        return table
+
+    def _intern(self, table: TransitionTable) -> TransitionTable:
+        """Return the table with the same content that we know already."""
+        self.compiled += 1
+        return self._interned.setdefault(table.key, table)
+
+    def __len__(self) -> int:
+        """The number of timezones known."""
+        return len(self._tables) + len(self._fixed)
+
+
+TIMEZONE_REGISTRY = TimezoneRegistry()
+
+__all__ = [
+    "TIMEZONE_REGISTRY",
+    "TimezoneRegistry",
+    "TransitionTable",
+    "compile_timezone",
+    "compile_vtimezone",
+]
@@ -18,11 +18,15 @@ UID: TypeAlias = str
 Timestamp: TypeAlias = float
 RecurrenceID: TypeAlias = datetime.datetime
 RecurrenceIDs: TypeAlias = Tuple[RecurrenceID]
+Epoch: TypeAlias = int
+RecurrenceEpochs: TypeAlias = Tuple[Epoch]
 
 
 __all__ = [
     "UID",
     "DateArgument",
+    "Epoch",
+    "RecurrenceEpochs",
     "RecurrenceID",
     "RecurrenceIDs",
     "Time",
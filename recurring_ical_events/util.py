@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
+from icalendar.prop import vBoolean, vDuration
+
 from recurring_ical_events.errors import PeriodEndBeforeStart
 
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo
+
 if TYPE_CHECKING:
     from recurring_ical_events.adapters.component import ComponentAdapter
-    from recurring_ical_events.types import RecurrenceIDs, Time, Timestamp
+    from recurring_ical_events.types import (
+        Epoch,
+        RecurrenceEpochs,
+        RecurrenceIDs,
+        Time,
+        Timestamp,
+    )
+
+# The origin of the integer time model, see to_epoch()
+EPOCH = datetime.datetime(1970, 1, 1)  # noqa: DTZ001
+EPOCH_UTC = EPOCH.replace(tzinfo=datetime.timezone.utc)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
 
 
 def timestamp(dt: datetime.datetime) -> Timestamp:
@@ -39,6 +58,40 @@ def normalize_pytz(time: Time) -> Time:
     return time
 
 
+@lru_cache(maxsize=None)
+def _zoneinfo(key: str) -> Optional[datetime.tzinfo]:
+    """Return the zoneinfo timezone for the key or None if it is unknown."""
+    try:
+        return zoneinfo.ZoneInfo(key)
+    except (ValueError, KeyError):
+        # KeyError includes zoneinfo.ZoneInfoNotFoundError
+        return None
+
+
+def pytz_to_zoneinfo(time: Time) -> Time:
+    """Convert a datetime with a pytz timezone to the same time in zoneinfo.
+
+    Other times and pytz timezones that zoneinfo does not know,
+    like custom VTIMEZONE definitions, are returned unchanged.
+    """
+    if not is_pytz_dt(time):
+        return time
+    tzinfo = _zoneinfo(getattr(time.tzinfo, "zone", None) or "")
+    if tzinfo is None:
+        return time
+    return time.astimezone(tzinfo)
+
+
+def is_utc(tzinfo: Optional[datetime.tzinfo]) -> bool:
+    """Whether the timezone is UTC and never changes its offset."""
+    if tzinfo is None:
+        return False
+    offset = tzinfo.utcoffset(None)
+    if offset is None:
+        return getattr(tzinfo, "key", None) in ("UTC", "Etc/UTC")
+    return offset == datetime.timedelta(0)
+
+
 def is_date(time: Time) -> bool:
     """Whether this is a date and not a datetime."""
     return isinstance(time, datetime.date) and not isinstance(time, datetime.datetime)
@@ -224,6 +277,45 @@ def to_recurrence_ids(time: Time) -> RecurrenceIDs:
     )
 
 
+def to_epoch(time: Time) -> Epoch:
+    """Return the time as integer seconds since 1970-01-01.
+
+    - A datetime with a timezone is counted in UTC.
+    - A floating datetime is counted as if it were in UTC.
+    - A date is counted from its midnight, like a floating datetime.
+
+    Sub-second precision is dropped as iCalendar does not know it.
+    """
+    if not isinstance(time, datetime.datetime):
+        return (time.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+    if time.tzinfo is None:
+        return _wall_epoch(time)
+    delta = time - EPOCH_UTC
+    return delta.days * SECONDS_PER_DAY + delta.seconds
+
+
+def _wall_epoch(time: datetime.datetime) -> Epoch:
+    """The epoch of the wall clock time, ignoring the timezone."""
+    return (
+        (time.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+        + time.hour * 3600
+        + time.minute * 60
+        + time.second
+    )
+
+
+def to_recurrence_epochs(time: Time) -> RecurrenceEpochs:
+    """The integer version of to_recurrence_ids().
+
+    The first value identifies the time in UTC.
+    For times with a timezone, the second value is the wall clock time
+    so that floating RECURRENCE-IDs can be matched.
+    """
+    if isinstance(time, datetime.datetime) and time.tzinfo is not None:
+        return (to_epoch(time), _wall_epoch(time))
+    return (to_epoch(time),)
+
+
 def with_highest_sequence(
     adapter1: ComponentAdapter | None, adapter2: ComponentAdapter | None
 ):
@@ -243,6 +335,41 @@ def get_any(dictionary: dict, keys: Sequence[object], default: object = None):
     return result
 
 
+def to_json_value(value: object) -> object:
+    """Convert the value of a property to a value that json can encode.
+
+    - times are in ISO 8601 format and durations like in RFC 5545
+    - lists of values become tuples
+    - text stays text, numbers stay numbers
+    - other values are encoded like in RFC 5545
+    """
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return tuple(to_json_value(item) for item in value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return vDuration(value).to_ical().decode()
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, vBoolean):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if hasattr(value, "dt"):
+        return to_json_value(value.dt)
+    if hasattr(value, "dts"):  # vDDDLists
+        return to_json_value(value.dts)
+    if hasattr(value, "cats"):  # vCategory
+        return to_json_value(value.cats)
+    if hasattr(value, "latitude"):  # vGeo
+        return (value.latitude, value.longitude)
+    return value.to_ical().decode()
+
+
 __all__ = [
     "PeriodEndBeforeStart",
     "cmp",
@@ -254,9 +381,14 @@ __all__ = [
     "is_datetime",
     "is_pytz",
     "is_pytz_dt",
+    "is_utc",
     "make_comparable",
     "normalize_pytz",
+    "pytz_to_zoneinfo",
     "time_span_contains_event",
+    "to_epoch",
+    "to_json_value",
+    "to_recurrence_epochs",
     "to_recurrence_ids",
     "with_highest_sequence",
 ]
@@ -0,0 +1,216 @@
+"""Components that share their properties with the component they are created from.
+
+Copying a component for each occurrence copies all of its properties.
+A view only stores the properties that differ, like ``DTSTART``,
+and reads all other properties from the source component.
+It is copied as soon as it is modified.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator
+
+from icalendar.parser_tools import to_unicode
+
+if TYPE_CHECKING:
+    from icalendar.cal import Component
+
+
+class ComponentView:
+    """A component that reads the properties of a source component.
+
+    This is mixed into the class of the source component,
+    see :func:`create_view`.
+    Reading works as with the source component.
+    Modifying the view copies the properties of the source into the view first.
+    The source component is never modified.
+    """
+
+    # The class of the source component
+    component_class: type[Component]
+
+    _source: Component | None = None
+    _hidden: frozenset[str] = frozenset()
+
+    @classmethod
+    def create(
+        cls,
+        source: Component,
+        overlay: dict[str, Any],
+        hidden: frozenset[str] = frozenset(),
+    ) -> ComponentView:
+        """Create a view of the source.
+
+        - overlay are the properties that replace those of the source
+        - hidden are the names of the properties of the source that are removed
+        """
+        view = cls()
+        for name, value in overlay.items():
+            super(ComponentView, view).__setitem__(name, value)
+        view._source = source
+        view._hidden = hidden
+        view.subcomponents = list(source.subcomponents)
+        return view
+
+    def is_view(self) -> bool:
+        """Whether this still reads the properties from the source component."""
+        return self._source is not None
+
+    def _view_items(self) -> list[tuple[str, Any]]:
+        """The properties of the view in the order of the source."""
+        overlay = dict(super().items())
+        items = []
+        for name, value in self._source.items():
+            if name in overlay:
+                items.append((name, overlay.pop(name)))
+            elif name not in self._hidden:
+                items.append((name, value))
+        items.extend(overlay.items())
+        return items
+
+    def _copy_on_write(self) -> None:
+        """Copy the properties of the source so that we can modify them."""
+        if self._source is None:
+            return
+        items = self._view_items()
+        self._source = None
+        super().clear()
+        for name, value in items:
+            super().__setitem__(name, value)
+
+    # reading
+
+    def _read_from_source(self, name: str) -> bool:
+        """Whether the property is not in this view but in the source."""
+        return (
+            self._source is not None
+            and not super().__contains__(name)
+            and name not in self._hidden
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        """self[key]"""
+        name = to_unicode(key).upper()
+        if self._read_from_source(name):
+            return self._source[name]
+        return super().__getitem__(name)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the property or the default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        """key in self"""
+        name = to_unicode(key).upper()
+        if self._read_from_source(name):
+            return name in self._source
+        return super().__contains__(name)
+
+    def keys(self) -> list[str]:
+        """The names of the properties."""
+        if self._source is None:
+            return super().keys()
+        return [name for name, _ in self._view_items()]
+
+    def values(self) -> list[Any]:
+        """The values of the properties."""
+        if self._source is None:
+            return super().values()
+        return [value for _, value in self._view_items()]
+
+    def items(self) -> list[tuple[str, Any]]:
+        """The names and values of the properties."""
+        if self._source is None:
+            return super().items()
+        return self._view_items()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the properties."""
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        """The number of properties."""
+        return len(self.keys())
+
+    def copy(self) -> Component:
+        """Return a shallow copy as a component of the source's class."""
+        return self.component_class(self.items())
+
+    def __reduce__(self):
+        """Pickle and deepcopy the view as a component of the source's class."""
+        component = self.copy()
+        component.subcomponents = self.subcomponents
+        component.errors = self.errors
+        return component.__reduce__()
+
+    # writing
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """self[key] = value"""
+        self._copy_on_write()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """del self[key]"""
+        self._copy_on_write()
+        super().__delitem__(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove a property and return its value."""
+        self._copy_on_write()
+        return super().pop(key, *default)
+
+    def popitem(self, *args: Any, **kw: Any) -> tuple[str, Any]:
+        """Remove a property and return its name and value."""
+        self._copy_on_write()
+        return super().popitem(*args, **kw)
+
+    def setdefault(self, key: str, value: Any = None) -> Any:
+        """Set the property if it is absent and return its value."""
+        self._copy_on_write()
+        return super().setdefault(key, value)
+
+    def update(self, *args: Any, **kw: Any) -> None:
+        """Set many properties."""
+        self._copy_on_write()
+        super().update(*args, **kw)
+
+    def clear(self) -> None:
+        """Remove all properties."""
+        self._copy_on_write()
+        super().clear()
+
+    def move_to_end(self, key: str, last: bool = True) -> None:  # noqa: FBT001
+        """Move a property to an end."""
+        self._copy_on_write()
+        super().move_to_end(key, last)
+
+
+@lru_cache(maxsize=None)
+def view_class(component_class: type[Component]) -> type[ComponentView]:
+    """Return the view class for a component class, e.g. Event."""
+    return type(
+        f"{component_class.__name__}View",
+        (ComponentView, component_class),
+        {"component_class": component_class},
+    )
+
+
+def create_view(
+    source: Component,
+    overlay: dict[str, Any],
+    hidden: frozenset[str] = frozenset(),
+) -> Component:
+    """Create a view of the source component with some properties changed.
+
+    The view is an instance of the source's class.
+    See :meth:`ComponentView.create`.
+    """
+    return view_class(type(source)).create(source, overlay, hidden)
+
+
+__all__ = ["ComponentView", "create_view", "view_class"]